@@ -4,6 +4,7 @@ Contains all credentials and settings for the test framework
 """
 
 import os
+from types import MappingProxyType
 
 # Superset instance details
 SUPERSET_CONFIG = {
@@ -13,47 +14,75 @@ SUPERSET_CONFIG = {
     'output_file': "church_finance_R1.xlsx"
 }
 
+# Dashboard page path, appended to the base URL once per tester instance
+DASHBOARD_PATH_TEMPLATE = "/superset/dashboard/{id}/"
+
 # Dashboard configurations for different scenarios
-DASHBOARD_CONFIG = {
-    'scenario_1': {
+# Read-only so scenario worker threads can share it safely; copy it to override values
+DASHBOARD_CONFIG = MappingProxyType({
+    'scenario_1': MappingProxyType({
         'enabled': False,
         'dashboard_id': '8',  # Single dashboard ID for scenario 1
-        'iterations': 1  # Number of times to measure this dashboard
-    },
-    'scenario_2': {
+        'iterations': 1,  # Number of times to measure this dashboard
+        'warmup': 0  # Unmeasured loads before measuring, to fill the browser and query caches
+    }),
+    'scenario_2': MappingProxyType({
         'enabled': True,
-        'dashboard_ids': ['church_finance'],  # List of dashboards for sequential testing
-        'iterations_per_dashboard': 6  # Number of times to measure each dashboard
-    },
-    'scenario_3': {
+        'dashboard_ids': ('church_finance',),  # Dashboards for sequential testing
+        'iterations_per_dashboard': 6,  # Number of times to measure each dashboard
+        'parallel': False,  # Run the iterations of each dashboard at the same time
+        'max_workers': 6,  # Maximum number of browsers when parallel is enabled
+        'warmup': 1  # Unmeasured loads per dashboard to warm Superset's query cache
+    }),
+    'scenario_3': MappingProxyType({
         'enabled': True,
-        'dashboard_ids': ['church_finance'],  # List of dashboards for parallel testing
+        'dashboard_ids': ('church_finance',),  # Dashboards for parallel testing
         'iterations_per_dashboard': 6,  # Number of times to measure each dashboard
-        'max_workers': 6  # Maximum number of parallel browser tabs
-    },
-    'scenario_4': {
+        'max_workers': 6,  # Maximum number of parallel browser tabs
+        'warmup': 1,  # Unmeasured loads per dashboard to warm Superset's query cache
+        'separate_browsers': False  # Give each parallel instance its own browser instead of a tab
+    }),
+    'scenario_4': MappingProxyType({
         'enabled': True,
-        'dashboard_ids': ['church_finance'],  # List of dashboards for refresh testing
+        'dashboard_ids': ('church_finance',),  # Dashboards for refresh testing
         'refresh_count': 6,  # Number of times to refresh each dashboard
         'wait_between_refresh': 1  # Wait time between refreshes in seconds
-    },
-    'scenario_5': {
+    }),
+    'scenario_5': MappingProxyType({
         'enabled': False,
         'dashboard_id': '9',  # Single dashboard for chart-by-chart refresh
         'chart_refresh_iterations': 1,  # Number of times to refresh each chart
         'wait_between_refresh': 2  # Wait time between refreshes in seconds
-    }
-}
+    })
+})
+
+# Cap on dashboard tabs open at once when scenarios run concurrently (--concurrent)
+MAX_CONCURRENT_TABS = 12
+
+# How often WebDriverWait re-checks its condition; Selenium's 0.5s default would
+# add up to half a second to every measured load
+WAIT_POLL_SECONDS = 0.05
 
 # Directories for logs and results
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
+
+
+def get_log_dir():
+    """Return LOG_DIR, creating it the first time it is actually needed"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    return LOG_DIR
 
 # Browser configuration
 BROWSER_CONFIG = {
-    'headless': False,  # Set to True for headless execution
-    'window_size': (1920, 1080)
+    'headless': True,  # Set to False to watch the browser during a run
+    'window_size': (1920, 1080),
+    'disable_images': True,  # Skip image downloads; load timing is based on chart DOM nodes
+    'pin_dns': True,  # Resolve the Superset host once and pin it in every browser
+    # URL patterns the browser never requests (fonts and third-party analytics)
+    'blocked_urls': ('*google-analytics.com*', '*googletagmanager.com*', '*hotjar*', '*segment.io*',
+                     '*.woff2', '*.woff', '*/fonts/*')
 }
 
 
-# ['diocese_finance', '15','17','18', '19','23','church_finance','14','16','20']
\ No newline at end of file
+# Every dashboard available for a full sweep (see --all-dashboards)
+ALL_DASHBOARDS: tuple[str, ...] = ('diocese_finance', '15', '17', '18', '19', '23', 'church_finance', '14', '16', '20')
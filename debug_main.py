@@ -3,16 +3,31 @@
 Debugging version of the main script
 """
 
-print("Starting main script debugging...")
-
+import logging
+import logging.handlers
+import os
 import sys
 import time
-from config import SUPERSET_CONFIG, DASHBOARD_CONFIG, LOG_DIR
+from config import SUPERSET_CONFIG, DASHBOARD_CONFIG, LOG_DIR, get_log_dir
 from superset_performance_tester import SupersetPerformanceTester
 from scenarios import Scenarios
 
+logger = logging.getLogger("perf")
+
+def setup_logging():
+    """Buffer debug messages in memory and write them out at exit or on error"""
+    file_handler = logging.FileHandler(os.path.join(get_log_dir(), "debug_main.log"))
+    file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    logger.addHandler(buffered_handler)
+    logger.setLevel(logging.INFO)
+
 def main():
-    print("Entered main function")
+    logger.info("Entered main function")
     
     # Create the tester instance
     tester = SupersetPerformanceTester(
@@ -23,23 +38,23 @@ def main():
         log_dir=LOG_DIR
     )
     
-    print("Created tester instance")
+    logger.info("Created tester instance")
     
     # Create scenarios instance
     scenarios = Scenarios(tester)
     
-    print("Created scenarios instance")
+    logger.info("Created scenarios instance")
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     tester.log(f"Starting performance test with all scenarios")
     
-    print("About to run scenarios")
+    logger.info("About to run scenarios")
     
     results = {}
     
     try:
         # Run only scenario 1 for debugging
-        print("Running scenario 1")
+        logger.info("Running scenario 1")
         results['Scenario 1'] = scenarios.scenario_1_single_dashboard(
             DASHBOARD_CONFIG['scenario_1']['dashboard_id'],
             1  # Just 1 iteration for debugging
@@ -47,35 +62,34 @@ def main():
         
         # Save results to Excel
         tester.save_results_to_excel(results)
-        print("Saved results to Excel")
+        logger.info("Saved results to Excel")
         
     except KeyboardInterrupt:
-        print("Test interrupted by user")
+        logger.info("Test interrupted by user")
         tester.log("Test interrupted by user")
     except Exception as e:
-        print(f"Error running test: {str(e)}")
+        logger.exception("Error running test")
         tester.log(f"Error running test: {str(e)}")
-        import traceback
-        traceback.print_exc()
         return 1
     finally:
         # Close the persistent driver
         if tester.persistent_driver:
             tester.persistent_driver.quit()
             tester.log("Closed persistent browser")
-            print("Closed browser")
+            logger.info("Closed browser")
     
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    tester.log(f"Performance test completed in {elapsed_time:.2f} seconds")
-    print(f"Performance test completed in {elapsed_time:.2f} seconds")
+    elapsed_s = (time.perf_counter_ns() - start_ns) / 1e9
+    tester.log(f"Performance test completed in {elapsed_s:.2f} seconds")
+    logger.info(f"Performance test completed in {elapsed_s:.2f} seconds")
     
     return 0
 
 if __name__ == "__main__":
-    print("Script is being run directly")
+    setup_logging()
+    logger.info("Script is being run directly")
     exit_code = main()
-    print(f"Script completed with exit code {exit_code}")
+    logger.info(f"Script completed with exit code {exit_code}")
+    logging.shutdown()
     sys.exit(exit_code)
 else:
-    print("Script was imported, not run directly")
\ No newline at end of file
+    logger.debug("Script was imported, not run directly")
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+Minimal streaming .xlsx writer for values-only tables
+Writes the worksheet XML directly into the zip container, so rows are never
+held in memory and no spreadsheet library is needed
+"""
+
+import math
+import numbers
+import re
+import zipfile
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+_SHEET_HEADER_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_FOOTER_XML = '</sheetData></worksheet>'
+
+# Control characters are not allowed in XML 1.0 text
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Rows are buffered into chunks of this many before being compressed
+_ROWS_PER_WRITE = 1000
+
+
+def _escape(text):
+    """Escape text for an XML element or attribute value"""
+    text = _ILLEGAL_XML_CHARS.sub('', text)
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+def _column_letters(index):
+    """Return the column name (A, B, ..., AA, ...) for a zero-based column index"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _cell_xml(reference, value):
+    """Return the <c> element for one cell value, or '' for an empty cell"""
+    if value is None:
+        return ''
+    # numbers.* also covers numpy scalars; convert them so their repr is a plain number
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+        return f'<c r="{reference}"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        value = float(value)
+        if not math.isfinite(value):
+            return ''
+        return f'<c r="{reference}"><v>{value!r}</v></c>'
+    return f'<c r="{reference}" t="inlineStr"><is><t xml:space="preserve">{_escape(str(value))}</t></is></c>'
+
+
+def _row_xml(row_number, row):
+    """Return the <row> element for one sequence of cell values"""
+    cells = ''.join(_cell_xml(f'{_column_letters(column)}{row_number}', value)
+                    for column, value in enumerate(row))
+    return f'<row r="{row_number}">{cells}</row>'
+
+
+def write_xlsx(path, headers, rows, sheet_name="Sheet1"):
+    """
+    Write a single-sheet workbook of plain values
+
+    Numbers are stored as numbers, None and NaN as empty cells and everything
+    else as text.
+
+    Args:
+        path: Path of the .xlsx file to create
+        headers: Column titles for the first row
+        rows: Iterable of row sequences; consumed once
+        sheet_name: Name of the worksheet (at most 31 characters)
+    """
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', _CONTENT_TYPES_XML)
+        archive.writestr('_rels/.rels', _ROOT_RELS_XML)
+        archive.writestr('xl/workbook.xml', _WORKBOOK_XML.format(sheet_name=_escape(sheet_name[:31])))
+        archive.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS_XML)
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(_SHEET_HEADER_XML.encode('utf-8'))
+            chunk = [_row_xml(1, headers)]
+            for row_number, row in enumerate(rows, start=2):
+                chunk.append(_row_xml(row_number, row))
+                if len(chunk) >= _ROWS_PER_WRITE:
+                    sheet.write(''.join(chunk).encode('utf-8'))
+                    chunk = []
+            chunk.append(_SHEET_FOOTER_XML)
+            sheet.write(''.join(chunk).encode('utf-8'))
@@ -4,42 +4,1210 @@ Superset Dashboard Tester - PyQt5 UI
 """
 import sys
 import os
-import pandas as pd
+import shutil
+import re
+import json
+import base64
+import hashlib
+import tempfile
+import weakref
+from urllib.parse import urlparse
+from collections import Counter
+from operator import itemgetter
+from typing import NamedTuple
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, 
                            QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-                           QCheckBox, QPushButton, QTableWidget, QFileDialog,
+                           QCheckBox, QPushButton, QTableView, QFileDialog,
                            QMessageBox, QGroupBox, QFormLayout, QProgressBar, 
-                           QTableWidgetItem, QHeaderView, QSpinBox, QScrollArea,
-                           QGridLayout, QSizePolicy)  # Added QSizePolicy here
-from PyQt5.QtGui import QPixmap, QFont
-from PyQt5.QtCore import Qt
+                           QHeaderView, QSpinBox, QScrollArea,
+                           QGridLayout, QSizePolicy, QListView, QStyle, QStyleOption)  # Added QSizePolicy here
+from PyQt5.QtGui import (QPixmap, QPixmapCache, QFont, QFontMetrics, QColor, QBrush,
+                         QPainter, QStaticText)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, QMutex, QSize, QTimer, pyqtSignal,
+                          QAbstractListModel, QAbstractTableModel, QModelIndex)
 
 import requests
 import time
-from selenium.webdriver.common.by import By
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes large dashboard catalogs several times faster; it is optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Import connector to existing code
 from ui_connector import UIConnector
+from fast_xlsx import write_xlsx
+
+# Main window stylesheet, built once at import
+_MAIN_QSS = """
+    /* Make all text black by default */
+    * { color: black; }
+    
+    QMainWindow, QWidget { background-color: #f5f5f5; }
+    
+    /* Override specific elements that need different colors */
+    QPushButton { 
+        background-color: #3498db; 
+        color: white; 
+        border: none; 
+        padding: 8px 16px; 
+        border-radius: 4px; 
+    }
+    QPushButton:hover { background-color: #2980b9; }
+    QPushButton:disabled { background-color: #bdc3c7; }
+    
+    QLineEdit { 
+        padding: 8px; 
+        border: 1px solid #bbb; 
+        border-radius: 4px; 
+        background-color: white; 
+        color: black;
+    }
+    
+    QSpinBox { 
+        padding: 8px; 
+        border: 1px solid #bbb; 
+        border-radius: 4px; 
+        background-color: white; 
+        color: black;
+        padding-right: 25px; /* Make room for buttons on right */
+    }
+
+    QSpinBox::up-button {
+        background-color: #3498db;
+        border: none;
+        subcontrol-origin: margin;
+        subcontrol-position: right top;
+        width: 25px;
+        height: 50%;
+        border-top-right-radius: 4px;
+    }
+
+    QSpinBox::down-button {
+        background-color: #3498db;
+        border: none;
+        subcontrol-origin: margin;
+        subcontrol-position: right bottom;
+        width: 25px;
+        height: 50%;
+        border-bottom-right-radius: 4px;
+    }
+
+    QSpinBox::up-arrow, QSpinBox::down-arrow {
+        width: 8px;
+        height: 8px;
+        color: white;
+    }
+
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: #2980b9;
+    }
+
+    QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {
+        background-color: #1f6aa8;
+    }
+    
+    /* Slider styling */
+    QSlider::groove:horizontal {
+        border: 1px solid #bbb;
+        background: #f0f0f0;
+        height: 10px;
+        border-radius: 4px;
+    }
+    
+    QSlider::handle:horizontal {
+        background: #3498db;
+        border: 1px solid #3498db;
+        width: 18px;
+        height: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+    
+    QSlider::handle:horizontal:hover {
+        background: #2980b9;
+    }
+    
+    QGroupBox { 
+        font-weight: bold; 
+        border: 1px solid #ddd; 
+        border-radius: 4px; 
+        margin-top: 12px; 
+        padding-top: 20px; 
+        color: black;
+    }
+    
+    QTableView { 
+        border: 1px solid #ddd; 
+        border-radius: 4px; 
+        alternate-background-color: #f9f9f9; 
+        color: black;
+    }
+    
+    QHeaderView::section { 
+        background-color: #2c3e50; 
+        color: white; 
+        padding: 6px; 
+    }
+    
+    QTabBar::tab { 
+        background-color: #e0e0e0; 
+        color: black; 
+        padding: 8px 16px;
+    }
+    
+    QTabBar::tab:selected { 
+        background-color: #3498db; 
+        color: white; 
+    }
+    
+    QCheckBox, QLabel, QRadioButton { 
+        color: black; 
+    }
+    
+    QStatusBar { 
+        color: black; 
+    }
+    
+    /* For scroll areas */
+    QScrollArea {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+    
+    /* For scroll bars */
+    QScrollBar:vertical {
+        border: none;
+        background: #f0f0f0;
+        width: 10px;
+        margin: 0px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background: #3498db;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    
+    QScrollBar:horizontal {
+        border: none;
+        background: #f0f0f0;
+        height: 10px;
+        margin: 0px;
+    }
+    
+    QScrollBar::handle:horizontal {
+        background: #3498db;
+        min-width: 20px;
+        border-radius: 5px;
+    }
+    
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+    
+    /* For Progress Bar */
+    QProgressBar {
+        border: 1px solid #bbb;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #f0f0f0;
+        color: black;
+    }
+    
+    QProgressBar::chunk {
+        background-color: #3498db;
+        width: 10px;
+        margin: 0.5px;
+    }
+"""
+
+# Performance Report and Health tab widgets, matched by object name so the
+# whole window is styled from one sheet instead of one parse per widget
+_REPORT_TAB_QSS = """
+    QLabel#reportTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 15px;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                    stop:0 #ecf0f1, stop:0.5 #ffffff, stop:1 #ecf0f1);
+        border: 2px solid #3498db;
+        border-radius: 10px;
+        margin: 5px;
+    }
+    
+    QGroupBox#reportSection {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        border: 3px solid #3498db;
+        border-radius: 12px;
+        margin-top: 15px;
+        padding-top: 25px;
+        background-color: #f8f9fa;
+    }
+    QGroupBox#reportSection::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 10px 0 10px;
+        background-color: #f8f9fa;
+    }
+    
+    QGroupBox#scenarioGroup {
+        font-size: 14px;
+        font-weight: bold;
+        color: #34495e;
+        border: 2px solid #bdc3c7;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 15px;
+        background-color: #ffffff;
+    }
+    QGroupBox#scenarioGroup::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px 0 8px;
+        background-color: #ffffff;
+    }
+    
+    QCheckBox#scenarioCheck {
+        font-size: 12px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 2px;
+    }
+    QCheckBox#scenarioCheck::indicator {
+        width: 20px;
+        height: 20px;
+        border-radius: 4px;
+        border: 2px solid #bdc3c7;
+        background-color: white;
+    }
+    QCheckBox#scenarioCheck::indicator:hover {
+        border: 2px solid #3498db;
+        background-color: #ecf0f1;
+    }
+    QCheckBox#scenarioCheck::indicator:checked {
+        border: 2px solid #3498db;
+        background-color: #3498db;
+    }
+    
+    QLabel#scenarioDesc {
+        color: #7f8c8d;
+        font-style: italic;
+        font-size: 11px;
+        padding: 2px;
+    }
+    
+    QLabel#iterLabel {
+        color: #34495e;
+        font-size: 11px;
+        font-weight: bold;
+        padding: 2px;
+    }
+    
+    QSpinBox#iterSpin {
+        font-size: 12px;
+        font-weight: bold;
+        padding: 6px;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        background-color: white;
+        color: #2c3e50;
+    }
+    QSpinBox#iterSpin:focus {
+        border: 2px solid #3498db;
+    }
+    QSpinBox#iterSpin::up-button, QSpinBox#iterSpin::down-button {
+        background-color: #3498db;
+        border: none;
+        width: 20px;
+    }
+    QSpinBox#iterSpin::up-button:hover, QSpinBox#iterSpin::down-button:hover {
+        background-color: #2980b9;
+    }
+    QSpinBox#iterSpin::up-arrow, QSpinBox#iterSpin::down-arrow {
+        width: 10px;
+        height: 10px;
+        color: white;
+    }
+    
+    QPushButton#startPerfBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #27ae60, stop:1 #229954);
+        color: white;
+        border: 3px solid #1e8449;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QPushButton#startPerfBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #229954, stop:1 #1e8449);
+        border-color: #17a2b8;
+    }
+    QPushButton#startPerfBtn:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #1e8449, stop:1 #148f39);
+    }
+    QPushButton#startPerfBtn:disabled {
+        background-color: #bdc3c7;
+        border-color: #95a5a6;
+        color: #7f8c8d;
+    }
+    
+    QLabel#perfProgressLabel {
+        color: #34495e; 
+        font-weight: bold; 
+        font-size: 12px;
+        padding: 5px;
+        background-color: #ecf0f1;
+        border-radius: 4px;
+    }
+    
+    QProgressBar#perfProgressBar {
+        border: 2px solid #bdc3c7;
+        border-radius: 6px;
+        text-align: center;
+        background-color: #ecf0f1;
+        color: #2c3e50;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QProgressBar#perfProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                    stop:0 #3498db, stop:1 #2980b9);
+        border-radius: 4px;
+        margin: 1px;
+    }
+    
+    QLabel#excelStatusLabel {
+        color: #27ae60; 
+        font-weight: bold; 
+        font-size: 11px;
+        padding: 5px;
+        background-color: #d5f4e6;
+        border-radius: 4px;
+    }
+    
+    QTableView#resultsTable {
+        border: 2px solid #bdc3c7;
+        border-radius: 8px;
+        background-color: white;
+        gridline-color: #ecf0f1;
+        font-size: 11px;
+        selection-background-color: #3498db;
+        selection-color: white;
+        alternate-background-color: #f8f9fa;
+    }
+    QTableView#resultsTable QHeaderView::section {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #34495e, stop:1 #2c3e50);
+        color: white;
+        padding: 10px;
+        font-weight: bold;
+        border: none;
+        font-size: 12px;
+    }
+    QTableView#resultsTable::item {
+        padding: 8px;
+        border-bottom: 1px solid #ecf0f1;
+    }
+    
+    QPushButton#downloadResultsBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #3498db, stop:1 #2980b9);
+        color: white;
+        border: 2px solid #1f6aa8;
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QPushButton#downloadResultsBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #2980b9, stop:1 #1f6aa8);
+        border-color: #17a2b8;
+    }
+    QPushButton#downloadResultsBtn:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #1f6aa8, stop:1 #1a5490);
+    }
+    QPushButton#downloadResultsBtn:disabled {
+        background-color: #bdc3c7;
+        border-color: #95a5a6;
+        color: #7f8c8d;
+    }
+    
+    QLabel#healthIntro {
+        color: #2c3e50;
+        font-style: italic;
+    }
+"""
+
+# Dashboard selection buttons share one template, formatted once per colour scheme
+_BUTTON_QSS_TEMPLATE = """
+    QPushButton {{
+        background-color: {bg_color};
+        color: white;
+        border: 2px solid {border_color};
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 8px 12px;
+        min-width: 80px;
+        min-height: 35px;
+    }}
+    QPushButton:hover {{
+        background-color: {hover_color};
+        border-color: {hover_border};
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed_color};
+    }}
+"""
+_SELECT_ALL_QSS = _BUTTON_QSS_TEMPLATE.format(
+    bg_color="#27ae60", border_color="#229954",
+    hover_color="#229954", hover_border="#1e8449",
+    pressed_color="#1e8449"
+)
+_DESELECT_QSS = _BUTTON_QSS_TEMPLATE.format(
+    bg_color="#e74c3c", border_color="#c0392b",
+    hover_color="#c0392b", hover_border="#a93226",
+    pressed_color="#a93226"
+)
+_FIRST3_QSS = _BUTTON_QSS_TEMPLATE.format(
+    bg_color="#f39c12", border_color="#e67e22",
+    hover_color="#e67e22", hover_border="#d68910",
+    pressed_color="#d68910"
+)
+_REFRESH_QSS = _BUTTON_QSS_TEMPLATE.format(
+    bg_color="#3498db", border_color="#2980b9",
+    hover_color="#2980b9", hover_border="#1f6aa8",
+    pressed_color="#1f6aa8"
+)
+
+def _copy_file(src, dst):
+    """
+    Copy a finished file, letting the kernel move the bytes where it can
+    
+    os.copy_file_range keeps the data out of user space (and clones it on
+    reflink filesystems); shutil.copyfile is the fallback and itself uses
+    sendfile/fcopyfile where available. Timestamps are copied like shutil.copy2.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as source, open(dst, "wb") as target:
+                remaining = os.fstat(source.fileno()).st_size
+                while remaining > 0:
+                    sent = copy_file_range(source.fileno(), target.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                copied = remaining == 0
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+# UI label only: scenarios 2/3/4 are presented as Scenario 1/2/3
+SCENARIO_DISPLAY_NAMES = {
+    "Scenario 2": "Scenario 1",
+    "Scenario 3": "Scenario 2",
+    "Scenario 4": "Scenario 3",
+}
+
+# Text colour of each health status in the Health of Dashboards table
+HEALTH_STATUS_COLORS = {
+    "Healthy": Qt.darkGreen,
+    "Warning": Qt.darkYellow,
+    "Critical": Qt.red,
+}
+
+
+class Dashboard(NamedTuple):
+    """A dashboard offered for selection in the UI"""
+    id: str
+    name: str
+
+
+class PerfRow(NamedTuple):
+    """One dashboard/scenario row of the Performance Results table"""
+    dashboard_id: str
+    scenario: str
+    iterations: int
+    avg_time: float
+    min_time: float
+    max_time: float
+
+
+# Shown when the dashboard list can't be fetched
+FALLBACK_DASHBOARDS = [Dashboard("10", "Example Dashboard")]
+
+_ID_AND_TITLE = itemgetter("id", "dashboard_title")
+
+
+def _format_dashboards(rows):
+    """
+    Convert dashboard objects from /api/v1/dashboard/ into Dashboard tuples
+    
+    Args:
+        rows: The "result" list of the API response
+        
+    Returns:
+        list: Dashboards with a string ID and their title
+    """
+    try:
+        return [Dashboard(str(dashboard_id), title) for dashboard_id, title in map(_ID_AND_TITLE, rows)]
+    except KeyError:
+        # Only pay for per-row checks when some rows are malformed
+        return [Dashboard(str(row["id"]), row["dashboard_title"])
+                for row in rows if "id" in row and "dashboard_title" in row]
+
+
+def _jwt_expiry(token):
+    """Return the exp claim of a JWT as a Unix timestamp, or 0 if it can't be read"""
+    try:
+        payload = token.split(".")[1]
+        return float(json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0
+
+
+def _cached_pixmap(path, width, height):
+    """
+    Return an image scaled to fit width x height, resampling it only once per source version
+    
+    Scaled copies are kept in resources/.cache/ on disk and in QPixmapCache for the
+    rest of the process.
+    
+    Args:
+        path: Source image path
+        width: Target width in pixels
+        height: Target height in pixels
+        
+    Returns:
+        QPixmap: Scaled image, or a null pixmap if the source can't be loaded
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return QPixmap()
+    key = hashlib.sha1(f"{path}|{mtime}|{width}|{height}".encode()).hexdigest()
+    
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    cache_dir = os.path.join(os.path.dirname(path), ".cache")
+    cache_path = os.path.join(cache_dir, f"{key}.png")
+    if not os.path.exists(cache_path):
+        source = QPixmap(path)
+        if source.isNull():
+            return source
+        scaled = source.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            saved = scaled.save(cache_path, "PNG")
+        except OSError:
+            saved = False
+        if not saved:
+            # Read-only install: keep the scaled copy in memory only
+            QPixmapCache.insert(key, scaled)
+            return scaled
+    
+    pixmap = QPixmap(cache_path)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# Fetch the whole catalog in one request (Superset pages dashboards 20 at a time by default)
+DASHBOARD_LIST_PARAMS = {"q": "(page_size:100)"}
+
+# Last dashboard list per (url, username), revalidated with ETag / Cache-Control
+DASHBOARD_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".superset_tester", "dash_cache.json")
+
+
+def _load_dashboard_cache():
+    """Return the on-disk dashboard list cache, or an empty dict if it is missing or unreadable"""
+    try:
+        with open(DASHBOARD_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_dashboard_cache(cache):
+    """Atomically replace the on-disk dashboard list cache"""
+    cache_dir = os.path.dirname(DASHBOARD_CACHE_FILE)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, DASHBOARD_CACHE_FILE)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+class DashboardModel(QAbstractListModel):
+    """Checkable dashboard list; a QListView only paints the rows currently visible"""
+    
+    def __init__(self, dashboards, parent=None):
+        """
+        Args:
+            dashboards: List of Dashboard tuples
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self.dashboards = list(dashboards)
+        self.checked = [False] * len(self.dashboards)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.dashboards)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            dashboard = self.dashboards[index.row()]
+            return f"{dashboard.id} - {dashboard.name}"
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.checked[index.row()] else Qt.Unchecked
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        self.checked[index.row()] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+    
+    def flags(self, index):
+        return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+    
+    def set_checked(self, predicate):
+        """Check the rows for which predicate(row) is true, with a single repaint"""
+        self.checked = [bool(predicate(row)) for row in range(len(self.dashboards))]
+        if self.dashboards:
+            self.dataChanged.emit(self.index(0), self.index(len(self.dashboards) - 1), [Qt.CheckStateRole])
+    
+    def set_dashboards(self, dashboards):
+        """Replace the list of dashboards, clearing the selection"""
+        self.beginResetModel()
+        self.dashboards = list(dashboards)
+        self.checked = [False] * len(self.dashboards)
+        self.endResetModel()
+    
+    def checked_ids(self):
+        """Return the IDs of the checked dashboards in list order"""
+        return [dashboard.id for dashboard, checked in zip(self.dashboards, self.checked) if checked]
+
+
+class ResultsModel(QAbstractTableModel):
+    """Read-only results table; cells are plain strings instead of one QTableWidgetItem each"""
+    
+    # Text brushes by colour, shared by every row and model so painting allocates none
+    _brushes = {}
+    
+    def __init__(self, headers, parent=None, color_column=None):
+        """
+        Args:
+            headers: Column titles
+            parent: Optional QObject parent
+            color_column: Only this column takes the row colour; None colours the whole row
+        """
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.color_column = color_column
+        self.rows = []
+        self.foregrounds = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole and self.color_column in (None, index.column()):
+            return self.foregrounds[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_rows(self, rows, colors):
+        """
+        Replace the table contents in one reset; nothing happens if they are unchanged
+        
+        Args:
+            rows: Sequences of display strings, one per column
+            colors: Text colour of each row, or None for the default colour
+        """
+        rows = [tuple(row) for row in rows]
+        foregrounds = [self._brush(color) for color in colors]
+        if rows == self.rows and foregrounds == self.foregrounds:
+            return
+        self.beginResetModel()
+        self.rows = rows
+        self.foregrounds = foregrounds
+        self.endResetModel()
+    
+    @classmethod
+    def _brush(cls, color):
+        """Return the shared QBrush for a colour, creating it on first use"""
+        if color is None:
+            return None
+        brush = cls._brushes.get(color)
+        if brush is None:
+            brush = cls._brushes[color] = QBrush(QColor(color))
+        return brush
+
+
+class StatusLabel(QLabel):
+    """Single-line label that is rewritten often; paints a cached QStaticText"""
+    
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self._static = QStaticText(text)
+        self._static.setPerformanceHint(QStaticText.AggressiveCaching)
+    
+    def setText(self, text):
+        if text == self.text():
+            return
+        super().setText(text)  # Keeps text() and sizeHint() right
+        self._static.setText(text)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        rect = self.contentsRect()
+        top = rect.top() + (rect.height() - self.fontMetrics().height()) // 2
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(rect.left(), top, self._static)
+
+
+class Toast(QLabel):
+    """Short non-modal notice that hides itself; used instead of QMessageBox.information"""
+    
+    def __init__(self, parent):
+        super().__init__(parent, Qt.ToolTip)
+        self.setStyleSheet("background-color: #2c3e50; color: white; padding: 10px; border-radius: 6px;")
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide)
+    
+    def show_message(self, message, timeout_ms=3000):
+        """Show message near the bottom centre of the parent window for timeout_ms"""
+        self.setText(message)
+        self.adjustSize()
+        window = self.parentWidget()
+        bottom_center = window.mapToGlobal(window.rect().center())
+        bottom_center.setY(window.mapToGlobal(window.rect().bottomLeft()).y() - self.height() - 40)
+        self.move(bottom_center.x() - self.width() // 2, bottom_center.y())
+        self.show()
+        self._hide_timer.start(timeout_ms)
+
+
+class _SaveTaskSignals(QObject):
+    """Signals for _SaveTask"""
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class _SaveTask(QRunnable):
+    """Write or copy a report file on a QThreadPool worker so the UI stays responsive"""
+    
+    def __init__(self, save, filename):
+        """
+        Args:
+            save: Callable taking the destination path and writing the file there
+            filename: Destination path
+        """
+        super().__init__()
+        self.save = save
+        self.filename = filename
+        self.signals = _SaveTaskSignals()
+    
+    def run(self):
+        """Run the save and report the outcome through signals"""
+        try:
+            self.save(self.filename)
+            self.signals.finished.emit(self.filename)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _DashboardFetcherSignals(QObject):
+    """Signals for _DashboardFetcher (a QRunnable cannot emit signals itself)"""
+    result = pyqtSignal(list)
+    status = pyqtSignal(str)
+
+
+class _DashboardFetcher(QRunnable):
+    """Fetch the dashboard list on a QThreadPool worker so the UI keeps painting"""
+    
+    # Bearer tokens from /api/v1/security/login, keyed by (url, username) -> (token, exp)
+    _token_cache = {}
+    
+    # Hash of the browser cookies last copied into each HTTP session, dropped with the session
+    _cookie_hashes = weakref.WeakKeyDictionary()
+    
+    def __init__(self, url, username, password, manual_login, driver, driver_lock, http):
+        """
+        Args:
+            url: Superset base URL
+            username: Superset username
+            password: Superset password
+            manual_login: Whether the browser session from a manual login should be tried first
+            driver: Logged-in WebDriver, or None
+            driver_lock: QMutex guarding the driver
+            http: Shared requests.Session for API calls
+        """
+        super().__init__()
+        self.url = url
+        self.username = username
+        self.password = password
+        self.manual_login = manual_login
+        self.driver = driver
+        self.driver_lock = driver_lock
+        self.http = http
+        self.signals = _DashboardFetcherSignals()
+    
+    def run(self):
+        """Fetch the dashboard list and emit it through signals.result"""
+        self.signals.result.emit(self.fetch())
+    
+    def fetch(self):
+        """Fetch dashboard IDs and names from Superset API"""
+        try:
+            url = self.url
+            username = self.username
+            password = self.password
+            manual_login = self.manual_login
+            
+            if not url:
+                # If URL isn't set yet, return default list
+                return [Dashboard("10", "Loading dashboards...")]
+            
+            # Skip the network entirely while the cached list is still fresh
+            cache = _load_dashboard_cache()
+            cache_key = hashlib.sha1(f"{url}|{username}".encode()).hexdigest()
+            cached = cache.get(cache_key)
+            if cached and cached.get("expires", 0) > time.time():
+                self.signals.status.emit(f"Loaded {len(cached['dashboards'])} dashboards from cache")
+                return [Dashboard(**dashboard) for dashboard in cached["dashboards"]]
+            conditional_headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+            
+            # If using manual login and we have a browser session, try to get dashboards directly
+            if manual_login and self.driver:
+                from selenium.webdriver.common.by import By
+                from selenium.webdriver.support.ui import WebDriverWait
+                from selenium.webdriver.support import expected_conditions as EC
+                from selenium.common.exceptions import TimeoutException
+                
+                # WebDriver is not thread-safe; only one fetcher may drive the browser at a time
+                self.driver_lock.lock()
+                try:
+                    self.signals.status.emit("Fetching dashboards using browser session...")
+                    driver = self.driver
+                    
+                    # Ask the API first using the browser's cookies: one short request
+                    # instead of rendering the dashboard list page
+                    # getAllCookies covers every domain, so keep only the ones Superset would receive
+                    host = urlparse(url).hostname or ""
+                    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+                    raw = tuple(
+                        (cookie['name'], cookie['value'], cookie.get('domain', ''), cookie.get('path', '/'))
+                        for cookie in cookies
+                        if host == cookie.get('domain', '').lstrip('.')
+                        or host.endswith('.' + cookie.get('domain', '').lstrip('.'))
+                    )
+                    
+                    # Reuse the pooled session; only touch its cookie jar when the login changed
+                    cookie_hash = hashlib.md5(repr(raw).encode()).hexdigest()
+                    if cookie_hash != _DashboardFetcher._cookie_hashes.get(self.http):
+                        for name, value, domain, path in raw:
+                            self.http.cookies.set(name, value, domain=domain, path=path)
+                        _DashboardFetcher._cookie_hashes[self.http] = cookie_hash
+                    
+                    # Try API call with the authenticated session
+                    api_url = f"{url}/api/v1/dashboard/"
+                    response = self.http.get(api_url, params=DASHBOARD_LIST_PARAMS, timeout=10)
+                    
+                    if response.status_code == 200:
+                        dashboard_data = _json_loads(response.content)
+                        formatted_dashboards = []
+                        
+                        if "result" in dashboard_data and isinstance(dashboard_data["result"], list):
+                            formatted_dashboards = _format_dashboards(dashboard_data["result"])
+                        
+                        if formatted_dashboards:
+                            self.signals.status.emit(f"Successfully loaded {len(formatted_dashboards)} dashboards using browser cookies")
+                            return formatted_dashboards
+                    
+                    # If the API didn't give us dashboards, scrape the list page instead
+                    driver.get(f"{url}/dashboard/list/")
+                    
+                    # Wait only until the dashboard rows are actually rendered
+                    try:
+                        dashboard_elements = WebDriverWait(driver, 10).until(
+                            EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".dashboard-list-view table tbody tr"))
+                        )
+                    except TimeoutException:
+                        dashboard_elements = []
+                    
+                    if dashboard_elements:
+                        dashboards = []
+                        for elem in dashboard_elements:
+                            try:
+                                # Try to extract ID and name from the element
+                                link = elem.find_element(By.CSS_SELECTOR, "a")
+                                href = link.get_attribute("href")
+                                
+                                # Extract ID from href
+                                dashboard_id = href.split("/")[-1].strip()
+                                if dashboard_id.isdigit():
+                                    dashboards.append(Dashboard(dashboard_id, link.text.strip()))
+                            except Exception as e:
+                                print(f"Error extracting dashboard: {e}")
+                        
+                        if dashboards:
+                            self.signals.status.emit(f"Found {len(dashboards)} dashboards using browser session")
+                            return dashboards
+                
+                except Exception as browser_err:
+                    print(f"Error fetching dashboards with browser: {browser_err}")
+                    # Fall back to API approach
+                finally:
+                    self.driver_lock.unlock()
+            
+            # Build API URL for standard API approach
+            api_url = f"{url}/api/v1/dashboard/"
+            auth_url = f"{url}/api/v1/security/login"
+            auth_payload = {
+                "password": password,
+                "provider": "db", 
+                "refresh": True,
+                "username": username
+            }
+            
+            headers = {"Content-Type": "application/json"}
+            
+            # Reuse a still-valid token from an earlier fetch and skip the auth round trips
+            response = None
+            token, token_expiry = self._token_cache.get((url, username), (None, 0))
+            if token and time.time() < token_expiry - 30:
+                response = self.http.get(api_url, params=DASHBOARD_LIST_PARAMS,
+                                         headers={"Authorization": f"Bearer {token}", **conditional_headers}, timeout=10)
+                if response.status_code == 401:
+                    # Token was revoked early; log in again below
+                    self._token_cache.pop((url, username), None)
+                    response = None
+            
+            # Try basic auth first, requesting a token at the same time in case it is rejected
+            if response is None:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    basic_auth_future = executor.submit(self.http.get, api_url, params=DASHBOARD_LIST_PARAMS,
+                                                        auth=(username, password), headers=conditional_headers, timeout=10)
+                    token_future = executor.submit(self.http.post, auth_url, json=auth_payload, headers=headers, timeout=10)
+                    response = basic_auth_future.result()
+                    auth_response = token_future.result() if response.status_code == 401 else None
+            
+            # If that doesn't work, use the token auth
+            if response.status_code == 401:
+                # If this also fails, fall back to default dashboard list
+                if auth_response.status_code != 200:
+                    self.signals.status.emit(f"Using default dashboard list (API auth failed)")
+                    return list(FALLBACK_DASHBOARDS)
+                    
+                # Extract access token
+                access_token = _json_loads(auth_response.content).get("access_token")
+                
+                if not access_token:
+                    self.signals.status.emit("Failed to get authentication token")
+                    return list(FALLBACK_DASHBOARDS)
+                self._token_cache[(url, username)] = (access_token, _jwt_expiry(access_token))
+                    
+                # Now fetch dashboards with the token
+                dashboard_headers = {
+                    "Authorization": f"Bearer {access_token}",
+                    "Content-Type": "application/json",
+                    **conditional_headers
+                }
+                
+                # Get all dashboards
+                response = self.http.get(api_url, params=DASHBOARD_LIST_PARAMS, headers=dashboard_headers, timeout=10)
+            
+            # Unchanged since the last fetch: reuse the cached list without a body transfer
+            if response.status_code == 304 and cached:
+                self.signals.status.emit(f"Dashboard list unchanged, using {len(cached['dashboards'])} cached dashboards")
+                return [Dashboard(**dashboard) for dashboard in cached["dashboards"]]
+            
+            # Process response
+            if response.status_code == 200:
+                # Parse the response
+                dashboard_data = _json_loads(response.content)
+                
+                # Extract the dashboard list from the response
+                formatted_dashboards = []
+                
+                # Check if the response has the 'result' key containing dashboard objects
+                if "result" in dashboard_data and isinstance(dashboard_data["result"], list):
+                    # Extract just the id and dashboard_title
+                    formatted_dashboards = _format_dashboards(dashboard_data["result"])
+                
+                # If we didn't find any dashboards in the expected format, check for other possibilities
+                if not formatted_dashboards and "ids" in dashboard_data:
+                    # If we have dashboard IDs but not full objects, use the ID as name since we have no titles
+                    formatted_dashboards = [Dashboard(str(dashboard_id), f"Dashboard {dashboard_id}")
+                                            for dashboard_id in dashboard_data["ids"]]
+                
+                if formatted_dashboards:
+                    max_age = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+                    cache[cache_key] = {
+                        "etag": response.headers.get("ETag"),
+                        "expires": time.time() + int(max_age.group(1)) if max_age else 0,
+                        "dashboards": [dashboard._asdict() for dashboard in formatted_dashboards]
+                    }
+                    _save_dashboard_cache(cache)
+                    
+                    self.signals.status.emit(f"Successfully loaded {len(formatted_dashboards)} dashboards")
+                    return formatted_dashboards
+                else:
+                    # No dashboards found in the expected format
+                    self.signals.status.emit("No dashboards found in API response")
+                    return list(FALLBACK_DASHBOARDS)
+            else:
+                # Fall back to default dashboards if API call fails
+                self.signals.status.emit(f"Using default dashboard list (API returned {response.status_code})")
+                return list(FALLBACK_DASHBOARDS)
+            
+        except Exception as e:
+            print(f"Error fetching dashboards: {e}")
+            # Provide a fallback set of dashboards to ensure the UI works
+            self.signals.status.emit(f"Using default dashboard list (Error: {str(e)})")
+            return list(FALLBACK_DASHBOARDS)
+
 
 class SupersetTester(QMainWindow):
+    # Dashboard selection list: frame, scrollbar and per-row check indicator
+    DASHBOARD_LIST_QSS = """
+        QListView {
+            border: 2px solid #ddd;
+            border-radius: 6px;
+            background-color: #fafafa;
+            font-size: 11px;
+            font-weight: bold;
+            color: #2c3e50;
+            padding: 8px;
+        }
+        QListView::item {
+            padding: 4px;
+        }
+        QListView::item:hover {
+            background-color: #f8f9fa;
+            border-radius: 4px;
+        }
+        QListView::indicator {
+            width: 20px;
+            height: 20px;
+            border-radius: 4px;
+            border: 2px solid #bdc3c7;
+            background-color: white;
+        }
+        QListView::indicator:hover {
+            border: 2px solid #3498db;
+            background-color: #ecf0f1;
+        }
+        QListView::indicator:checked {
+            border: 2px solid #27ae60;
+            background-color: #27ae60;
+        }
+        QScrollBar:vertical {
+            border: none;
+            background: #ecf0f1;
+            width: 12px;
+            border-radius: 6px;
+            margin: 2px;
+        }
+        QScrollBar::handle:vertical {
+            background: #3498db;
+            min-height: 25px;
+            border-radius: 5px;
+            margin: 1px;
+        }
+        QScrollBar::handle:vertical:hover {
+            background: #2980b9;
+        }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+            height: 0px;
+        }
+    """
+    
+    # Tabs built on first selection: index -> (attribute holding the content, builder method)
+    _LAZY_TABS = {
+        1: ("performance_report_tab", "create_performance_report_tab"),
+        2: ("dashboard_health_tab", "create_dashboard_health_tab")
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Superset Dashboard Tester")
         self.setMinimumSize(800, 600)
         
-        # Initialize dashboard_ids before any UI code that uses it
-        self.dashboard_ids = self.fetch_dashboard_data()
-        self.dashboard_checkboxes = []
+        # Pooled HTTP session reused for every Superset API call made by the UI
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                                max_retries=Retry(total=2, backoff_factor=0.2)))
+        
+        # Placeholder until the background fetch started at the end of __init__ returns
+        self.dashboard_ids = [Dashboard("10", "Loading dashboards...")]
+        self.driver_lock = QMutex()
 
         # Initialize the connector
         self.connector = UIConnector()
         
-        # Connect signals from connector
-        self.connector.progress_updated.connect(self.update_progress)
-        self.connector.test_completed.connect(self.route_test_completed)
+        # Progress and completion are connected per run to the tab that started it
+        self._run_slots = None
+        self._last_run_labels = []
+        self.performance_rows = []
         self.connector.test_error.connect(self.handle_test_error)
         
+        # Progress ticks are coalesced and painted at most every 50 ms
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Confirmations that need no answer are shown as a toast
+        self.toast = Toast(self)
+        
         # Set application style
         self.apply_stylesheet()
         
@@ -57,10 +1225,10 @@ class SupersetTester(QMainWindow):
         # Logo
         logo = QLabel()
         try:
-            pixmap = QPixmap("resources/Woodfrog Logo - wordmark.png")
+            pixmap = _cached_pixmap("resources/Woodfrog Logo - wordmark.png", 200, 80)
             if pixmap.isNull():
                 raise Exception("Logo couldn't be loaded")
-            logo.setPixmap(pixmap.scaled(200, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            logo.setPixmap(pixmap)
             #logo.setStyleSheet("background-color: white; padding: 5px; border-radius: 4px;")
         except Exception as e:
             print(f"Error loading logo: {str(e)}")
@@ -80,11 +1248,11 @@ class SupersetTester(QMainWindow):
         # Superset Logo (right side)
         superset_logo = QLabel()
         try:
-            superset_pixmap = QPixmap("resources/superset.png")
+            # Scale to match the location in the screenshot (larger size, right aligned)
+            superset_pixmap = _cached_pixmap("resources/superset.png", 200, 50)
             if superset_pixmap.isNull():
                 raise Exception("Superset logo couldn't be loaded")
-            # Scale to match the location in the screenshot (larger size, right aligned)
-            superset_logo.setPixmap(superset_pixmap.scaled(200, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            superset_logo.setPixmap(superset_pixmap)
             # Right-align the logo and add padding
             superset_logo.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
             superset_logo.setStyleSheet("padding: 5px; margin-right: 10px;")
@@ -108,212 +1276,60 @@ class SupersetTester(QMainWindow):
         # Create tabs
         self.tabs = QTabWidget()
         
-        # Create tab widgets
-        self.superset_details_tab = self.create_superset_details_tab()
-        self.performance_report_tab = self.create_performance_report_tab()
-        self.dashboard_health_tab = self.create_dashboard_health_tab()
-        
-        # Add tabs
-        self.tabs.addTab(self.superset_details_tab, "Superset Details")
-        self.tabs.addTab(self.performance_report_tab, "Performance Report")
-        self.tabs.addTab(self.dashboard_health_tab, "Health of Dashboards")
-        
-        main_layout.addWidget(self.tabs)
-        
-        # Status bar
-        self.status_label = QLabel("Ready")
-        main_layout.addWidget(self.status_label)
-        
-    def apply_stylesheet(self):
-        """Apply custom styling to the application"""
-        # Set global stylesheet
-        self.setStyleSheet("""
-            /* Make all text black by default */
-            * { color: black; }
-            
-            QMainWindow, QWidget { background-color: #f5f5f5; }
-            
-            /* Override specific elements that need different colors */
-            QPushButton { 
-                background-color: #3498db; 
-                color: white; 
-                border: none; 
-                padding: 8px 16px; 
-                border-radius: 4px; 
-            }
-            QPushButton:hover { background-color: #2980b9; }
-            QPushButton:disabled { background-color: #bdc3c7; }
-            
-            QLineEdit { 
-                padding: 8px; 
-                border: 1px solid #bbb; 
-                border-radius: 4px; 
-                background-color: white; 
-                color: black;
-            }
-            
-            QSpinBox { 
-                padding: 8px; 
-                border: 1px solid #bbb; 
-                border-radius: 4px; 
-                background-color: white; 
-                color: black;
-                padding-right: 25px; /* Make room for buttons on right */
-            }
-
-            QSpinBox::up-button {
-                background-color: #3498db;
-                border: none;
-                subcontrol-origin: margin;
-                subcontrol-position: right top;
-                width: 25px;
-                height: 50%;
-                border-top-right-radius: 4px;
-            }
-
-            QSpinBox::down-button {
-                background-color: #3498db;
-                border: none;
-                subcontrol-origin: margin;
-                subcontrol-position: right bottom;
-                width: 25px;
-                height: 50%;
-                border-bottom-right-radius: 4px;
-            }
-
-            QSpinBox::up-arrow, QSpinBox::down-arrow {
-                width: 8px;
-                height: 8px;
-                color: white;
-            }
-
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #2980b9;
-            }
-
-            QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {
-                background-color: #1f6aa8;
-            }
-            
-            /* Slider styling */
-            QSlider::groove:horizontal {
-                border: 1px solid #bbb;
-                background: #f0f0f0;
-                height: 10px;
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #3498db;
-                border: 1px solid #3498db;
-                width: 18px;
-                height: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }
-            
-            QSlider::handle:horizontal:hover {
-                background: #2980b9;
-            }
-            
-            QGroupBox { 
-                font-weight: bold; 
-                border: 1px solid #ddd; 
-                border-radius: 4px; 
-                margin-top: 12px; 
-                padding-top: 20px; 
-                color: black;
-            }
-            
-            QTableWidget { 
-                border: 1px solid #ddd; 
-                border-radius: 4px; 
-                alternate-background-color: #f9f9f9; 
-                color: black;
-            }
-            
-            QHeaderView::section { 
-                background-color: #2c3e50; 
-                color: white; 
-                padding: 6px; 
-            }
-            
-            QTabBar::tab { 
-                background-color: #e0e0e0; 
-                color: black; 
-                padding: 8px 16px;
-            }
-            
-            QTabBar::tab:selected { 
-                background-color: #3498db; 
-                color: white; 
-            }
-            
-            QCheckBox, QLabel, QRadioButton { 
-                color: black; 
-            }
-            
-            QStatusBar { 
-                color: black; 
-            }
-            
-            /* For scroll areas */
-            QScrollArea {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-            
-            /* For scroll bars */
-            QScrollBar:vertical {
-                border: none;
-                background: #f0f0f0;
-                width: 10px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: #3498db;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            
-            QScrollBar:horizontal {
-                border: none;
-                background: #f0f0f0;
-                height: 10px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background: #3498db;
-                min-width: 20px;
-                border-radius: 5px;
-            }
-            
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            
-            /* For Progress Bar */
-            QProgressBar {
-                border: 1px solid #bbb;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #f0f0f0;
-                color: black;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #3498db;
-                width: 10px;
-                margin: 0.5px;
-            }
-        """)
-        
+        # Create tab widgets; the dashboard tabs are only built when first opened
+        self.superset_details_tab = self.create_superset_details_tab()
+        self.performance_report_tab = None
+        self.dashboard_health_tab = None
+        self.performance_dashboard_model = None
+        self.health_dashboard_model = None
+        self._built_tabs = set()
+        
+        # Add tabs
+        self.tabs.addTab(self.superset_details_tab, "Superset Details")
+        self.tabs.addTab(self._create_placeholder_tab(), "Performance Report")
+        self.tabs.addTab(self._create_placeholder_tab(), "Health of Dashboards")
+        self.tabs.currentChanged.connect(self._maybe_build_tab)
+        
+        main_layout.addWidget(self.tabs)
+        
+        # Status bar
+        self.status_label = StatusLabel("Ready")
+        main_layout.addWidget(self.status_label)
+        
+        # Load the real dashboard list without blocking the first paint
+        self.fetch_dashboard_data()
+        
+    def apply_stylesheet(self):
+        """Apply custom styling to the application"""
+        # One window-wide stylesheet (built once at import) also covers the
+        # lazily built tabs, whose widgets are matched by object name
+        self.setStyleSheet(_MAIN_QSS + _REPORT_TAB_QSS)
+        
+    def _create_placeholder_tab(self):
+        """Create a tab page whose real content is built the first time it is selected"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(QLabel("Loading..."))
+        return page
+    
+    def _maybe_build_tab(self, index):
+        """Build a dashboard tab the first time the user opens it"""
+        if index not in self._LAZY_TABS or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        self._build_tab_content(index)
+    
+    def _build_tab_content(self, index):
+        """(Re)build a lazily created tab from the current dashboard list"""
+        attr, builder = self._LAZY_TABS[index]
+        layout = self.tabs.widget(index).layout()
+        old_content = layout.itemAt(0).widget()
+        content = getattr(self, builder)()
+        layout.replaceWidget(old_content, content)
+        old_content.deleteLater()
+        setattr(self, attr, content)
+    
     def create_superset_details_tab(self):
         """Create the Superset Details tab"""
         tab = QWidget()
@@ -371,194 +1387,19 @@ class SupersetTester(QMainWindow):
         return tab
 
     def fetch_dashboard_data(self):
-        """Fetch dashboard IDs and names from Superset API"""
-        try:
-            # Check if URL, username and password are set
-            url = self.url_input.text()
-            username = self.username_input.text()
-            password = self.password_input.text()
-            manual_login = self.manual_login_checkbox.isChecked()
-            
-            if not url:
-                # If URL isn't set yet, return default list
-                return [
-                    {"id": "10", "name": "Loading dashboards..."}
-                ]
-            
-            # If using manual login and we have a browser session, try to get dashboards directly
-            if manual_login and self.connector.tester and self.connector.tester.persistent_driver:
-                try:
-                    self.status_label.setText("Fetching dashboards using browser session...")
-                    driver = self.connector.tester.persistent_driver
-                    
-                    # Navigate to the dashboards page
-                    driver.get(f"{url}/dashboard/list/")
-                    time.sleep(3)  # Wait for page to load
-                    
-                    # Try to find dashboard elements
-                    dashboard_elements = driver.find_elements(By.CSS_SELECTOR, ".dashboard-list-view table tbody tr")
-                    
-                    if dashboard_elements:
-                        dashboards = []
-                        for elem in dashboard_elements:
-                            try:
-                                # Try to extract ID and name from the element
-                                link = elem.find_element(By.CSS_SELECTOR, "a")
-                                href = link.get_attribute("href")
-                                
-                                # Extract ID from href
-                                dashboard_id = href.split("/")[-1].strip()
-                                if dashboard_id.isdigit():
-                                    dashboards.append({
-                                        "id": dashboard_id,
-                                        "name": link.text.strip()
-                                    })
-                            except Exception as e:
-                                print(f"Error extracting dashboard: {e}")
-                        
-                        if dashboards:
-                            self.status_label.setText(f"Found {len(dashboards)} dashboards using browser session")
-                            return dashboards
-                    
-                    # If we couldn't get dashboards from the list page,
-                    # try the API using the browser's cookies
-                    cookies = driver.get_cookies()
-                    
-                    # Create a requests session with these cookies
-                    import requests
-                    session = requests.Session()
-                    for cookie in cookies:
-                        session.cookies.set(cookie['name'], cookie['value'])
-                    
-                    # Try API call with the authenticated session
-                    api_url = f"{url}/api/v1/dashboard/"
-                    response = session.get(api_url)
-                    
-                    if response.status_code == 200:
-                        # Process response as in the original code
-                        dashboard_data = response.json()
-                        formatted_dashboards = []
-                        
-                        if "result" in dashboard_data and isinstance(dashboard_data["result"], list):
-                            for dashboard in dashboard_data["result"]:
-                                if "id" in dashboard and "dashboard_title" in dashboard:
-                                    formatted_dashboards.append({
-                                        "id": str(dashboard["id"]),
-                                        "name": dashboard["dashboard_title"]
-                                    })
-                        
-                        if formatted_dashboards:
-                            self.status_label.setText(f"Successfully loaded {len(formatted_dashboards)} dashboards using browser cookies")
-                            return formatted_dashboards
-                
-                except Exception as browser_err:
-                    print(f"Error fetching dashboards with browser: {browser_err}")
-                    # Fall back to API approach
-            
-            # Build API URL for standard API approach
-            api_url = f"{url}/api/v1/dashboard/"
-            
-            # Try basic auth first
-            response = requests.get(api_url, auth=(username, password))
-            
-            # If that doesn't work, try token auth
-            if response.status_code == 401:
-                # Get authentication token 
-                auth_url = f"{url}/api/v1/security/login"
-                auth_payload = {
-                    "password": password,
-                    "provider": "db", 
-                    "refresh": True,
-                    "username": username
-                }
-                
-                headers = {"Content-Type": "application/json"}
-                
-                # Try the token auth
-                auth_response = requests.post(auth_url, json=auth_payload, headers=headers)
-                
-                # If this also fails, fall back to default dashboard list
-                if auth_response.status_code != 200:
-                    if hasattr(self, 'status_label'):
-                        self.status_label.setText(f"Using default dashboard list (API auth failed)")
-                    return [
-                        {"id": "10", "name": "Example Dashboard"}
-                    ]
-                    
-                # Extract access token
-                access_token = auth_response.json().get("access_token")
-                
-                if not access_token:
-                    if hasattr(self, 'status_label'):
-                        self.status_label.setText("Failed to get authentication token")
-                    return [
-                        {"id": "10", "name": "Example Dashboard"}
-                    ]
-                    
-                # Now fetch dashboards with the token
-                dashboard_headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json"
-                }
-                
-                # Get all dashboards
-                response = requests.get(api_url, headers=dashboard_headers)
-            
-            # Process response
-            if response.status_code == 200:
-                # Parse the response
-                dashboard_data = response.json()
-                
-                # Extract the dashboard list from the response
-                formatted_dashboards = []
-                
-                # Check if the response has the 'result' key containing dashboard objects
-                if "result" in dashboard_data and isinstance(dashboard_data["result"], list):
-                    for dashboard in dashboard_data["result"]:
-                        # Extract just the id and dashboard_title
-                        if "id" in dashboard and "dashboard_title" in dashboard:
-                            formatted_dashboards.append({
-                                "id": str(dashboard["id"]),
-                                "name": dashboard["dashboard_title"]
-                            })
-                
-                # If we didn't find any dashboards in the expected format, check for other possibilities
-                if not formatted_dashboards and "ids" in dashboard_data:
-                    # If we have dashboard IDs but not full objects, try to match with dashboard_title if available
-                    for dashboard_id in dashboard_data["ids"]:
-                        # Since we don't have titles in this case, use ID as name
-                        formatted_dashboards.append({
-                            "id": str(dashboard_id),
-                            "name": f"Dashboard {dashboard_id}"
-                        })
-                
-                if formatted_dashboards:
-                    if hasattr(self, 'status_label'):
-                        self.status_label.setText(f"Successfully loaded {len(formatted_dashboards)} dashboards")
-                    return formatted_dashboards
-                else:
-                    # No dashboards found in the expected format
-                    if hasattr(self, 'status_label'):
-                        self.status_label.setText("No dashboards found in API response")
-                    return [
-                        {"id": "10", "name": "Example Dashboard"}
-                    ]
-            else:
-                # Fall back to default dashboards if API call fails
-                if hasattr(self, 'status_label'):
-                    self.status_label.setText(f"Using default dashboard list (API returned {response.status_code})")
-                return [
-                    {"id": "10", "name": "Example Dashboard"}
-                ]
-            
-        except Exception as e:
-            print(f"Error fetching dashboards: {e}")
-            # Provide a fallback set of dashboards to ensure the UI works
-            if hasattr(self, 'status_label'):
-                self.status_label.setText(f"Using default dashboard list (Error: {str(e)})")
-            return [
-                {"id": "10", "name": "Example Dashboard"}
-            ]
+        """Start fetching dashboard IDs and names from Superset on a worker thread"""
+        fetcher = _DashboardFetcher(
+            self.url_input.text(),
+            self.username_input.text(),
+            self.password_input.text(),
+            self.manual_login_checkbox.isChecked(),
+            self.connector.tester.persistent_driver if self.connector.tester else None,
+            self.driver_lock,
+            self.http
+        )
+        fetcher.signals.status.connect(self.status_label.setText)
+        fetcher.signals.result.connect(self._on_dashboards_loaded)
+        QThreadPool.globalInstance().start(fetcher)
 
     def create_dashboard_selection_group(self):
         """Reusable dashboard selection group for both tabs."""
@@ -570,151 +1411,46 @@ class SupersetTester(QMainWindow):
         # Button row
         button_row_layout = QHBoxLayout()
         button_row_layout.setSpacing(15)
-        button_style = """
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: 2px solid {border_color};
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 8px 12px;
-                min-width: 80px;
-                min-height: 35px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-                border: 2px solid {hover_border};
-                transform: translateY(-1px);
-            }}
-            QPushButton:pressed {{
-                background-color: {pressed_color};
-                transform: translateY(1px);
-            }}
-        """
         select_all_btn = QPushButton("✓ Select All")
-        select_all_btn.setStyleSheet(button_style.format(
-            bg_color="#27ae60", border_color="#229954",
-            hover_color="#229954", hover_border="#1e8449",
-            pressed_color="#1e8449"
-        ))
+        select_all_btn.setStyleSheet(_SELECT_ALL_QSS)
         deselect_all_btn = QPushButton("✗ Clear All")
-        deselect_all_btn.setStyleSheet(button_style.format(
-            bg_color="#e74c3c", border_color="#c0392b",
-            hover_color="#c0392b", hover_border="#a93226",
-            pressed_color="#a93226"
-        ))
+        deselect_all_btn.setStyleSheet(_DESELECT_QSS)
         select_first_3_btn = QPushButton("⚡ First 3")
-        select_first_3_btn.setStyleSheet(button_style.format(
-            bg_color="#f39c12", border_color="#e67e22",
-            hover_color="#e67e22", hover_border="#d68910",
-            pressed_color="#d68910"
-        ))
+        select_first_3_btn.setStyleSheet(_FIRST3_QSS)
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.setStyleSheet(button_style.format(
-            bg_color="#3498db", border_color="#2980b9",
-            hover_color="#2980b9", hover_border="#1f6aa8",
-            pressed_color="#1f6aa8"
-        ))
-
-        # --- Fix: Connect buttons to local checkboxes, not global ---
-        # We'll return the checkboxes list for each group, and connect the buttons to those.
-
-        # Dashboard checkboxes
-        dashboard_scroll = QScrollArea()
-        dashboard_scroll.setWidgetResizable(True)
-        dashboard_scroll.setFixedHeight(160)
-        dashboard_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        dashboard_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        dashboard_scroll.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                background-color: #fafafa;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #ecf0f1;
-                width: 12px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3498db;
-                min-height: 25px;
-                border-radius: 5px;
-                margin: 1px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #2980b9;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-        dashboard_content = QWidget()
-        dashboard_grid = QGridLayout(dashboard_content)
-        dashboard_grid.setSpacing(8)
-        dashboard_grid.setContentsMargins(12, 12, 12, 12)
-
-        # Create a new list of checkboxes for this group
-        checkboxes = []
-        col_count = 2
-        for i, dashboard in enumerate(self.dashboard_ids):
-            row = i // col_count
-            col = i % col_count
-            dashboard_id = dashboard['id']
-            dashboard_name = dashboard['name']
-            if len(dashboard_name) > 32:
-                display_text = f"{dashboard_id} - {dashboard_name[:29]}..."
-            else:
-                display_text = f"{dashboard_id} - {dashboard_name}"
-            checkbox = QCheckBox(display_text)
-            checkbox.setChecked(False)
-            checkbox.setMinimumHeight(24)
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    font-size: 11px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 4px;
-                    spacing: 10px;
-                }
-                QCheckBox::indicator {
-                    width: 20px;
-                    height: 20px;
-                    border-radius: 4px;
-                    border: 2px solid #bdc3c7;
-                    background-color: white;
-                }
-                QCheckBox::indicator:hover {
-                    border: 2px solid #3498db;
-                    background-color: #ecf0f1;
-                }
-                QCheckBox::indicator:checked {
-                    border: 2px solid #27ae60;
-                    background-color: #27ae60;
-                }
-                QCheckBox:hover {
-                    background-color: #f8f9fa;
-                    border-radius: 4px;
-                    padding: 2px;
-                }
-            """)
-            if len(f"{dashboard_id} - {dashboard_name}") > 32:
-                checkbox.setToolTip(f"{dashboard_id} - {dashboard_name}")
-            checkboxes.append(checkbox)
-            dashboard_grid.addWidget(checkbox, row, col)
-
-        dashboard_content.setLayout(dashboard_grid)
-        dashboard_scroll.setWidget(dashboard_content)
-        dashboard_layout.addWidget(dashboard_scroll)
+        refresh_btn.setStyleSheet(_REFRESH_QSS)
+
+        # --- Fix: Connect buttons to this group's own model, not global ---
+        # We'll return the model for each group, and connect the buttons to it.
+
+        # Dashboard list: one view over a model, so only visible rows are painted
+        model = DashboardModel(self.dashboard_ids, dashboard_group)
+        dashboard_list = QListView()
+        dashboard_list.setModel(model)
+        dashboard_list.setStyleSheet(self.DASHBOARD_LIST_QSS)
+        dashboard_list.setFixedHeight(160)
+        dashboard_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        dashboard_list.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        dashboard_list.setSelectionMode(QListView.NoSelection)
+        dashboard_list.setUniformItemSizes(True)
+        dashboard_list.setTextElideMode(Qt.ElideRight)
+
+        # Two columns: rows flow left to right and wrap at a fixed cell width
+        label_font = QFont(dashboard_list.font())
+        label_font.setPixelSize(11)
+        label_font.setBold(True)
+        metrics = QFontMetrics(label_font)
+        dashboard_list.setFlow(QListView.LeftToRight)
+        dashboard_list.setWrapping(True)
+        dashboard_list.setResizeMode(QListView.Adjust)
+        dashboard_list.setGridSize(QSize(metrics.averageCharWidth() * 32 + 40, 32))
+        dashboard_layout.addWidget(dashboard_list)
         dashboard_group.setLayout(dashboard_layout)
 
-        # Button connections use local checkboxes
-        select_all_btn.clicked.connect(lambda: [cb.setChecked(True) for cb in checkboxes])
-        deselect_all_btn.clicked.connect(lambda: [cb.setChecked(False) for cb in checkboxes])
-        select_first_3_btn.clicked.connect(lambda: [cb.setChecked(i < 3) for i, cb in enumerate(checkboxes)])
+        # Button connections use this group's model
+        select_all_btn.clicked.connect(lambda: self.select_all_dashboards(model))
+        deselect_all_btn.clicked.connect(lambda: self.deselect_all_dashboards(model))
+        select_first_3_btn.clicked.connect(lambda: self.select_first_3_dashboards(model))
         refresh_btn.clicked.connect(self.refresh_dashboard_list)
 
         button_row_layout.addWidget(select_all_btn)
@@ -724,9 +1460,53 @@ class SupersetTester(QMainWindow):
         button_row_layout.addWidget(refresh_btn)
         dashboard_layout.insertLayout(0, button_row_layout)
 
-        # Return both the group and the checkboxes for use in the tab
-        return dashboard_group, checkboxes
+        # Return both the group and the model for use in the tab
+        return dashboard_group, model
 
+    def _add_scenario_row(self, scenario_grid, row, scenario_name, description):
+        """
+        Add one scenario row to the Performance Report scenario grid
+        
+        Args:
+            scenario_grid: QGridLayout holding all scenario rows
+            row: Grid row to fill
+            scenario_name: Checkbox label
+            description: Short description shown next to it
+            
+        Returns:
+            tuple: (scenario checkbox, iterations spin box)
+        """
+        # Scenario checkbox with simple styling
+        checkbox = QCheckBox(scenario_name)
+        checkbox.setFixedWidth(110)
+        checkbox.setChecked(False)
+        checkbox.setObjectName("scenarioCheck")
+        scenario_grid.addWidget(checkbox, row, 0)
+        
+        # Description
+        desc_label = QLabel(description)
+        desc_label.setFixedWidth(160)
+        desc_label.setObjectName("scenarioDesc")
+        scenario_grid.addWidget(desc_label, row, 1)
+        
+        # Iterations label
+        iter_label = QLabel("Iterations:")
+        iter_label.setFixedWidth(70)
+        iter_label.setObjectName("iterLabel")
+        scenario_grid.addWidget(iter_label, row, 2)
+        
+        # Spinbox
+        iter_input = QSpinBox()
+        iter_input.setMinimum(0)
+        iter_input.setMaximum(20)
+        iter_input.setValue(1)
+        iter_input.setFixedSize(80, 32)
+        iter_input.setObjectName("iterSpin")
+        scenario_grid.addWidget(iter_input, row, 3)
+        
+        scenario_grid.setRowMinimumHeight(row, 40)
+        return checkbox, iter_input
+    
     def create_performance_report_tab(self):
         """Create the Performance Report tab with independent dashboard selection."""
         tab = QWidget()
@@ -744,72 +1524,27 @@ class SupersetTester(QMainWindow):
         title_layout = QHBoxLayout()
         title_layout.addStretch()
         main_title = QLabel("Dashboard Performance Testing Tool")
-        main_title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 15px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                            stop:0 #ecf0f1, stop:0.5 #ffffff, stop:1 #ecf0f1);
-                border: 2px solid #3498db;
-                border-radius: 10px;
-                margin: 5px;
-            }
-        """)
+        main_title.setObjectName("reportTitle")
         main_title.setAlignment(Qt.AlignCenter)
         title_layout.addWidget(main_title)
         title_layout.addStretch()
         header_layout.addLayout(title_layout)
         main_layout.addLayout(header_layout)
         # Use local dashboard selection group
-        dashboard_group, self.performance_dashboard_checkboxes = self.create_dashboard_selection_group()
+        dashboard_group, self.performance_dashboard_model = self.create_dashboard_selection_group()
+        dashboard_group.setObjectName("reportSection")  # Sits inside the config section and matches it
         main_layout.addWidget(dashboard_group)
         
         # Test configuration group
         config_group = QGroupBox("Test Configuration")
-        config_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                border: 3px solid #3498db;
-                border-radius: 12px;
-                margin-top: 15px;
-                padding-top: 25px;
-                background-color: #f8f9fa;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 10px 0 10px;
-                background-color: #f8f9fa;
-            }
-        """)
+        config_group.setObjectName("reportSection")
         config_layout = QVBoxLayout()
         config_layout.setSpacing(20)
         config_layout.addWidget(dashboard_group)
         
         # ===== SCENARIOS SECTION =====
         scenario_group = QGroupBox("Select Scenarios to Run:")
-        scenario_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #34495e;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px 0 8px;
-                background-color: #ffffff;
-            }
-        """)
+        scenario_group.setObjectName("scenarioGroup")
         scenario_layout = QVBoxLayout()
         scenario_layout.setSpacing(12)
         scenario_layout.setContentsMargins(15, 12, 15, 15)
@@ -824,107 +1559,16 @@ class SupersetTester(QMainWindow):
             ("Scenario 3", "Dashboard refresh")        # UI label for Scenario 4
         ]
         
-        for i, (scenario_name, description) in enumerate(scenario_descriptions):
-            scenario_container = QWidget()
-            scenario_container.setFixedHeight(40)
-            scenario_row = QHBoxLayout(scenario_container)
-            scenario_row.setSpacing(15)
-            scenario_row.setContentsMargins(5, 5, 5, 5)
-            
-            # Scenario checkbox with simple styling
-            checkbox = QCheckBox(scenario_name)
-            checkbox.setFixedWidth(110)
-            checkbox.setChecked(False)
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    font-size: 12px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 2px;
-                }
-                QCheckBox::indicator {
-                    width: 20px;
-                    height: 20px;
-                    border-radius: 4px;
-                    border: 2px solid #bdc3c7;
-                    background-color: white;
-                }
-                QCheckBox::indicator:hover {
-                    border: 2px solid #3498db;
-                    background-color: #ecf0f1;
-                }
-                QCheckBox::indicator:checked {
-                    border: 2px solid #3498db;
-                    background-color: #3498db;
-                }
-            """)
+        # All rows share one grid: checkbox, description, iterations label, spin box
+        scenario_grid = QGridLayout()
+        scenario_grid.setHorizontalSpacing(15)
+        scenario_grid.setContentsMargins(5, 0, 5, 0)
+        scenario_grid.setColumnStretch(4, 1)
+        for row, (scenario_name, description) in enumerate(scenario_descriptions):
+            checkbox, iter_input = self._add_scenario_row(scenario_grid, row, scenario_name, description)
             self.scenario_checkboxes.append(checkbox)
-            scenario_row.addWidget(checkbox)
-            
-            # Description
-            desc_label = QLabel(description)
-            desc_label.setFixedWidth(160)
-            desc_label.setStyleSheet("""
-                QLabel {
-                    color: #7f8c8d;
-                    font-style: italic;
-                    font-size: 11px;
-                    padding: 2px;
-                }
-            """)
-            scenario_row.addWidget(desc_label)
-            
-            # Iterations label
-            iter_label = QLabel("Iterations:")
-            iter_label.setFixedWidth(70)
-            iter_label.setStyleSheet("""
-                QLabel {
-                    color: #34495e;
-                    font-size: 11px;
-                    font-weight: bold;
-                    padding: 2px;
-                }
-            """)
-            scenario_row.addWidget(iter_label)
-            
-            # Spinbox
-            iter_input = QSpinBox()
-            iter_input.setMinimum(0)
-            iter_input.setMaximum(20)
-            iter_input.setValue(1)
-            iter_input.setFixedSize(80, 32)
-            iter_input.setStyleSheet("""
-                QSpinBox {
-                    font-size: 12px;
-                    font-weight: bold;
-                    padding: 6px;
-                    border: 2px solid #bdc3c7;
-                    border-radius: 5px;
-                    background-color: white;
-                    color: #2c3e50;
-                }
-                QSpinBox:focus {
-                    border: 2px solid #3498db;
-                }
-                QSpinBox::up-button, QSpinBox::down-button {
-                    background-color: #3498db;
-                    border: none;
-                    width: 20px;
-                }
-                QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                    background-color: #2980b9;
-                }
-                QSpinBox::up-arrow, QSpinBox::down-arrow {
-                    width: 10px;
-                    height: 10px;
-                    color: white;
-                }
-            """)
             self.scenario_iterations.append(iter_input)
-            scenario_row.addWidget(iter_input)
-            
-            scenario_row.addStretch()
-            scenario_layout.addWidget(scenario_container)
+        scenario_layout.addLayout(scenario_grid)
         
         # Start button
         start_button_layout = QHBoxLayout()
@@ -932,34 +1576,7 @@ class SupersetTester(QMainWindow):
         
         self.start_perf_button = QPushButton("🚀 Start Performance Test")
         self.start_perf_button.setFixedSize(220, 45)
-        self.start_perf_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #27ae60, stop:1 #229954);
-                color: white;
-                border: 3px solid #1e8449;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #229954, stop:1 #1e8449);
-                border: 3px solid #17a2b8;
-                transform: translateY(-2px);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #1e8449, stop:1 #148f39);
-                transform: translateY(1px);
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                border: 3px solid #95a5a6;
-                color: #7f8c8d;
-            }
-        """)
+        self.start_perf_button.setObjectName("startPerfBtn")
         self.start_perf_button.clicked.connect(self.run_performance_test)
         start_button_layout.addWidget(self.start_perf_button)
         start_button_layout.addStretch()
@@ -977,39 +1594,14 @@ class SupersetTester(QMainWindow):
         
         self.progress_label = QLabel("Running tests...")
         self.progress_label.setVisible(False)
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #34495e; 
-                font-weight: bold; 
-                font-size: 12px;
-                padding: 5px;
-                background-color: #ecf0f1;
-                border-radius: 4px;
-            }
-        """)
+        self.progress_label.setObjectName("perfProgressLabel")
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
         self.progress_bar.setFixedHeight(22)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #bdc3c7;
-                border-radius: 6px;
-                text-align: center;
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                            stop:0 #3498db, stop:1 #2980b9);
-                border-radius: 4px;
-                margin: 1px;
-            }
-        """)
+        self.progress_bar.setObjectName("perfProgressBar")
         
         self.progress_layout.addWidget(self.progress_label)
         self.progress_layout.addWidget(self.progress_bar)
@@ -1017,85 +1609,29 @@ class SupersetTester(QMainWindow):
         
         # Results section
         results_group = QGroupBox("Test Results")
-        results_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                border: 3px solid #3498db;
-                border-radius: 12px;
-                margin-top: 15px;
-                padding-top: 25px;
-                background-color: #f8f9fa;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 10px 0 10px;
-                background-color: #f8f9fa;
-            }
-        """)
+        results_group.setObjectName("reportSection")
         results_layout = QVBoxLayout()
         results_layout.setSpacing(10)
         
         # Excel status
         self.excel_status_label = QLabel("")
-        self.excel_status_label.setStyleSheet("""
-            QLabel {
-                color: #27ae60; 
-                font-weight: bold; 
-                font-size: 11px;
-                padding: 5px;
-                background-color: #d5f4e6;
-                border-radius: 4px;
-            }
-        """)
+        self.excel_status_label.setObjectName("excelStatusLabel")
         self.excel_status_label.setVisible(False)
         results_layout.addWidget(self.excel_status_label)
         
         # Results table
-        self.results_table = QTableWidget(0, 6)
-        self.results_table.setHorizontalHeaderLabels([
+        self.results_model = ResultsModel([
             "Dashboard ID", "Scenario", "Iterations", "Avg Time (s)", 
             "Min Time (s)", "Max Time (s)"
-        ])
+        ], self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setMinimumHeight(220)
-        
-        self.results_table.setStyleSheet("""
-            QTableWidget {
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                background-color: white;
-                gridline-color: #ecf0f1;
-                font-size: 11px;
-                selection-background-color: #3498db;
-            }
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #34495e, stop:1 #2c3e50);
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border: none;
-                font-size: 12px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #ecf0f1;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QTableWidget::item:hover {
-                background-color: #ebf3fd;
-            }
-            QTableWidget::item:alternate {
-                background-color: #f8f9fa;
-            }
-        """)
+        self.results_table.setMouseTracking(False)
+        self.results_table.viewport().setMouseTracking(False)
+        self.results_table.setObjectName("resultsTable")
         
         results_layout.addWidget(self.results_table)
         
@@ -1106,34 +1642,7 @@ class SupersetTester(QMainWindow):
         self.download_button = QPushButton("📊 Download Results as Excel")
         self.download_button.setFixedSize(240, 38)
         self.download_button.setEnabled(False)
-        self.download_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #3498db, stop:1 #2980b9);
-                color: white;
-                border: 2px solid #1f6aa8;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #2980b9, stop:1 #1f6aa8);
-                border: 2px solid #17a2b8;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #1f6aa8, stop:1 #1a5490);
-                transform: translateY(1px);
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                border: 2px solid #95a5a6;
-                color: #7f8c8d;
-            }
-        """)
+        self.download_button.setObjectName("downloadResultsBtn")
         self.download_button.clicked.connect(self.download_results)
         download_layout.addWidget(self.download_button)
         
@@ -1157,10 +1666,10 @@ class SupersetTester(QMainWindow):
         layout = QVBoxLayout()
         intro_text = QLabel("This tab checks if all dashboards are loading properly with all their features.")
         intro_text.setWordWrap(True)
-        intro_text.setStyleSheet("color: #2c3e50; font-style: italic;")
+        intro_text.setObjectName("healthIntro")
         layout.addWidget(intro_text)
         # Use local dashboard selection group
-        dashboard_group, self.health_dashboard_checkboxes = self.create_dashboard_selection_group()
+        dashboard_group, self.health_dashboard_model = self.create_dashboard_selection_group()
         layout.addWidget(dashboard_group)
         
         # Progress bar (initially hidden)
@@ -1191,12 +1700,15 @@ class SupersetTester(QMainWindow):
         results_layout = QVBoxLayout()
         
         # Results table
-        self.health_table = QTableWidget(0, 5)
-        self.health_table.setHorizontalHeaderLabels([
+        self.health_model = ResultsModel([
             "Dashboard ID", "Status", "Charts Loaded", "Load Time (s)", "Issues"
-        ])
+        ], self, color_column=1)
+        self.health_table = QTableView()
+        self.health_table.setModel(self.health_model)
         self.health_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.health_table.setAlternatingRowColors(True)
+        self.health_table.setMouseTracking(False)
+        self.health_table.viewport().setMouseTracking(False)
         results_layout.addWidget(self.health_table)
         
         # Download button
@@ -1220,53 +1732,38 @@ class SupersetTester(QMainWindow):
         """Refresh the dashboard list from the API"""
         self.status_label.setText("Refreshing dashboard list...")
         
-        # Fetch new dashboard data
-        new_dashboards = self.fetch_dashboard_data()
-        
+        # Fetch new dashboard data; _on_dashboards_loaded updates the lists in place
+        self.fetch_dashboard_data()
+    
+    def _on_dashboards_loaded(self, new_dashboards):
+        """Show the list returned by _DashboardFetcher in the dashboard tabs"""
         # Only proceed if we got data
         if new_dashboards:
             # Update dashboard IDs
             self.dashboard_ids = new_dashboards
             
-            # Recreate the dashboard tabs
-            current_tab = self.tabs.currentIndex()
-            
-            # Recreate the tabs with fresh data
-            self.tabs.removeTab(1)  # Remove performance tab
-            self.tabs.removeTab(1)  # Remove health tab (now at index 1)
-            
-            # Reset the checkbox list
-            self.dashboard_checkboxes = []
-            
-            # Add fresh tabs
-            self.performance_report_tab = self.create_performance_report_tab()
-            self.dashboard_health_tab = self.create_dashboard_health_tab()
-            
-            self.tabs.insertTab(1, self.performance_report_tab, "Performance Report")
-            self.tabs.insertTab(2, self.dashboard_health_tab, "Health of Dashboards")
-            
-            # Switch back to the tab user was viewing
-            self.tabs.setCurrentIndex(current_tab)
+            # Update the lists of tabs already opened; the others pick up the
+            # new list when they are first opened
+            for model in (self.performance_dashboard_model, self.health_dashboard_model):
+                if model is not None:
+                    model.set_dashboards(new_dashboards)
             
             self.status_label.setText(f"Dashboard list refreshed with {len(self.dashboard_ids)} dashboards")
         else:
             self.status_label.setText("Failed to refresh dashboard list")
     
     # Helper methods (add these to your SupersetTester class if not already present)
-    def select_all_dashboards(self):
-        """Select all dashboard checkboxes"""
-        for checkbox in self.dashboard_checkboxes:
-            checkbox.setChecked(True)
+    def select_all_dashboards(self, model):
+        """Select all dashboards in a selection list"""
+        model.set_checked(lambda row: True)
 
-    def deselect_all_dashboards(self):
-        """Deselect all dashboard checkboxes"""
-        for checkbox in self.dashboard_checkboxes:
-            checkbox.setChecked(False)
+    def deselect_all_dashboards(self, model):
+        """Deselect all dashboards in a selection list"""
+        model.set_checked(lambda row: False)
 
-    def select_first_3_dashboards(self):
+    def select_first_3_dashboards(self, model):
         """Select only first 3 dashboards"""
-        for i, checkbox in enumerate(self.dashboard_checkboxes):
-            checkbox.setChecked(i < 3)
+        model.set_checked(lambda row: row < 3)
     
     # Event handlers
     def save_settings(self):
@@ -1274,7 +1771,7 @@ class SupersetTester(QMainWindow):
         try:
             # Would typically save to a config file
             self.status_label.setText("Settings saved successfully")
-            QMessageBox.information(self, "Settings Saved", "Superset connection details have been saved.")
+            self.toast.show_message("Superset connection details have been saved.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not save settings: {str(e)}")
     
@@ -1299,13 +1796,10 @@ class SupersetTester(QMainWindow):
             self.status_label.setText("Browser launched. Please complete the login process manually.")
             self.complete_login_btn.setEnabled(True)
         elif result:
-            QMessageBox.information(self, "Connection Test", "Successfully connected to Superset!")
+            self.toast.show_message("Successfully connected to Superset!")
             self.status_label.setText("Connected to Superset, fetching dashboards...")
             
-            # Fetch dashboards after successful connection
-            self.dashboard_ids = self.fetch_dashboard_data()
-            
-            # Refresh the tabs to show new dashboard data
+            # Fetch dashboards after successful connection and refresh the tabs with them
             self.refresh_dashboard_list()
         else:
             QMessageBox.critical(self, "Connection Test", 
@@ -1317,14 +1811,11 @@ class SupersetTester(QMainWindow):
     def manual_login_completed(self):
         """Called when the user clicks the 'I've completed login' button"""
         if self.connector.complete_manual_login():
-            QMessageBox.information(self, "Login Successful", "Manual login completed successfully!")
+            self.toast.show_message("Manual login completed successfully!")
             self.status_label.setText("Connected to Superset, fetching dashboards...")
             self.complete_login_btn.setEnabled(False)
             
-            # Fetch dashboards after successful connection
-            self.dashboard_ids = self.fetch_dashboard_data()
-            
-            # Refresh the tabs to show new dashboard data
+            # Fetch dashboards after successful connection and refresh the tabs with them
             self.refresh_dashboard_list()
         else:
             QMessageBox.warning(self, "Login Issue", "Login doesn't appear to be completed. Please finish the login process in the browser.")
@@ -1336,11 +1827,8 @@ class SupersetTester(QMainWindow):
         username = self.username_input.text()
         password = self.password_input.text()
         
-        # Parse dashboard IDs from selected checkboxes (use performance tab checkboxes)
-        dashboard_ids = []
-        for i, checkbox in enumerate(self.performance_dashboard_checkboxes):
-            if checkbox.isChecked():
-                dashboard_ids.append(self.dashboard_ids[i]["id"])
+        # Dashboard IDs checked in the performance tab's list
+        dashboard_ids = self.performance_dashboard_model.checked_ids()
         
         if not dashboard_ids:
             QMessageBox.warning(self, "Missing Input", "Please select at least one dashboard ID.")
@@ -1352,11 +1840,14 @@ class SupersetTester(QMainWindow):
         
         scenario_mapping = [2, 3, 4]  # Map UI positions to actual scenario numbers
         
+        run_labels = []
         for i, checkbox in enumerate(self.scenario_checkboxes):
             if checkbox.isChecked():
                 scenario_num = scenario_mapping[i]  # Map to actual scenario number
                 selected_scenarios.append(scenario_num)
                 iterations_by_scenario[scenario_num] = self.scenario_iterations[i].value()
+                # UI label only: show Scenario 1/2/3 instead of 2/3/4
+                run_labels.append(f"Scenario {i+1}: {iterations_by_scenario[scenario_num]} iterations")
         
         if not selected_scenarios:
             QMessageBox.warning(self, "No Scenarios", "Please select at least one test scenario.")
@@ -1379,7 +1870,10 @@ class SupersetTester(QMainWindow):
                                 for s in selected_scenarios])
         self.status_label.setText(f"Running: {scenario_info}")
         
-        # Run tests in background thread
+        # Run tests in background thread; the summary shows the settings as started
+        self._last_run_labels = run_labels
+        self._connect_run_signals(self.update_performance_progress, self.handle_test_completed,
+                                  self._reset_performance_controls)
         self.connector.run_performance_tests(dashboard_ids, selected_scenarios, iterations_by_scenario)
 
 
@@ -1390,11 +1884,8 @@ class SupersetTester(QMainWindow):
         username = self.username_input.text()
         password = self.password_input.text()
         
-        # Get selected dashboard IDs from checkboxes (use health tab checkboxes)
-        dashboard_ids = []
-        for i, checkbox in enumerate(self.health_dashboard_checkboxes):
-            if checkbox.isChecked():
-                dashboard_ids.append(self.dashboard_ids[i]["id"])
+        # Dashboard IDs checked in the health tab's list
+        dashboard_ids = self.health_dashboard_model.checked_ids()
         
         if not dashboard_ids:
             QMessageBox.warning(self, "Missing Input", "Please select at least one dashboard ID.")
@@ -1419,36 +1910,65 @@ class SupersetTester(QMainWindow):
         self.status_label.setText(f"Running health checks on {len(dashboard_ids)} dashboards...")
         
         # Run health checks in background thread
+        self._connect_run_signals(self.update_health_progress, self.handle_health_completed,
+                                  self._reset_health_controls)
         self.connector.run_dashboard_health_check(dashboard_ids)
     
-    def update_progress(self, value, message):
-        """Update progress bar and status message"""
-        current_tab = self.tabs.currentIndex()
+    def _connect_run_signals(self, progress_slot, completed_slot, reset_slot):
+        """Send the connector's progress and completion signals straight to one tab's handlers
         
-        if current_tab == 1:  # Performance Report tab
-            self.progress_bar.setValue(value)
-            self.progress_label.setText(message)
-        elif current_tab == 2:  # Health of Dashboards tab
-            self.health_progress_bar.setValue(value)
-            self.health_progress_label.setText(message)
-            
-        self.status_label.setText(message)
-
-    def route_test_completed(self, data):
-        """Route test completion events to the appropriate handler based on active tab"""
-        current_tab = self.tabs.currentIndex()
+        Args:
+            progress_slot: Handler for progress updates
+            completed_slot: Handler for the finished run
+            reset_slot: Restores the tab's controls when the run fails
+        """
+        self._disconnect_run_signals()
+        self.connector.progress_updated.connect(progress_slot)
+        self.connector.test_completed.connect(completed_slot)
+        self._run_slots = (progress_slot, completed_slot, reset_slot)
+    
+    def _disconnect_run_signals(self):
+        """Drop the handlers connected by _connect_run_signals, if any"""
+        if self._run_slots is None:
+            return
+        progress_slot, completed_slot, _ = self._run_slots
+        self.connector.progress_updated.disconnect(progress_slot)
+        self.connector.test_completed.disconnect(completed_slot)
+        self._run_slots = None
         
-        if current_tab == 1:  # Performance Report tab
-            self.handle_test_completed(data)
-        elif current_tab == 2:  # Health of Dashboards tab
-            self.handle_health_completed(data)
+        self._progress_timer.stop()
+        self._pending_progress = None
+    
+    def update_performance_progress(self, value, message):
+        """Update the Performance Report progress bar and status message"""
+        self._queue_progress(self.progress_bar, self.progress_label, value, message)
+    
+    def update_health_progress(self, value, message):
+        """Update the Health of Dashboards progress bar and status message"""
+        self._queue_progress(self.health_progress_bar, self.health_progress_label, value, message)
+    
+    def _queue_progress(self, bar, label, value, message):
+        """Remember the latest progress and schedule one repaint for the whole burst"""
+        self._pending_progress = (bar, label, value, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the latest progress queued by _queue_progress"""
+        if self._pending_progress is None:
+            return
+        bar, label, value, message = self._pending_progress
+        self._pending_progress = None
+        bar.setValue(value)
+        label.setText(message)
+        self.status_label.setText(message)
     
     def handle_test_completed(self, data):
         """Handle completion of tests with updated scenario mapping"""
+        self._disconnect_run_signals()
+        
         # Process performance results
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.start_perf_button.setEnabled(True)
+        self._reset_performance_controls()
         self.download_button.setEnabled(True)
         
         # Defensive: Only call display_performance_results if results is a dict
@@ -1457,7 +1977,7 @@ class SupersetTester(QMainWindow):
             self.display_performance_results(results)
         else:
             # Optionally, clear the table or show a warning
-            self.results_table.setRowCount(0)
+            self.display_performance_results({})
         
         # Update status
         self.status_label.setText("Performance tests completed successfully")
@@ -1465,18 +1985,8 @@ class SupersetTester(QMainWindow):
         # Store the excel path for download
         self.performance_excel_path = data.get("excel_path", "")
         
-        # Show success message with updated scenario mapping
-        scenario_iterations = []
-        scenario_mapping = [2, 3, 4]  # DO NOT CHANGE LOGIC
-
-        for i, checkbox in enumerate(self.scenario_checkboxes):
-            if checkbox.isChecked():
-                scenario_num = scenario_mapping[i]
-                iter_count = self.scenario_iterations[i].value()
-                # UI label only: show Scenario 1/2/3 instead of 2/3/4
-                scenario_label = f"Scenario {i+1}: {iter_count} iterations"
-                scenario_iterations.append(scenario_label)
-        iterations_summary = ", ".join(scenario_iterations)
+        # Show success message with the scenario settings captured at start
+        iterations_summary = ", ".join(self._last_run_labels)
         QMessageBox.information(self, "Tests Completed", 
                             f"Performance tests completed successfully.\n\n"
                             f"Settings used: {iterations_summary}\n\n"
@@ -1484,14 +1994,14 @@ class SupersetTester(QMainWindow):
         
     def handle_health_completed(self, data):
         """Handle completion of health checks"""
+        self._disconnect_run_signals()
+        
         # Reset UI elements
-        self.health_progress_bar.setVisible(False)
-        self.health_progress_label.setVisible(False)
-        self.start_health_button.setEnabled(True)
+        self._reset_health_controls()
         self.download_health_button.setEnabled(True)
         
-        # Display results in table
-        self.display_health_results(data.get("results", []))
+        # Display results in table, counting statuses on the way
+        health_counts = self.display_health_results(data.get("results", []))
         
         # Store the excel path for download
         self.health_excel_path = data.get("excel_path", "")
@@ -1500,17 +2010,6 @@ class SupersetTester(QMainWindow):
         self.status_label.setText("Dashboard health checks completed")
         
         # Show success message
-        health_counts = {
-            "Healthy": 0,
-            "Warning": 0,
-            "Critical": 0
-        }
-        
-        for result in data.get("results", []):
-            status = result.get("Status")
-            if status in health_counts:
-                health_counts[status] += 1
-        
         QMessageBox.information(self, "Health Checks Completed",
                             f"Dashboard health checks completed.\n\n"
                             f"Results summary:\n"
@@ -1520,48 +2019,48 @@ class SupersetTester(QMainWindow):
                             f"Detailed results are in the table and can be downloaded as Excel.")
         
     def display_health_results(self, results):
-        """Display health check results in the table"""
-        # Clear existing results
-        self.health_table.setRowCount(0)
-        
-        if not results:
-            return
+        """Display health check results in the table
         
-        # Add results to table
-        for row, result in enumerate(results):
-            self.health_table.insertRow(row)
-            
-            # Dashboard ID
-            self.health_table.setItem(row, 0, QTableWidgetItem(str(result.get('Dashboard ID', ''))))
-            
-            # Status with color
+        Returns:
+            Counter: Number of dashboards per status
+        """
+        rows = []
+        colors = []
+        status_counts = Counter()
+        for result in results or []:
             status = result.get('Status', 'Unknown')
-            status_item = QTableWidgetItem(status)
-            if status == "Healthy":
-                status_item.setForeground(Qt.darkGreen)
-            elif status == "Warning":
-                status_item.setForeground(Qt.darkYellow)
-            elif status == "Critical":
-                status_item.setForeground(Qt.red)
-            self.health_table.setItem(row, 1, status_item)
-            
-            # Charts loaded
-            charts_loaded = f"{result.get('Charts Loaded', 0)}/{result.get('Total Charts', 0)}"
-            self.health_table.setItem(row, 2, QTableWidgetItem(charts_loaded))
-            
-            # Load time
-            load_time = result.get('Load Time (s)', 0)
-            self.health_table.setItem(row, 3, QTableWidgetItem(f"{load_time:.2f}"))
-            
-            # Issues
-            self.health_table.setItem(row, 4, QTableWidgetItem(result.get('Issues', '')))
+            status_counts[status] += 1
+            rows.append((
+                str(result.get('Dashboard ID', '')),
+                status,
+                f"{result.get('Charts Loaded', 0)}/{result.get('Total Charts', 0)}",
+                f"{result.get('Load Time (s)', 0):.2f}",
+                result.get('Issues', '')
+            ))
+            colors.append(HEALTH_STATUS_COLORS.get(status))  # Only the status column is coloured
+        self.health_model.set_rows(rows, colors)
+        return status_counts
     
-    def handle_test_error(self, error_message):
-        """Handle test errors"""
-        # Reset UI elements
+    def _reset_performance_controls(self):
+        """Hide the Performance Report progress and re-enable its start button"""
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
         self.start_perf_button.setEnabled(True)
+    
+    def _reset_health_controls(self):
+        """Hide the Health of Dashboards progress and re-enable its start button"""
+        self.health_progress_bar.setVisible(False)
+        self.health_progress_label.setVisible(False)
+        self.start_health_button.setEnabled(True)
+    
+    def handle_test_error(self, error_message):
+        """Handle test errors"""
+        # Only the tab that started a run has controls to reset; errors such as a
+        # failed connection test arrive while no run is active and its tab may not be built
+        if self._run_slots is not None:
+            reset_slot = self._run_slots[2]
+            self._disconnect_run_signals()
+            reset_slot()
         
         # Show error message
         QMessageBox.critical(self, "Error", error_message)
@@ -1569,67 +2068,54 @@ class SupersetTester(QMainWindow):
     
     def display_performance_results(self, results):
         """Display performance test results in the table"""
-        # Clear existing results
-        self.results_table.setRowCount(0)
-        
+        # The numeric rows are kept for exporting when the connector's workbook is missing
+        self.performance_rows = []
         if not results:
+            self.results_model.set_rows([], [])
             return
         
+        # pandas is already loaded by the connector's Excel export at this point
+        import pandas as pd
+        
         # Process results by dashboard and scenario
         processed_results = []
         for scenario_name, measurements in results.items():
             if not measurements:
                 continue
                 
-            # Extract scenario number
-            scenario_num = int(scenario_name.split()[1]) if len(scenario_name.split()) > 1 else 0
+            # Extract scenario number and the label shown for it, once per scenario
+            try:
+                scenario_num = int(scenario_name.rsplit(' ', 1)[1])
+            except (IndexError, ValueError):
+                scenario_num = 0
+            display_scenario = SCENARIO_DISPLAY_NAMES.get(scenario_name, scenario_name)
             
-            # Group by dashboard ID
-            by_dashboard = {}
-            for measurement in measurements:
-                dashboard_id = measurement.get('Dashboard ID')
-                if dashboard_id not in by_dashboard:
-                    by_dashboard[dashboard_id] = []
-                by_dashboard[dashboard_id].append(measurement)
+            # Determine which time column to use
+            df = pd.DataFrame(measurements)
+            time_col = 'Refresh Time (seconds)' if 'Refresh Time (seconds)' in df.columns else 'Load Time (seconds)'
             
-            # Calculate stats for each dashboard
-            for dashboard_id, dashboard_measurements in by_dashboard.items():
-                # Determine which time column to use
-                if 'Refresh Time (seconds)' in dashboard_measurements[0]:
-                    time_col = 'Refresh Time (seconds)'
-                else:
-                    time_col = 'Load Time (seconds)'
-                
-                # Calculate stats
-                times = [m[time_col] for m in dashboard_measurements]
-                avg_time = sum(times) / len(times)
-                min_time = min(times)
-                max_time = max(times)
-                
+            # Stats for every dashboard in one grouped pass, in measurement order
+            stats = df.groupby('Dashboard ID', sort=False)[time_col].agg(['mean', 'min', 'max', 'count'])
+            times = stats[['mean', 'min', 'max']].round(2)
+            for (dashboard_id, iterations), (avg_time, min_time, max_time) in zip(
+                    stats['count'].items(), times.itertuples(index=False)):
                 # Get iterations for this specific scenario
-                iterations = len(dashboard_measurements)
                 if 1 <= scenario_num <= len(self.scenario_iterations):
                     displayed_iterations = self.scenario_iterations[scenario_num-1].value()
                 else:
                     displayed_iterations = iterations
                 
-                # UI label only: replace Scenario 2/3/4 with Scenario 1/2/3 for display
-                display_scenario = scenario_name.replace("Scenario 2", "Scenario 1").replace("Scenario 3", "Scenario 2").replace("Scenario 4", "Scenario 3")
-                processed_results.append({
-                    'Dashboard ID': dashboard_id,
-                    'Scenario': display_scenario,
-                    'Iterations': displayed_iterations,
-                    'Avg Time': avg_time,
-                    'Min Time': min_time,
-                    'Max Time': max_time
-                })
-        
-        # Add to table with colored text by scenario
-        for row, result in enumerate(processed_results):
-            self.results_table.insertRow(row)
-            
+                processed_results.append(PerfRow(
+                    dashboard_id, display_scenario, displayed_iterations,
+                    float(avg_time), float(min_time), float(max_time)
+                ))
+        
+        # Add to table with colored text by scenario, in a single model reset
+        rows = []
+        colors = []
+        for result in processed_results:
             # Set color based on scenario (use new UI labels)
-            scenario = result['Scenario']
+            scenario = result.scenario
             if 'Scenario 1' in scenario:
                 color = Qt.blue
             elif 'Scenario 2' in scenario:
@@ -1641,18 +2127,18 @@ class SupersetTester(QMainWindow):
             else:
                 color = Qt.black
             
-            # Add each cell with the appropriate color
-            for col, value in enumerate([
-                str(result['Dashboard ID']),
-                result['Scenario'],
-                str(result['Iterations']),
-                f"{result['Avg Time']:.2f}",
-                f"{result['Min Time']:.2f}",
-                f"{result['Max Time']:.2f}"
-            ]):
-                item = QTableWidgetItem(value)
-                item.setForeground(color)
-                self.results_table.setItem(row, col, item)
+            # Each row's cells share the row colour
+            rows.append((
+                str(result.dashboard_id),
+                result.scenario,
+                str(result.iterations),
+                f"{result.avg_time:.2f}",
+                f"{result.min_time:.2f}",
+                f"{result.max_time:.2f}"
+            ))
+            colors.append(color)
+        self.results_model.set_rows(rows, colors)
+        self.performance_rows = processed_results
     
     def download_results(self):
         """Download performance results as Excel file"""
@@ -1666,19 +2152,20 @@ class SupersetTester(QMainWindow):
         if not filename.endswith('.xlsx'):
             filename += '.xlsx'
         
-        try:
-            # The results should already be saved by the connector
-            # Just copy the file to the selected location
-            import shutil
-            if hasattr(self, 'performance_excel_path'):
-                excel_path = self.performance_excel_path
-                shutil.copy2(excel_path, filename)
-                self.status_label.setText(f"Results saved to {filename}")
-                QMessageBox.information(self, "Download Complete", f"Results saved to {filename}")
-            else:
-                QMessageBox.warning(self, "No Results", "No results available to download.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save results: {str(e)}")
+        # The results should already be saved by the connector
+        # Just copy the file to the selected location
+        excel_path = getattr(self, 'performance_excel_path', "")
+        if excel_path and os.path.exists(excel_path):
+            save = lambda target: _copy_file(excel_path, target)
+        elif self.performance_rows:
+            # The connector could not save its workbook; export the summary on display as numbers
+            headers, rows = self.results_model.headers, self.performance_rows
+            save = lambda target: write_xlsx(target, headers, rows, sheet_name="Performance")
+        else:
+            QMessageBox.warning(self, "No Results", "No results available to download.")
+            return
+        
+        self._start_save(save, filename, self.download_button, "Results", "Failed to save results")
 
     def download_health_report(self):
         """Download health check results as Excel file"""
@@ -1692,31 +2179,51 @@ class SupersetTester(QMainWindow):
         if not filename.endswith('.xlsx'):
             filename += '.xlsx'
         
-        try:
-            # Copy the existing file or create a new one from the table data
-            import shutil
-            if hasattr(self, 'health_excel_path') and os.path.exists(self.health_excel_path):
-                shutil.copy2(self.health_excel_path, filename)
-            else:
-                # Create DataFrame from table data
-                data = []
-                for row in range(self.health_table.rowCount()):
-                    row_data = {}
-                    row_data['Dashboard ID'] = self.health_table.item(row, 0).text()
-                    row_data['Status'] = self.health_table.item(row, 1).text()
-                    row_data['Charts Loaded'] = self.health_table.item(row, 2).text()
-                    row_data['Load Time (s)'] = self.health_table.item(row, 3).text()
-                    row_data['Issues'] = self.health_table.item(row, 4).text()
-                    data.append(row_data)
-                
-                # Save as Excel
-                df = pd.DataFrame(data)
-                df.to_excel(filename, index=False)
-            
-            self.status_label.setText(f"Health report saved to {filename}")
-            QMessageBox.information(self, "Download Complete", f"Health report saved to {filename}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save health report: {str(e)}")
+        # Copy the existing file or create a new one from the table data
+        if hasattr(self, 'health_excel_path') and os.path.exists(self.health_excel_path):
+            excel_path = self.health_excel_path
+            save = lambda target: _copy_file(excel_path, target)
+        else:
+            # Stream the rows on display into a new workbook
+            headers, rows = self.health_model.headers, self.health_model.rows
+            save = lambda target: write_xlsx(target, headers, rows, sheet_name="Health")
+        
+        self._start_save(save, filename, self.download_health_button, "Health report", "Failed to save health report")
+    
+    def _start_save(self, save, filename, button, saved_label, error_label):
+        """
+        Run a report save on the thread pool, keeping its download button disabled meanwhile
+        
+        Args:
+            save: Callable taking the destination path
+            filename: Destination path
+            button: Download button to disable until the save ends
+            saved_label: Start of the success message, e.g. "Results"
+            error_label: Title of the error message
+        """
+        task = _SaveTask(save, filename)
+        task.signals.finished.connect(lambda path: self._on_save_done(button, f"{saved_label} saved to {path}"))
+        task.signals.failed.connect(lambda message: self._on_save_failed(button, f"{error_label}: {message}"))
+        button.setEnabled(False)
+        self.status_label.setText(f"Saving {filename}...")
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_save_done(self, button, message):
+        """Re-enable the download button and confirm the save"""
+        button.setEnabled(True)
+        self.status_label.setText(message)
+        self.toast.show_message(message)
+    
+    def _on_save_failed(self, button, message):
+        """Re-enable the download button and report the error"""
+        button.setEnabled(True)
+        self.status_label.setText(message)
+        QMessageBox.critical(self, "Error", message)
+    
+    def closeEvent(self, event):
+        """Release pooled HTTP connections when the window closes"""
+        self.http.close()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)
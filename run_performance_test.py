@@ -3,25 +3,44 @@
 Main script to run Superset performance tests
 """
 
-print("Starting Superset Performance Test...")
-
 import argparse
+import logging
 import sys
 import time
-print("Basic modules imported")
 
-try:
-    from config import SUPERSET_CONFIG, DASHBOARD_CONFIG, LOG_DIR
-    from superset_performance_tester import SupersetPerformanceTester
-    from scenarios import Scenarios
+from config import SUPERSET_CONFIG, DASHBOARD_CONFIG, LOG_DIR, ALL_DASHBOARDS, MAX_CONCURRENT_TABS
+from superset_performance_tester import SupersetPerformanceTester
+from scenarios import Scenarios
+
+# Errors are reported here, in the same format as SupersetPerformanceTester.log
+_LOG_FORMATTER = logging.Formatter("[%(asctime)s] %(message)s", "%Y-%m-%d %H:%M:%S")
+logger = logging.getLogger(__name__)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_LOG_FORMATTER)
+logger.addHandler(_stream_handler)
+
+def _log_startup():
+    """Print the startup diagnostics shown when the script is run directly"""
+    print("Starting Superset Performance Test...")
     print("All modules imported")
-except Exception as e:
-    print(f"Import error: {str(e)}")
-    sys.exit(1)
+    print("Script is being run directly")
 
-def parse_arguments():
-    """Parse command line arguments"""
-    print("Parsing arguments...")
+def _tab_cap(value):
+    """Parse --max-tabs; scenario 3 needs at least two tabs open at once"""
+    tabs = int(value)
+    if tabs < 2:
+        raise argparse.ArgumentTypeError(f"must be at least 2, got {tabs}")
+    return tabs
+
+# Built on first use by _build_parser()
+_PARSER = None
+
+def _build_parser():
+    """Return the command line parser, building it the first time"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+    
     parser = argparse.ArgumentParser(description='Superset Performance Testing Tool')
     
     parser.add_argument('--url', 
@@ -55,7 +74,30 @@ def parse_arguments():
                         type=int,
                         default=None)
     
-    args = parser.parse_args()
+    parser.add_argument('--all-dashboards', 
+                        help='Run scenarios 2, 3 and 4 against every dashboard in ALL_DASHBOARDS',
+                        action='store_true')
+    
+    parser.add_argument('--warm-cache', 
+                        help='Load each dashboard once without measuring it before scenarios 1, 2 and 3 start',
+                        action='store_true')
+    
+    parser.add_argument('--concurrent', 
+                        help='When running all scenarios, run them at the same time, each in its own browser',
+                        action='store_true')
+    
+    parser.add_argument('--max-tabs', 
+                        help='Maximum dashboard tabs open at once with --concurrent (at least 2)',
+                        type=_tab_cap,
+                        default=MAX_CONCURRENT_TABS)
+    
+    _PARSER = parser
+    return parser
+
+def parse_arguments():
+    """Parse command line arguments"""
+    print("Parsing arguments...")
+    args = _build_parser().parse_args()
     print(f"Arguments parsed: {args}")
     return args
 
@@ -64,18 +106,29 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
     
+    # DASHBOARD_CONFIG is read-only, so apply command line overrides to a copy
+    dashboard_config = {name: dict(settings) for name, settings in DASHBOARD_CONFIG.items()}
+    
     # Override dashboard config with command line arguments if provided
     if args.dashboard_id:
         if args.scenario == 1:
-            DASHBOARD_CONFIG['scenario_1']['dashboard_id'] = args.dashboard_id
+            dashboard_config['scenario_1']['dashboard_id'] = args.dashboard_id
         elif args.scenario == 5:
-            DASHBOARD_CONFIG['scenario_5']['dashboard_id'] = args.dashboard_id
+            dashboard_config['scenario_5']['dashboard_id'] = args.dashboard_id
     
     if args.iterations:
         if args.scenario == 1:
-            DASHBOARD_CONFIG['scenario_1']['iterations'] = args.iterations
+            dashboard_config['scenario_1']['iterations'] = args.iterations
         elif args.scenario == 5:
-            DASHBOARD_CONFIG['scenario_5']['chart_refresh_iterations'] = args.iterations
+            dashboard_config['scenario_5']['chart_refresh_iterations'] = args.iterations
+    
+    if args.all_dashboards:
+        for scenario in ('scenario_2', 'scenario_3', 'scenario_4'):
+            dashboard_config[scenario]['dashboard_ids'] = ALL_DASHBOARDS
+    
+    if args.warm_cache:
+        for scenario in ('scenario_1', 'scenario_2', 'scenario_3'):
+            dashboard_config[scenario]['warmup'] = max(dashboard_config[scenario].get('warmup', 0), 1)
     
     # Create the tester instance
     tester = SupersetPerformanceTester(
@@ -86,57 +139,67 @@ def main():
         log_dir=LOG_DIR
     )
     
+    # Keep error tracebacks in the run's log file too
+    file_handler = logging.FileHandler(tester.log_file)
+    file_handler.setFormatter(_LOG_FORMATTER)
+    logger.addHandler(file_handler)
+    
     # Create scenarios instance
     scenarios = Scenarios(tester)
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     tester.log(f"Starting performance test with scenario {args.scenario}")
     
     results = {}
     
+    # A single scenario run, by scenario number
+    single_scenarios = {
+        1: lambda: scenarios.scenario_1_single_dashboard(
+            dashboard_config['scenario_1']['dashboard_id'],
+            dashboard_config['scenario_1']['iterations'],
+            dashboard_config['scenario_1'].get('warmup', 0)
+        ),
+        2: lambda: scenarios.scenario_2_sequential_dashboards(
+            dashboard_config['scenario_2']['dashboard_ids'],
+            dashboard_config['scenario_2']['iterations_per_dashboard'],
+            dashboard_config['scenario_2'].get('parallel', False),
+            dashboard_config['scenario_2'].get('max_workers', 1),
+            dashboard_config['scenario_2'].get('warmup', 0)
+        ),
+        3: lambda: scenarios.scenario_3_parallel_dashboards(
+            dashboard_config['scenario_3']['dashboard_ids'],
+            dashboard_config['scenario_3']['iterations_per_dashboard'],
+            dashboard_config['scenario_3']['max_workers'],
+            dashboard_config['scenario_3'].get('warmup', 0),
+            dashboard_config['scenario_3'].get('separate_browsers', False)
+        ),
+        4: lambda: scenarios.scenario_4_dashboard_refresh(
+            dashboard_config['scenario_4']['dashboard_ids'],
+            dashboard_config['scenario_4']['refresh_count'],
+            dashboard_config['scenario_4']['wait_between_refresh']
+        ),
+        5: lambda: scenarios.scenario_5_chart_refresh(
+            dashboard_config['scenario_5']['dashboard_id'],
+            dashboard_config['scenario_5']['chart_refresh_iterations'],
+            dashboard_config['scenario_5']['wait_between_refresh']
+        ),
+    }
+    
     try:
         # Run specific scenario or all scenarios
-        if args.scenario == 1:
-            results['Scenario 1'] = scenarios.scenario_1_single_dashboard(
-                DASHBOARD_CONFIG['scenario_1']['dashboard_id'],
-                DASHBOARD_CONFIG['scenario_1']['iterations']
-            )
-        elif args.scenario == 2:
-            results['Scenario 2'] = scenarios.scenario_2_sequential_dashboards(
-                DASHBOARD_CONFIG['scenario_2']['dashboard_ids'],
-                DASHBOARD_CONFIG['scenario_2']['iterations_per_dashboard']
-            )
-        elif args.scenario == 3:
-            results['Scenario 3'] = scenarios.scenario_3_parallel_dashboards(
-                DASHBOARD_CONFIG['scenario_3']['dashboard_ids'],
-                DASHBOARD_CONFIG['scenario_3']['iterations_per_dashboard'],
-                DASHBOARD_CONFIG['scenario_3']['max_workers']
-            )
-        elif args.scenario == 4:
-            results['Scenario 4'] = scenarios.scenario_4_dashboard_refresh(
-                DASHBOARD_CONFIG['scenario_4']['dashboard_ids'],
-                DASHBOARD_CONFIG['scenario_4']['refresh_count'],
-                DASHBOARD_CONFIG['scenario_4']['wait_between_refresh']
-            )
-        elif args.scenario == 5:
-            results['Scenario 5'] = scenarios.scenario_5_chart_refresh(
-                DASHBOARD_CONFIG['scenario_5']['dashboard_id'],
-                DASHBOARD_CONFIG['scenario_5']['chart_refresh_iterations'],
-                DASHBOARD_CONFIG['scenario_5']['wait_between_refresh']
-            )
+        if args.scenario in single_scenarios:
+            results[f'Scenario {args.scenario}'] = single_scenarios[args.scenario]()
         else:
-            # Run all scenarios
-            results = scenarios.run_all_scenarios(DASHBOARD_CONFIG)
+            # Run all scenarios (all at once with --concurrent)
+            results = scenarios.run_all_scenarios(dashboard_config, args.concurrent, args.max_tabs)
         
         # Save results to Excel
         tester.save_results_to_excel(results)
         
     except KeyboardInterrupt:
         tester.log("Test interrupted by user")
-    except Exception as e:
-        tester.log(f"Error running test: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error running test")
         return 1
     finally:
         # Close the persistent driver
@@ -144,16 +207,13 @@ def main():
             tester.persistent_driver.quit()
             tester.log("Closed persistent browser")
     
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    tester.log(f"Performance test completed in {elapsed_time:.2f} seconds")
+    elapsed_s = (time.perf_counter_ns() - start_ns) / 1e9
+    tester.log(f"Performance test completed in {elapsed_s:.2f} seconds")
     
     return 0
 
 if __name__ == "__main__":
-    print("Script is being run directly")
+    _log_startup()
     exit_code = main()
     print(f"Script completed with exit code {exit_code}")
-    sys.exit(exit_code)
-else:
-    print("Script was imported, not run directly")
\ No newline at end of file
+    sys.exit(exit_code)
\ No newline at end of file
@@ -3,6 +3,10 @@ Scenarios for Superset Performance Testing
 Contains the implementation of different test scenarios
 """
 import time
+import queue
+import threading
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,23 +15,150 @@ from selenium.webdriver.common.keys import Keys
 import datetime
 from selenium import webdriver
 
+from config import WAIT_POLL_SECONDS
+
+# Scenarios that use separate browsers and can run at the same time
+CONCURRENT_SCENARIOS = ('scenario_1', 'scenario_2', 'scenario_3', 'scenario_4', 'scenario_5')
+
+# Selectors tried in order to find the charts of a dashboard
+CHART_SELECTORS = [
+    ".chart-container", 
+    ".dashboard-component-chart",
+    ".slice_container",
+    ".slice-container",
+    ".dashboard-component", 
+    "[data-test='chart-container']",
+    ".dashboard-chart",
+    ".grid-content",
+    ".dashboard__grid-item"
+]
+
+# Selectors tried in order to find a chart's menu button (three dots)
+MENU_SELECTORS = [
+    ".chart-header .dropdown-trigger",
+    ".dashboard-component-menu-trigger",
+    ".dashboard-header .dropdown-trigger",
+    ".chart-controls .dropdown-trigger",
+    ".more-options",
+    ".more-button",
+    ".btn-default", 
+    ".fa-ellipsis-v",
+    ".anticon-more",
+    ".chart-controls .ant-dropdown-trigger",
+    ".ant-dropdown-trigger"
+]
+
+# Finds the charts, or with a chart as third argument that chart's menu button,
+# in one browser round trip. A button inside the chart wins, then the nearest
+# one within 200px of the chart's centre, then any menu-like button level with it.
+DISCOVER_CHARTS_JS = """
+    var chartSelectors = arguments[0];
+    var menuSelectors = arguments[1];
+    var onlyChart = arguments[2];
+    var selector = null;
+    var charts = [];
+    for (var i = 0; !onlyChart && i < chartSelectors.length; i++) {
+        charts = Array.prototype.slice.call(document.querySelectorAll(chartSelectors[i]));
+        if (charts.length) {
+            selector = chartSelectors[i];
+            break;
+        }
+    }
+    
+    var allMenus = document.querySelectorAll(menuSelectors.join(','));
+    var buttons = document.querySelectorAll('button');
+    
+    function findMenu(chart) {
+        for (var j = 0; j < menuSelectors.length; j++) {
+            var inside = chart.querySelector(menuSelectors[j]);
+            if (inside) { return inside; }
+        }
+        
+        var rect = chart.getBoundingClientRect();
+        var centerX = rect.left + rect.width / 2;
+        var centerY = rect.top + rect.height / 2;
+        var closest = null;
+        var minDistance = 200;
+        for (var k = 0; k < allMenus.length; k++) {
+            var menuRect = allMenus[k].getBoundingClientRect();
+            var distance = Math.hypot(menuRect.left - centerX, menuRect.top - centerY);
+            if (distance < minDistance) {
+                minDistance = distance;
+                closest = allMenus[k];
+            }
+        }
+        if (closest) { return closest; }
+        
+        for (var b = 0; b < buttons.length; b++) {
+            var btn = buttons[b];
+            var btnRect = btn.getBoundingClientRect();
+            var overlaps = !(rect.right < btnRect.left || rect.left > btnRect.right ||
+                             rect.bottom < btnRect.top || rect.top > btnRect.bottom);
+            if ((overlaps || Math.abs(rect.top - btnRect.top) < 50) &&
+                (btn.textContent.includes('...') ||
+                 btn.className.includes('dropdown') ||
+                 btn.className.includes('menu') ||
+                 btn.className.includes('more'))) {
+                return btn;
+            }
+        }
+        return null;
+    }
+    
+    return {
+        selector: selector,
+        charts: charts,
+        menu: onlyChart ? findMenu(onlyChart) : null
+    };
+"""
+
 class Scenarios:
-    def __init__(self, tester):
+    def __init__(self, tester, tab_slots=None, max_tabs=None):
         """
         Initialize scenarios with a reference to the tester
         
         Args:
             tester: Instance of SupersetPerformanceTester
+            tab_slots: Optional semaphore shared by concurrently running scenarios
+                to cap the number of dashboard tabs open at once
+            max_tabs: Size of tab_slots; no scenario may hold more slots than this
         """
         self.tester = tester
+        self.tab_slots = tab_slots
+        self.max_tabs = max_tabs
+    
+    @contextmanager
+    def _tab_slots_held(self, count=1):
+        """Hold `count` shared tab slots while dashboards are open (no-op without a semaphore)"""
+        acquired = 0
+        try:
+            if self.tab_slots is not None:
+                for _ in range(count):
+                    self.tab_slots.acquire()
+                    acquired += 1
+            yield
+        finally:
+            for _ in range(acquired):
+                self.tab_slots.release()
+    
+    def _existing_dashboards(self, dashboard_ids):
+        """Drop dashboards that Superset reports as missing, resolving each ID only once"""
+        existing = []
+        for dashboard_id in dashboard_ids:
+            if self.tester.resolve_dashboard_id(dashboard_id) is None:
+                self.tester.log(f"Dashboard {dashboard_id} does not exist, skipping it")
+            else:
+                existing.append(dashboard_id)
+        return existing
     
-    def scenario_1_single_dashboard(self, dashboard_id, iterations=1):
+    def scenario_1_single_dashboard(self, dashboard_id, iterations=1, warmup=0):
         """
         Scenario 1: Measure loading time of a single dashboard
         
         Args:
             dashboard_id: ID of the dashboard to measure
             iterations: Number of times to repeat the measurement
+            warmup: Unmeasured loads before the first iteration
             
         Returns:
             list: List of measurement data dictionaries
@@ -43,14 +174,25 @@ class Scenarios:
                 self.tester.log("Failed to get persistent driver, aborting test")
                 return results
             
+            if not self._existing_dashboards([dashboard_id]):
+                return results
+            with self._tab_slots_held():
+                self.tester.warm_up_dashboard(driver, dashboard_id, warmup)
+            
             # Measure the dashboard load time specified number of times
             for i in range(iterations):
                 self.tester.log(f"Iteration {i+1}/{iterations} for dashboard {dashboard_id}")
-                measurement = self.tester.measure_dashboard_load_time(driver, dashboard_id)
+                with self._tab_slots_held():
+                    measurement = self.tester.measure_dashboard_load_time(driver, dashboard_id)
                 if measurement:
                     measurement['Iteration'] = i+1
                     measurement['Scenario'] = 'Single Dashboard'
                     results.append(measurement)
+                    self.tester.record_result(measurement)
+                
+                # Reuse the same browser for the next iteration
+                if i < iterations - 1:
+                    self.tester.reset_driver_state(driver)
             
         except Exception as e:
             self.tester.log(f"ERROR in scenario 1: {str(e)}")
@@ -60,16 +202,97 @@ class Scenarios:
         self.tester.log(f"=== Completed Scenario 1: {len(results)} measurements collected ===")
         return results
     
-    def scenario_2_sequential_dashboards(self, dashboard_ids, iterations_per_dashboard=5):
+    def _create_driver_pool(self, size):
+        """
+        Start a bounded pool of logged-in browsers shared by parallel workers
+        
+        Args:
+            size: Number of browsers to start
+            
+        Returns:
+            queue.Queue: Authenticated drivers; may hold fewer than size if logins fail
+        """
+        pool = queue.Queue(maxsize=size)
+        for i in range(size):
+            driver = self.tester.create_driver()
+            if self.tester.authenticate_driver(driver):
+                pool.put(driver)
+            else:
+                self.tester.log(f"Browser {i + 1}/{size} failed to login, leaving it out of the pool")
+                driver.quit()
+        self.tester.log(f"Driver pool ready with {pool.qsize()} browsers")
+        return pool
+    
+    def _close_driver_pool(self, pool):
+        """Quit every browser in a driver pool"""
+        while not pool.empty():
+            try:
+                pool.get_nowait().quit()
+            except Exception:
+                pass
+    
+    def _measure_iterations_in_parallel(self, dashboard_id, iterations, pool):
+        """
+        Measure the same dashboard several times at once using a driver pool
+        
+        A WebDriver is not thread-safe, so each worker takes a browser out of
+        the pool for one iteration and puts it back when the measurement ends.
+        
+        Args:
+            dashboard_id: ID of the dashboard to measure
+            iterations: Number of measurements to take
+            pool: queue.Queue of logged-in drivers from _create_driver_pool
+            
+        Returns:
+            list: Measurement dictionaries sorted by iteration
+        """
+        if iterations < 1:
+            return []
+        
+        def measure_once(iteration):
+            driver = pool.get()
+            try:
+                with self._tab_slots_held():
+                    measurement = self.tester.measure_dashboard_load_time(driver, dashboard_id)
+                if measurement:
+                    measurement['Iteration'] = iteration + 1
+                return measurement
+            finally:
+                pool.put(driver)
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=min(pool.qsize(), iterations)) as executor:
+            futures = [executor.submit(measure_once, i) for i in range(iterations)]
+            for future in as_completed(futures):
+                try:
+                    measurement = future.result()
+                except Exception as e:
+                    self.tester.log(f"ERROR in parallel iteration for dashboard {dashboard_id}: {str(e)}")
+                    continue
+                if measurement:
+                    results.append(measurement)
+        
+        results.sort(key=lambda m: m['Iteration'])
+        return results
+    
+    def scenario_2_sequential_dashboards(self, dashboard_ids, iterations_per_dashboard=5, parallel=False, max_workers=1, warmup=0):
         """
         Scenario 2: Sequential dashboard testing with PRECISE timing
         NO unnecessary waits - only measures actual load time
+        
+        Args:
+            dashboard_ids: List of dashboard IDs to measure, one after another
+            iterations_per_dashboard: Number of measurements per dashboard
+            parallel: Run the iterations of each dashboard at the same time
+            max_workers: Maximum number of browsers used when parallel is True
+            warmup: Unmeasured loads of each dashboard before its iterations
         """
         self.tester.log(f"=== Starting Scenario 2: Sequential Dashboards {dashboard_ids} ===")
         self.tester.log(f"Will measure each dashboard {iterations_per_dashboard} times")
         self.tester.log(f"Total measurements: {len(dashboard_ids) * iterations_per_dashboard}")
         
         results = []
+        driver_pool = None
         
         try:
             # Get persistent driver - login once
@@ -79,6 +302,7 @@ class Scenarios:
                 return results
             
             self.tester.log("Using logged-in session for all measurements")
+            dashboard_ids = self._existing_dashboards(dashboard_ids)
             
             # Progress tracking
             total_measurements = len(dashboard_ids) * iterations_per_dashboard
@@ -87,6 +311,25 @@ class Scenarios:
             # Test each dashboard
             for dash_idx, dashboard_id in enumerate(dashboard_ids):
                 self.tester.log(f"\n--- Dashboard {dash_idx + 1}/{len(dashboard_ids)}: {dashboard_id} ---")
+                with self._tab_slots_held():
+                    self.tester.warm_up_dashboard(driver, dashboard_id, warmup)
+                
+                if parallel and max_workers > 1:
+                    # Browsers are started once and reused for every dashboard
+                    if driver_pool is None:
+                        driver_pool = self._create_driver_pool(max_workers)
+                    if driver_pool.empty():
+                        self.tester.log("No browsers in the driver pool, aborting parallel measurements")
+                        return results
+                    self.tester.log(f"Running {iterations_per_dashboard} iterations with up to {driver_pool.qsize()} browsers")
+                    for measurement in self._measure_iterations_in_parallel(dashboard_id, iterations_per_dashboard, driver_pool):
+                        measurement['Scenario'] = 'Sequential Dashboards'
+                        measurement['Dashboard_Index'] = dash_idx + 1
+                        measurement['Total_Dashboards'] = len(dashboard_ids)
+                        results.append(measurement)
+                        self.tester.record_result(measurement)
+                    completed += iterations_per_dashboard
+                    continue
                 
                 # Multiple iterations per dashboard
                 for iteration in range(iterations_per_dashboard):
@@ -107,7 +350,8 @@ class Scenarios:
                             return results
                     
                     # MEASURE WITH PRECISE TIMING
-                    measurement = self.tester.measure_dashboard_load_time(driver, dashboard_id)
+                    with self._tab_slots_held():
+                        measurement = self.tester.measure_dashboard_load_time(driver, dashboard_id)
                     
                     if measurement:
                         measurement['Iteration'] = iteration + 1
@@ -115,6 +359,7 @@ class Scenarios:
                         measurement['Dashboard_Index'] = dash_idx + 1
                         measurement['Total_Dashboards'] = len(dashboard_ids)
                         results.append(measurement)
+                        self.tester.record_result(measurement)
                         
                         # Quick summary
                         self.tester.log(f"✓ Load time: {measurement['Load Time (seconds)']:.2f}s, "
@@ -122,14 +367,17 @@ class Scenarios:
                     else:
                         self.tester.log(f"✗ Failed to measure")
                     
-                    # MINIMAL wait between iterations (only if needed for stability)
+                    # Start the next iteration from the same client-side state
                     if iteration < iterations_per_dashboard - 1:
-                        time.sleep(0.5)  # Half second for browser stability
+                        self.tester.reset_driver_state(driver)
             
         except Exception as e:
             self.tester.log(f"ERROR in scenario 2: {str(e)}")
             import traceback
             traceback.print_exc()
+        finally:
+            if driver_pool is not None:
+                self._close_driver_pool(driver_pool)
         
         # Summary
         if results:
@@ -141,9 +389,87 @@ class Scenarios:
         return results
     
     
-    def scenario_3_parallel_dashboards(self, dashboard_ids, iterations_per_dashboard=3, max_workers=5):
+    def _open_tab_pool(self, driver, count):
+        """
+        Open blank tabs once so every round of scenario 3 can reuse them
+        
+        Each tab gets URL blocking, the request counter and the dashboard-ready
+        marker up front.
+        
+        Args:
+            driver: WebDriver instance switched to the original tab
+            count: Number of extra tabs to open
+            
+        Returns:
+            list: Window handles of the original tab followed by the new tabs
+        """
+        original_tab = driver.current_window_handle
+        self.tester.watch_dashboard_ready(driver)
+        handles = [original_tab]
+        for tab_num in range(count):
+            try:
+                # The DevTools target ID returned right away is also the tab's window handle
+                target = driver.execute_cdp_cmd("Target.createTarget", {"url": "about:blank"})
+                driver.switch_to.window(target['targetId'])
+                self.tester.block_urls(driver)
+                self.tester.track_pending_requests(driver)
+                self.tester.watch_dashboard_ready(driver)
+                handles.append(target['targetId'])
+            except Exception as e:
+                self.tester.log(f"Error creating tab {tab_num + 2}: {str(e)}")
+        driver.switch_to.window(original_tab)
+        self.tester.log(f"Tab pool ready with {len(handles)} tabs")
+        return handles
+    
+    def _close_tab_pool(self, driver, handles):
+        """Close the extra tabs of a tab pool and return to its original tab"""
+        for tab_handle in handles[1:]:
+            try:
+                driver.switch_to.window(tab_handle)
+                driver.close()
+            except Exception as e:
+                self.tester.log(f"Error closing tab: {str(e)}")
+        try:
+            driver.switch_to.window(handles[0])
+        except Exception as e:
+            self.tester.log(f"Error returning to original tab: {str(e)}")
+    
+    def _measure_round_in_browsers(self, dashboard_id, round_num, pool):
+        """
+        Load a dashboard once in every browser of a driver pool at the same time
+        
+        Args:
+            dashboard_id: ID of the dashboard to measure
+            round_num: Zero-based round number
+            pool: queue.Queue of logged-in drivers from _create_driver_pool
+            
+        Returns:
+            list: Scenario 3 result dictionaries, one per browser
+        """
+        results = []
+        for measurement in self._measure_iterations_in_parallel(dashboard_id, pool.qsize(), pool):
+            instance = measurement.pop('Iteration')
+            measurement.update({
+                'Round': round_num + 1,
+                'Parallel Instance': instance,
+                'Tab': instance,
+                'Scenario': 'Parallel Browsers Same Dashboard',
+                'Status': 'Success'
+            })
+            results.append(measurement)
+            self.tester.record_result(measurement)
+            self.tester.log(f"✓ Dashboard {dashboard_id} Browser {instance}: "
+                            f"{measurement['Load Time (seconds)']:.2f}s, {measurement['Chart Count']} charts")
+        return results
+    
+    def scenario_3_parallel_dashboards(self, dashboard_ids, iterations_per_dashboard=3, max_workers=5, warmup=0,
+                                       separate_browsers=False):
         """
         Scenario 3: FORCE multiple parallel tabs (ignore UI max_workers limit)
+        
+        Each dashboard is loaded `warmup` times without measurement before its first round.
+        With separate_browsers, every parallel instance runs in its own logged-in
+        browser from a driver pool instead of a tab of the shared browser.
         """
         self.tester.log(f"=== Starting Scenario 3: FORCED Parallel Dashboards {dashboard_ids} ===")
         
@@ -152,9 +478,17 @@ class Scenarios:
             self.tester.log(f"WARNING: max_workers was {max_workers}, forcing to 5 for true parallel testing")
             max_workers = 5
         
+        # Holding more tab slots than the shared cap allows would wait forever
+        if self.max_tabs is not None and max_workers > self.max_tabs:
+            self.tester.log(f"WARNING: max_workers was {max_workers}, capping to {self.max_tabs} open tabs")
+            max_workers = self.max_tabs
+        
         self.tester.log(f"Will test each dashboard with {max_workers} parallel instances, {iterations_per_dashboard} rounds")
         
         all_results = []
+        driver_pool = None
+        tab_pool = None
+        tab_pool_slots = ExitStack()
         
         try:
             # Get the persistent driver with login already done
@@ -164,64 +498,76 @@ class Scenarios:
                 return all_results
             
             original_tab = main_driver.current_window_handle
+            dashboard_ids = self._existing_dashboards(dashboard_ids)
+            if not separate_browsers:
+                # The pooled tabs stay open between rounds, so they hold their
+                # shared tab slots for as long as the pool exists
+                tab_pool_slots.enter_context(self._tab_slots_held(max_workers))
+                tab_pool = self._open_tab_pool(main_driver, max_workers - 1)
             
             # Test each dashboard
             for dashboard_id in dashboard_ids:
                 self.tester.log(f"\n=== Testing Dashboard {dashboard_id} with {max_workers} Parallel Instances ===")
+                main_driver.switch_to.window(original_tab)
+                # With a tab pool the original tab's slot is already held
+                with self._tab_slots_held(1 if separate_browsers else 0):
+                    self.tester.warm_up_dashboard(main_driver, dashboard_id, warmup)
                 
                 # Run multiple rounds of parallel testing for this dashboard
                 for round_num in range(iterations_per_dashboard):
                     self.tester.log(f"\n--- Round {round_num + 1}/{iterations_per_dashboard} for Dashboard {dashboard_id} ---")
                     
-                    # STEP 1: Open FORCED number of tabs of the SAME dashboard simultaneously
+                    if separate_browsers:
+                        # Browsers are started once and reused for every round
+                        if driver_pool is None:
+                            driver_pool = self._create_driver_pool(max_workers)
+                        if driver_pool.empty():
+                            self.tester.log("No browsers in the driver pool, aborting parallel measurements")
+                            return all_results
+                        all_results.extend(self._measure_round_in_browsers(dashboard_id, round_num, driver_pool))
+                        continue
+                    
+                    # STEP 1: Load the SAME dashboard in every pooled tab simultaneously
                     tab_info = []
                     
-                    self.tester.log(f"STEP 1: FORCING {max_workers} parallel tabs of dashboard {dashboard_id}...")
+                    # The original tab still shows the warm-up or previous round; blank it
+                    # like the extra tabs so its old ready marker cannot be read
+                    try:
+                        main_driver.switch_to.window(original_tab)
+                        main_driver.get("about:blank")
+                    except Exception as e:
+                        self.tester.log(f"Error resetting original tab: {str(e)}")
                     
-                    for tab_num in range(max_workers):
+                    self.tester.log(f"STEP 1: FORCING {len(tab_pool)} parallel tabs of dashboard {dashboard_id}...")
+                    dashboard_url = self.tester.dashboard_url(dashboard_id)
+                    
+                    # The first instance uses the original tab, the rest the pooled blank tabs
+                    for tab_num, tab_handle in enumerate(tab_pool):
                         try:
-                            if tab_num == 0:
-                                # Use original tab for first instance
-                                tab_handle = original_tab
-                                main_driver.switch_to.window(original_tab)
-                            else:
-                                # FORCE new tab creation
-                                self.tester.log(f"Creating tab {tab_num + 1} of {max_workers}")
-                                main_driver.execute_script("window.open('', '_blank');")
-                                
-                                # Wait for tab to be created
-                                time.sleep(1)
-                                
-                                # Get the new tab handle
-                                all_handles = main_driver.window_handles
-                                tab_handle = all_handles[-1]
-                                
-                                self.tester.log(f"New tab created, switching to tab {tab_num + 1}")
-                                main_driver.switch_to.window(tab_handle)
+                            main_driver.switch_to.window(tab_handle)
                             
-                            # Record start time for this instance
+                            # Record start time for this instance (wall clock for the report,
+                            # monotonic counter for the interval)
                             start_time = time.time()
+                            start_ns = time.perf_counter_ns()
                             
-                            # Start loading the SAME dashboard in this tab
-                            dashboard_url = f"{self.tester.base_url}/superset/dashboard/{dashboard_id}/"
-                            
+                            # The page records its own ready time, so start the load without
+                            # waiting for it and let the tabs load side by side
                             self.tester.log(f"Tab {tab_num + 1}: Starting parallel load of dashboard {dashboard_id}")
-                            main_driver.get(dashboard_url)
+                            main_driver.execute_script("window.location.href = arguments[0];", dashboard_url)
                             
                             tab_info.append({
                                 'tab_handle': tab_handle,
                                 'dashboard_id': dashboard_id,
                                 'start_time': start_time,
+                                'start_ns': start_ns,
                                 'tab_number': tab_num + 1,
                                 'round': round_num + 1,
                                 'parallel_instance': tab_num + 1
                             })
                             
-                            # Brief pause between tab creation
-                            time.sleep(0.5)
-                            
                         except Exception as e:
-                            self.tester.log(f"Error creating tab {tab_num + 1} for dashboard {dashboard_id}: {str(e)}")
+                            self.tester.log(f"Error starting tab {tab_num + 1} for dashboard {dashboard_id}: {str(e)}")
                             continue
                     
                     self.tester.log(f"STEP 1 COMPLETE: Actually started {len(tab_info)} parallel instances of dashboard {dashboard_id}")
@@ -230,44 +576,41 @@ class Scenarios:
                     current_handles = main_driver.window_handles
                     self.tester.log(f"Browser now has {len(current_handles)} total tabs")
                     
-                    # STEP 2: Monitor each tab for completion
+                    # STEP 2: Poll every tab until each page reports its dashboard ready
                     self.tester.log("STEP 2: Monitoring parallel load completion...")
                     
+                    load_times = {}
+                    pending = list(tab_info)
+                    deadline = time.perf_counter() + 90
+                    while pending and time.perf_counter() < deadline:
+                        for tab_data in list(pending):
+                            try:
+                                main_driver.switch_to.window(tab_data['tab_handle'])
+                                # Only the document of this round's navigation counts
+                                ready_seconds = self.tester.dashboard_ready_seconds(
+                                    main_driver, dashboard_url, tab_data['start_time'])
+                            except Exception as e:
+                                self.tester.log(f"Error checking dashboard {dashboard_id} instance {tab_data['parallel_instance']}: {str(e)}")
+                                pending.remove(tab_data)
+                                continue
+                            if ready_seconds is not None:
+                                load_times[tab_data['tab_number']] = ready_seconds
+                                pending.remove(tab_data)
+                        if pending:
+                            time.sleep(0.25)
+                    
                     for tab_data in tab_info:
                         try:
-                            # Switch to this tab
-                            self.tester.log(f"Switching to tab {tab_data['tab_number']} for dashboard {dashboard_id}")
                             main_driver.switch_to.window(tab_data['tab_handle'])
                             
-                            # Wait for dashboard to load
-                            load_success = False
-                            try:
-                                WebDriverWait(main_driver, 60).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, 
-                                        ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
-                                )
-                                
-                                # Wait for loading indicators to disappear
-                                try:
-                                    loading_indicators = main_driver.find_elements(By.CSS_SELECTOR, ".loading, .loading-spinner, .spinner")
-                                    if loading_indicators:
-                                        WebDriverWait(main_driver, 30).until_not(
-                                            EC.presence_of_element_located((By.CSS_SELECTOR, ".loading, .loading-spinner, .spinner"))
-                                        )
-                                except:
-                                    pass
-                                
-                                # Additional stability wait
-                                time.sleep(3)
-                                load_success = True
-                                
-                            except TimeoutException:
+                            load_success = tab_data['tab_number'] in load_times
+                            if load_success:
+                                load_time = load_times[tab_data['tab_number']]
+                            else:
                                 self.tester.log(f"Dashboard {dashboard_id} instance {tab_data['parallel_instance']} timed out")
-                                load_success = False
-                            
-                            # Record end time
-                            end_time = time.time()
-                            load_time = end_time - tab_data['start_time']
+                                load_time = (time.perf_counter_ns() - tab_data['start_ns']) / 1e9
+                            started = datetime.datetime.fromtimestamp(tab_data['start_time'])
+                            ended = started + datetime.timedelta(seconds=load_time)
                             
                             if load_success:
                                 # Count charts
@@ -280,11 +623,11 @@ class Scenarios:
                             # Create result with parallel instance info
                             result = {
                                 'Dashboard ID': dashboard_id,
-                                'Start Time': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(tab_data['start_time'])),
-                                'End Time': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time)),
+                                'Start Time': started.strftime("%Y-%m-%d %H:%M:%S"),
+                                'End Time': ended.strftime("%Y-%m-%d %H:%M:%S"),
                                 'Load Time (seconds)': round(load_time, 2),
-                                'Date': time.strftime("%Y-%m-%d", time.localtime(tab_data['start_time'])),
-                                'Timestamp': time.strftime("%H:%M:%S", time.localtime(tab_data['start_time'])),
+                                'Date': started.strftime("%Y-%m-%d"),
+                                'Timestamp': started.strftime("%H:%M:%S"),
                                 'Chart Count': chart_count,
                                 'Round': tab_data['round'],
                                 'Parallel Instance': tab_data['parallel_instance'],
@@ -294,29 +637,22 @@ class Scenarios:
                             }
                             
                             all_results.append(result)
+                            self.tester.record_result(result)
                             self.tester.log(f"✓ Dashboard {dashboard_id} Instance {tab_data['parallel_instance']}: {load_time:.2f}s, {chart_count} charts")
                             
                         except Exception as e:
                             self.tester.log(f"Error measuring dashboard {dashboard_id} instance {tab_data.get('parallel_instance', '?')}: {str(e)}")
                             continue
                     
-                    # STEP 3: Close extra tabs (keep original)
-                    self.tester.log("STEP 3: Cleaning up extra tabs...")
+                    # STEP 3: Blank the extra tabs (keep them open for the next round)
+                    self.tester.log("STEP 3: Resetting extra tabs...")
                     
-                    tabs_to_close = []
-                    for tab_data in tab_info:
-                        if tab_data['tab_handle'] != original_tab:
-                            tabs_to_close.append(tab_data['tab_handle'])
-                    
-                    self.tester.log(f"Will close {len(tabs_to_close)} extra tabs")
-                    
-                    for tab_handle in tabs_to_close:
+                    for tab_handle in tab_pool[1:]:
                         try:
                             main_driver.switch_to.window(tab_handle)
-                            main_driver.close()
-                            self.tester.log("Closed extra tab")
+                            main_driver.get("about:blank")
                         except Exception as e:
-                            self.tester.log(f"Error closing tab: {str(e)}")
+                            self.tester.log(f"Error resetting tab: {str(e)}")
                     
                     # Return to original tab
                     try:
@@ -328,8 +664,8 @@ class Scenarios:
                     
                     # Pause between rounds
                     if round_num < iterations_per_dashboard - 1:
-                        self.tester.log("Pausing before next round...")
-                        time.sleep(3)
+                        self.tester.log("Waiting for the browser to settle before next round...")
+                        self.tester.wait_for_network_idle(main_driver)
             
             # Summary
             if all_results:
@@ -358,6 +694,12 @@ class Scenarios:
             self.tester.log(f"ERROR in forced parallel test: {str(e)}")
             import traceback
             traceback.print_exc()
+        finally:
+            if driver_pool is not None:
+                self._close_driver_pool(driver_pool)
+            if tab_pool is not None:
+                self._close_tab_pool(main_driver, tab_pool)
+            tab_pool_slots.close()
         
         self.tester.log(f"=== Completed Scenario 3: {len(all_results)} parallel instances tested ===")
         return all_results
@@ -388,21 +730,23 @@ class Scenarios:
                 return all_results
             
             # Process each dashboard
-            for dashboard_id in dashboard_ids:
+            for dashboard_id in self._existing_dashboards(dashboard_ids):
                 self.tester.log(f"Starting refresh measurements for dashboard {dashboard_id}")
                 
                 # Perform the refresh test
-                refresh_results = self.tester.measure_dashboard_refresh(
-                    driver, 
-                    dashboard_id, 
-                    refresh_count, 
-                    wait_between_refresh
-                )
+                with self._tab_slots_held():
+                    refresh_results = self.tester.measure_dashboard_refresh(
+                        driver, 
+                        dashboard_id, 
+                        refresh_count, 
+                        wait_between_refresh
+                    )
                 
                 # Add scenario info
                 for result in refresh_results:
                     result['Scenario'] = 'Dashboard Refresh'
                     all_results.append(result)
+                    self.tester.record_result(result)
                 
         except Exception as e:
             self.tester.log(f"ERROR in scenario 4: {str(e)}")
@@ -428,6 +772,7 @@ class Scenarios:
         self.tester.log(f"Will refresh each chart {chart_refresh_iterations} times")
         
         all_results = []
+        tab_slot = ExitStack()
         
         try:
             # Get the persistent driver with login already done
@@ -435,19 +780,23 @@ class Scenarios:
             if not driver:
                 self.tester.log("Failed to get persistent driver, aborting test")
                 return all_results
+            
+            if not self._existing_dashboards([dashboard_id]):
+                return all_results
         
             # Use the correct URL path (/superset/ instead of /golgix/)
-            dashboard_url = f"{self.tester.base_url}/superset/dashboard/{dashboard_id}/"
+            dashboard_url = self.tester.dashboard_url(dashboard_id)
             self.tester.log(f"Navigating to dashboard for chart refresh test: {dashboard_url}")
+            # The dashboard stays open for every chart refresh, so it holds its tab slot throughout
+            tab_slot.enter_context(self._tab_slots_held())
             driver.get(dashboard_url)
             
             # Wait for dashboard to fully load
             self.tester.log(f"Waiting for dashboard {dashboard_id} to load...")
-            time.sleep(5)
             
             # Wait for dashboard elements
             try:
-                WebDriverWait(driver, 60).until(
+                WebDriverWait(driver, 60, poll_frequency=WAIT_POLL_SECONDS).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
                 )
                 self.tester.log("Dashboard element found")
@@ -458,32 +807,15 @@ class Scenarios:
             self.tester.wait_for_loading_indicators_to_disappear(driver, 60)
             
             # Additional wait for charts to fully render
-            time.sleep(10)
-            
-            # Find all chart elements - expanded selectors to ensure charts are found
-            chart_selectors = [
-                ".chart-container", 
-                ".dashboard-component-chart",
-                ".slice_container",
-                ".slice-container",
-                ".dashboard-component", 
-                "[data-test='chart-container']",
-                ".dashboard-chart",
-                ".grid-content",
-                ".dashboard__grid-item"
-            ]
-            
-            charts = []
-            for selector in chart_selectors:
-                found_charts = driver.find_elements(By.CSS_SELECTOR, selector)
-                if found_charts:
-                    charts = found_charts
-                    self.tester.log(f"Found {len(charts)} charts using selector: {selector}")
-                    break
+            self.tester.wait_for_network_idle(driver)
             
+            # Find every chart in a single script call
+            discovered = driver.execute_script(DISCOVER_CHARTS_JS, CHART_SELECTORS, MENU_SELECTORS)
+            charts = discovered['charts']
             if not charts:
                 self.tester.log(f"No charts found in dashboard {dashboard_id}")
                 return all_results
+            self.tester.log(f"Found {len(charts)} charts using selector: {discovered['selector']}")
             
             # Refresh each chart the specified number of times
             for i, chart in enumerate(charts):
@@ -497,105 +829,26 @@ class Scenarios:
                     try:
                         # Scroll to make the chart visible
                         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", chart)
-                        time.sleep(1)  # Wait for scroll to complete
+                        self.tester.wait_for_network_idle(driver, timeout=5)  # Let a newly visible chart load
                         
-                        # Find the menu button (three dots) within this chart
-                        # Try multiple selectors to find the menu button
-                        menu_button = None
-                        menu_selectors = [
-                            ".chart-header .dropdown-trigger",
-                            ".dashboard-component-menu-trigger",
-                            ".dashboard-header .dropdown-trigger",
-                            ".chart-controls .dropdown-trigger",
-                            ".more-options",
-                            ".more-button",
-                            ".btn-default", 
-                            ".fa-ellipsis-v",
-                            ".anticon-more",
-                            ".chart-controls .ant-dropdown-trigger",
-                            ".ant-dropdown-trigger"
-                        ]
-                        
-                        for selector in menu_selectors:
-                            try:
-                                # First try to find within this chart
-                                menu_buttons = chart.find_elements(By.CSS_SELECTOR, selector)
-                                if menu_buttons:
-                                    menu_button = menu_buttons[0]
-                                    self.tester.log(f"Found menu button for chart #{chart_index} using selector: {selector}")
-                                    break
-                            except:
-                                # If fails, try at document level (some charts have menu outside the chart container)
-                                continue
-                        
-                        # If menu button not found within chart, try to find it nearby
-                        if not menu_button:
-                            # Get chart position
-                            chart_position = chart.location
-                            chart_size = chart.size
-                            
-                            # Find all menu buttons in the document
-                            all_menu_buttons = []
-                            for selector in menu_selectors:
-                                all_menu_buttons.extend(driver.find_elements(By.CSS_SELECTOR, selector))
-                            
-                            # Find the closest menu button to this chart
-                            closest_button = None
-                            min_distance = float('inf')
-                            
-                            for btn in all_menu_buttons:
-                                btn_position = btn.location
-                                # Calculate distance from button to chart center
-                                distance = ((btn_position['x'] - (chart_position['x'] + chart_size['width']/2))**2 + 
-                                            (btn_position['y'] - (chart_position['y'] + chart_size['height']/2))**2)**0.5
-                                
-                                if distance < min_distance:
-                                    min_distance = distance
-                                    closest_button = btn
-                            
-                            if closest_button and min_distance < 200:  # Only use if reasonably close to chart
-                                menu_button = closest_button
-                                self.tester.log(f"Found closest menu button for chart #{chart_index} at distance {min_distance:.2f}px")
-                        
-                        if not menu_button:
-                            # Alternative: try to find three-dot button using JavaScript
-                            menu_button = driver.execute_script("""
-                                var chart = arguments[0];
-                                var buttons = document.querySelectorAll('button');
-                                
-                                // Find button with three dots (ellipsis) or menu icon
-                                for (var i = 0; i < buttons.length; i++) {
-                                    var btn = buttons[i];
-                                    var rect1 = chart.getBoundingClientRect();
-                                    var rect2 = btn.getBoundingClientRect();
-                                    
-                                    // Check if button is within or near the chart
-                                    var horizontalOverlap = !(rect1.right < rect2.left || rect1.left > rect2.right);
-                                    var verticalOverlap = !(rect1.bottom < rect2.top || rect1.top > rect2.bottom);
-                                    
-                                    // Check button content or class
-                                    if ((horizontalOverlap && verticalOverlap) || 
-                                        (Math.abs(rect1.top - rect2.top) < 50)) {
-                                        if (btn.textContent.includes('...') || 
-                                            btn.className.includes('dropdown') || 
-                                            btn.className.includes('menu') ||
-                                            btn.className.includes('more')) {
-                                            return btn;
-                                        }
-                                    }
-                                }
-                                return null;
-                            """, chart)
+                        # Find the menu button (three dots) now that the chart header has rendered
+                        menu_button = driver.execute_script(DISCOVER_CHARTS_JS, CHART_SELECTORS, MENU_SELECTORS, chart)['menu']
                         
                         if menu_button:
                             # Record start time before clicking menu
                             start_time = datetime.datetime.now()
                             start_time_str = start_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+                            start_ns = time.perf_counter_ns()
                             
                             # Click the menu button
                             menu_button.click()
                             self.tester.log(f"Clicked menu button for chart #{chart_index}")
-                            time.sleep(1)  # Wait for dropdown to appear
+                            # Wait for dropdown to appear
+                            try:
+                                WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_SECONDS).until(EC.visibility_of_element_located(
+                                    (By.CSS_SELECTOR, ".ant-dropdown, .dropdown-menu")))
+                            except TimeoutException:
+                                self.tester.log(f"No dropdown menu appeared for chart #{chart_index}")
                             
                             # Look for "Force refresh" option in the menu
                             force_refresh_found = False
@@ -681,9 +934,6 @@ class Scenarios:
                                 self.tester.log(f"Could not find any way to refresh chart #{chart_index}, skipping")
                                 continue
                             
-                            # Wait for the chart to refresh
-                            time.sleep(2)  # Initial wait
-                            
                             # Wait for loading indicator to appear and disappear for this chart
                             try:
                                 # First wait for loading indicator to appear (confirms refresh started)
@@ -710,14 +960,14 @@ class Scenarios:
                                 time.sleep(15)  # Reasonable wait for chart refresh
                             
                             # Additional wait to ensure chart has fully rendered
-                            time.sleep(5)
+                            self.tester.wait_for_network_idle(driver)
                             
                             # Record end time
                             end_time = datetime.datetime.now()
                             end_time_str = end_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
                             
                             # Calculate refresh time
-                            refresh_time_seconds = (end_time - start_time).total_seconds()
+                            refresh_time_seconds = (time.perf_counter_ns() - start_ns) / 1e9
                             
                             self.tester.log(f"Chart #{chart_index} refreshed in {refresh_time_seconds:.2f} seconds")
                             
@@ -734,6 +984,7 @@ class Scenarios:
                             }
                             
                             all_results.append(result)
+                            self.tester.record_result(result)
                             
                         else:
                             self.tester.log(f"Could not find menu button for chart #{chart_index}, skipping")
@@ -747,24 +998,70 @@ class Scenarios:
                     if iteration < chart_refresh_iterations - 1:
                         time.sleep(wait_between_refresh)
                 
-                # Wait a bit before moving to the next chart
-                time.sleep(2)
+                # Let the page settle before moving to the next chart
+                self.tester.wait_for_network_idle(driver)
                 
         except Exception as e:
             self.tester.log(f"ERROR in chart refresh test for dashboard {dashboard_id}: {str(e)}")
             import traceback
             traceback.print_exc()
+        finally:
+            tab_slot.close()
         
         self.tester.log(f"=== Completed Scenario 5: {len(all_results)} measurements collected ===")
         return all_results
     
     
-    def run_all_scenarios(self, dashboards_config):
+    def _run_scenarios_concurrently(self, dashboards_config, max_tabs):
+        """
+        Run the enabled scenarios at the same time
+        
+        Each scenario gets its own tester (and so its own browser) that reuses
+        this tester's login session. A shared semaphore caps the number of
+        dashboard tabs open across all of them.
+        
+        Args:
+            dashboards_config: Dictionary with scenario configuration
+            max_tabs: Maximum number of dashboard tabs open at once
+            
+        Returns:
+            dict: Results keyed by scenario name
+        """
+        tab_slots = threading.BoundedSemaphore(max_tabs)
+        enabled = [key for key in CONCURRENT_SCENARIOS if dashboards_config.get(key, {}).get('enabled', False)]
+        if not enabled:
+            return {}
+        
+        # Log in once up front so every concurrent browser can reuse the session cookies
+        if not self.tester.get_persistent_driver():
+            self.tester.log("Failed to get persistent driver, not starting concurrent scenarios")
+            return {}
+        
+        def run_one(key):
+            config = dict(dashboards_config[key])
+            tester = self.tester.fork()
+            try:
+                # A single scenario must never need more slots than exist
+                return Scenarios(tester, tab_slots, max_tabs).run_all_scenarios({key: config})
+            finally:
+                if tester.persistent_driver:
+                    tester.persistent_driver.quit()
+        
+        self.tester.log(f"Running {', '.join(enabled)} concurrently with at most {max_tabs} open tabs")
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(enabled)) as executor:
+            for scenario_results in executor.map(run_one, enabled):
+                results.update(scenario_results)
+        return results
+    
+    def run_all_scenarios(self, dashboards_config, concurrent=False, max_tabs=12):
         """
         Run all scenarios with the given dashboard configuration
         
         Args:
             dashboards_config: Dictionary with scenario configuration
+            concurrent: Run the enabled scenarios at the same time instead of one after another
+            max_tabs: Maximum number of dashboard tabs open at once when concurrent is True
             
         Returns:
             dict: Dictionary with results from all scenarios
@@ -772,14 +1069,21 @@ class Scenarios:
         all_results = {}
         
         try:
+            if concurrent:
+                all_results.update(self._run_scenarios_concurrently(dashboards_config, max_tabs))
+                # Anything not run concurrently runs one after another below
+                dashboards_config = {key: config for key, config in dashboards_config.items()
+                                     if key not in CONCURRENT_SCENARIOS}
+            
             # Scenario 1: Single dashboard, multiple iterations
             if dashboards_config.get('scenario_1', {}).get('enabled', False):
                 self.tester.log("Running Scenario 1 (enabled)")
                 config = dashboards_config['scenario_1']
                 dashboard_id = config['dashboard_id']
                 iterations = config['iterations']
+                warmup = config.get('warmup', 0)
                 
-                results = self.scenario_1_single_dashboard(dashboard_id, iterations)
+                results = self.scenario_1_single_dashboard(dashboard_id, iterations, warmup)
                 all_results['Scenario 1'] = results
             else:
                 self.tester.log("Skipping Scenario 1 (disabled)")
@@ -790,8 +1094,11 @@ class Scenarios:
                 config = dashboards_config['scenario_2']
                 dashboard_ids = config['dashboard_ids']
                 iterations_per_dashboard = config['iterations_per_dashboard']
+                parallel = config.get('parallel', False)
+                max_workers = config.get('max_workers', 1)
+                warmup = config.get('warmup', 0)
                 
-                results = self.scenario_2_sequential_dashboards(dashboard_ids, iterations_per_dashboard)
+                results = self.scenario_2_sequential_dashboards(dashboard_ids, iterations_per_dashboard, parallel, max_workers, warmup)
                 all_results['Scenario 2'] = results
             else:
                 self.tester.log("Skipping Scenario 2 (disabled)")
@@ -803,8 +1110,11 @@ class Scenarios:
                 dashboard_ids = config['dashboard_ids']
                 iterations_per_dashboard = config['iterations_per_dashboard']
                 max_workers = config.get('max_workers', 5)
+                warmup = config.get('warmup', 0)
+                separate_browsers = config.get('separate_browsers', False)
                 
-                results = self.scenario_3_parallel_dashboards(dashboard_ids, iterations_per_dashboard, max_workers)
+                results = self.scenario_3_parallel_dashboards(dashboard_ids, iterations_per_dashboard, max_workers, warmup,
+                                                              separate_browsers)
                 all_results['Scenario 3'] = results
             else:
                 self.tester.log("Skipping Scenario 3 (disabled)")
@@ -835,6 +1145,9 @@ class Scenarios:
             else:
                 self.tester.log("Skipping Scenario 5 (disabled)")
             
+            # Keep the Excel sheets in scenario order
+            all_results = dict(sorted(all_results.items()))
+            
         except Exception as e:
             self.tester.log(f"ERROR in run_all_scenarios: {str(e)}")
             import traceback
@@ -30,7 +30,8 @@ build_options = {
         'config.py',
         'superset_performance_tester.py',
         'scenarios.py',
-        'ui_connector.py'
+        'ui_connector.py',
+        'fast_xlsx.py'
     ],
     'zip_include_packages': ['*'],
     'zip_exclude_packages': []
@@ -77,7 +78,8 @@ a = Analysis(
         ('config.py', '.'),
         ('superset_performance_tester.py', '.'),
         ('scenarios.py', '.'),
-        ('ui_connector.py', '.')
+        ('ui_connector.py', '.'),
+        ('fast_xlsx.py', '.')
     ],
     hiddenimports=[
         'PyQt5.QtCore',
@@ -6,8 +6,14 @@ Contains the core functionality for testing Superset dashboard performance
 import time
 import datetime
 import os
+import copy
+import json
+import socket
 import traceback
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import requests
+from openpyxl import Workbook
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,8 +21,36 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
 
+from config import BROWSER_CONFIG, DASHBOARD_PATH_TEMPLATE, WAIT_POLL_SECONDS, get_log_dir
+
+class _ReattachedChrome(webdriver.Remote):
+    """Remote driver that attaches to a running chromedriver session instead of starting one"""
+    
+    def __init__(self, driver):
+        self._reattach_session_id = driver.session_id
+        # Holding the original service keeps chromedriver running while this driver is used
+        self.service = getattr(driver, 'service', None)
+        super().__init__(command_executor=driver.command_executor._url, options=webdriver.ChromeOptions())
+        self.command_executor._commands["executeCdpCommand"] = ("POST", "/session/$sessionId/goog/cdp/execute")
+    
+    def start_session(self, *args, **kwargs):
+        # Skip the POST /session handshake and reuse the existing browser
+        self.session_id = self._reattach_session_id
+        self.caps = {"browserName": "chrome"}
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        """Run a Chrome DevTools Protocol command, like webdriver.Chrome.execute_cdp_cmd"""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+    
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            if self.service is not None:
+                self.service.stop()
+
 class SupersetPerformanceTester:
-    def __init__(self, base_url, username, password, output_file="dashboard_performance.xlsx", log_dir="logs"):
+    def __init__(self, base_url, username, password, output_file="dashboard_performance.xlsx", log_dir=None):
         """
         Initialize the performance testing framework
         
@@ -25,14 +59,24 @@ class SupersetPerformanceTester:
             username (str): Username for Superset login
             password (str): Password for Superset login
             output_file (str): Path to Excel file for storing results
-            log_dir (str): Directory for storing log files
+            log_dir (str): Directory for storing log files (defaults to config.LOG_DIR)
         """
         self.base_url = base_url
+        self.dashboard_url_template = base_url.rstrip('/') + DASHBOARD_PATH_TEMPLATE
+        self._host_resolver_rule = None  # Resolved lazily by the first create_driver call
         self.username = username
         self.password = password
         self.output_file = output_file
         self.persistent_driver = None  # Shared driver for all tests
-        self.log_dir = log_dir
+        self.log_dir = log_dir if log_dir else get_log_dir()
+        
+        # Cookies of the first successful login, shared with every later browser
+        # and with plain HTTP calls so nobody has to go through SSO again
+        self.http_session = requests.Session()
+        self.session_cookies = []
+        self._dashboard_id_cache = {}
+        self._cdp_metric_sessions = set()  # Driver sessions with the CDP Performance domain enabled
+        self._ready_watch_tabs = set()  # (session, window handle) pairs with the ready marker installed
         
         # Create directories if they don't exist
         os.makedirs(self.log_dir, exist_ok=True)
@@ -42,6 +86,9 @@ class SupersetPerformanceTester:
         with open(self.log_file, "w") as f:
             f.write(f"Superset Performance Test started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"Base URL: {base_url}\n")
+        
+        # Every measurement is appended here as soon as it is taken
+        self.results_file = os.path.splitext(self.log_file)[0] + "_results.jsonl"
     
     def log(self, message):
         """Log a message to both console and log file"""
@@ -50,24 +97,147 @@ class SupersetPerformanceTester:
         print(log_message)
         with open(self.log_file, "a") as f:
             f.write(log_message + "\n")
+    
+    def record_result(self, measurement):
+        """Append one measurement to the results file so a crash mid-run keeps it"""
+        with open(self.results_file, "a") as f:
+            f.write(json.dumps(measurement, default=str) + "\n")
+    
+    def fork(self):
+        """
+        Return a tester for another thread that shares this one's session but not its browser
+        
+        The copy reuses the login cookies, HTTP session, log file and caches, and
+        creates its own persistent driver on first use.
+        """
+        forked = copy.copy(self)
+        forked.persistent_driver = None
+        forked._cdp_metric_sessions = set()
+        forked._ready_watch_tabs = set()
+        return forked
+    
+    def dashboard_url(self, dashboard_id):
+        """Return the page URL of a dashboard ID or slug"""
+        return self.dashboard_url_template.format(id=dashboard_id)
             
-    def create_driver(self, headless=False):
-        """Create and return a WebDriver instance"""
+    def get_host_resolver_rule(self):
+        """
+        Resolve the Superset host once and return a Chrome host resolver rule for it
+        
+        Returns:
+            str: "MAP host ip" rule, or an empty string if the host could not be resolved
+        """
+        if self._host_resolver_rule is None:
+            host = urlparse(self.base_url).hostname
+            try:
+                ip = socket.gethostbyname(host)
+                self._host_resolver_rule = f"MAP {host} {ip}"
+                self.log(f"Pinned {host} to {ip} for all browsers")
+            except (socket.gaierror, TypeError) as e:
+                self.log(f"Could not pre-resolve {host}, browsers will use normal DNS: {str(e)}")
+                self._host_resolver_rule = ""
+        return self._host_resolver_rule
+    
+    def create_driver(self, headless=None):
+        """
+        Create and return a WebDriver instance
+        
+        Args:
+            headless (bool): Run Chrome without a visible window. Defaults to
+                BROWSER_CONFIG['headless'] when not given.
+        """
+        if headless is None:
+            headless = BROWSER_CONFIG.get('headless', False)
+        width, height = BROWSER_CONFIG.get('window_size', (1920, 1080))
+        
         options = webdriver.ChromeOptions()
         options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        #if headless:
-            #options.add_argument("--headless")
+        # Keep the same viewport in headless mode so dashboard layout matches a normal run
+        options.add_argument(f"--window-size={width},{height}")
+        # Run the network service in the browser process; with a normal (not incognito)
+        # profile the HTTP/2 connections to Superset are then reused across iterations
+        options.add_argument("--enable-features=NetworkServiceInProcess")
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+        if BROWSER_CONFIG.get('pin_dns', False):
+            # Every browser reuses the same address instead of resolving the host itself
+            host_rule = self.get_host_resolver_rule()
+            if host_rule:
+                options.add_argument(f"--host-resolver-rules={host_rule}")
+        if BROWSER_CONFIG.get('disable_images', False):
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
         
         driver = webdriver.Chrome(options=options)
+        self.block_urls(driver)
+        self.track_pending_requests(driver)
         return driver
     
+    def track_pending_requests(self, driver):
+        """
+        Make every page later loaded in the current tab count its in-flight fetch/XHR requests
+        
+        wait_for_network_idle reads the count from window.__pendingRequests. Like
+        block_urls, this applies to one tab, so call it again for newly opened tabs.
+        """
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": """
+                (function () {
+                    if (window.__pendingRequests !== undefined) { return; }
+                    window.__pendingRequests = 0;
+                    
+                    function finished() {
+                        window.__pendingRequests = Math.max(0, window.__pendingRequests - 1);
+                    }
+                    
+                    var originalFetch = window.fetch;
+                    if (originalFetch) {
+                        window.fetch = function () {
+                            window.__pendingRequests++;
+                            return originalFetch.apply(this, arguments).then(
+                                function (response) { finished(); return response; },
+                                function (error) { finished(); throw error; });
+                        };
+                    }
+                    
+                    var originalSend = XMLHttpRequest.prototype.send;
+                    XMLHttpRequest.prototype.send = function () {
+                        window.__pendingRequests++;
+                        this.addEventListener('loadend', finished, {once: true});
+                        return originalSend.apply(this, arguments);
+                    };
+                })();
+            """})
+        except Exception as e:
+            self.log(f"Could not install the pending request counter: {str(e)}")
+    
+    def block_urls(self, driver):
+        """
+        Stop the current tab from requesting BROWSER_CONFIG['blocked_urls']
+        
+        DevTools network settings apply per tab, so call this again after
+        switching to a newly opened tab.
+        """
+        patterns = BROWSER_CONFIG.get('blocked_urls')
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        except Exception as e:
+            self.log(f"Could not block non-essential URLs: {str(e)}")
+    
     def get_persistent_driver(self):
         """Get or create a persistent driver and ensure login"""
         if self.persistent_driver is None:
             self.persistent_driver = self.create_driver()
             # Try to login
-            if not self.login(self.persistent_driver):
+            if not self.authenticate_driver(self.persistent_driver):
                 self.log("ERROR: Failed to login with persistent driver")
                 self.persistent_driver.quit()
                 self.persistent_driver = None
@@ -75,6 +245,196 @@ class SupersetPerformanceTester:
         
         return self.persistent_driver
     
+    def cache_session(self, driver):
+        """Remember the login cookies of an authenticated driver"""
+        try:
+            self.session_cookies = driver.get_cookies()
+        except Exception as e:
+            self.log(f"Could not read session cookies: {str(e)}")
+            return
+        
+        self.http_session.cookies.clear()
+        for cookie in self.session_cookies:
+            self.http_session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        self.log(f"Cached {len(self.session_cookies)} session cookies")
+    
+    def restore_session(self, driver):
+        """
+        Log a driver in by copying the cached session cookies into it
+        
+        Returns:
+            bool: True if the browser ended up on an authenticated page
+        """
+        if not self.session_cookies:
+            return False
+        
+        try:
+            # Cookies can only be added for the domain the browser is currently on
+            driver.get(f"{self.base_url}/login/")
+            for cookie in self.session_cookies:
+                cookie = {k: v for k, v in cookie.items() if k in ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry')}
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            
+            driver.get(f"{self.base_url}/superset/welcome/")
+            if "/login/" in driver.current_url:
+                self.log("Cached session was rejected, falling back to full login")
+                return False
+            
+            self.log("Reused cached session cookies, skipped SSO login")
+            return True
+        except Exception as e:
+            self.log(f"Could not restore cached session: {str(e)}")
+            return False
+    
+    def resolve_dashboard_id(self, id_or_slug):
+        """
+        Resolve a dashboard slug to its numeric ID through the Superset API
+        
+        Each dashboard is looked up once per tester; later calls are served from memory.
+        
+        Args:
+            id_or_slug: Numeric dashboard ID or dashboard slug
+            
+        Returns:
+            str: Numeric dashboard ID, the input unchanged if the API could not be
+                 used, or None if Superset reports that the dashboard does not exist
+        """
+        key = str(id_or_slug)
+        if key in self._dashboard_id_cache:
+            return self._dashboard_id_cache[key]
+        
+        resolved = key
+        try:
+            response = self.http_session.get(f"{self.base_url}/api/v1/dashboard/{key}", timeout=30)
+            if response.status_code == 200:
+                resolved = str(response.json()['result']['id'])
+            elif response.status_code == 404:
+                resolved = None
+            else:
+                self.log(f"Could not resolve dashboard {key} (API returned {response.status_code})")
+        except Exception as e:
+            self.log(f"Could not resolve dashboard {key}: {str(e)}")
+        
+        if resolved != key:
+            self.log(f"Resolved dashboard {key} -> {resolved}")
+        self._dashboard_id_cache[key] = resolved
+        return resolved
+    
+    def probe_dashboard(self, dashboard_id):
+        """
+        Ask the Superset API whether a dashboard exists
+        
+        Args:
+            dashboard_id: ID or slug of the dashboard
+            
+        Returns:
+            dict: 'status_code' of the dashboard lookup (None if the request failed)
+        """
+        probe = {'status_code': None}
+        try:
+            response = self.http_session.get(f"{self.base_url}/api/v1/dashboard/{dashboard_id}", timeout=30)
+            probe['status_code'] = response.status_code
+        except Exception as e:
+            self.log(f"Could not probe dashboard {dashboard_id}: {str(e)}")
+        return probe
+    
+    def probe_dashboards(self, dashboard_ids, max_workers=8):
+        """
+        Probe several dashboards through the API at once
+        
+        The lookups only wait on the server, so they share the pooled HTTP
+        session across a few threads instead of running one after another.
+        
+        Args:
+            dashboard_ids: IDs or slugs of the dashboards
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            dict: Probe result of probe_dashboard keyed by dashboard ID
+        """
+        dashboard_ids = list(dashboard_ids)
+        if not dashboard_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(dashboard_ids))) as executor:
+            probes = list(executor.map(self.probe_dashboard, dashboard_ids))
+        return dict(zip(dashboard_ids, probes))
+    
+    def authenticate_driver(self, driver):
+        """Log a driver in, reusing the cached session when there is one"""
+        if self.restore_session(driver):
+            return True
+        
+        if not self.login(driver):
+            return False
+        
+        self.cache_session(driver)
+        return True
+    
+    def is_driver_alive(self, driver):
+        """Return True if the browser behind the driver still responds"""
+        if driver is None:
+            return False
+        try:
+            driver.current_url  # Cheap round trip to chromedriver
+            return True
+        except Exception:
+            return False
+    
+    def reconnect_driver(self):
+        """
+        Reattach to the persistent driver's browser session over a new connection
+        
+        Recovers from a broken connection to chromedriver without restarting
+        Chrome or logging in again.
+        
+        Returns:
+            WebDriver: The reattached driver, or None if the browser session is gone
+        """
+        driver = self.persistent_driver
+        if driver is None or driver.session_id is None:
+            return None
+        try:
+            reattached = _ReattachedChrome(driver)
+        except Exception as e:
+            self.log(f"Could not reattach to browser session: {str(e)}")
+            return None
+        if not self.is_driver_alive(reattached):
+            return None
+        self.persistent_driver = reattached
+        self.log("Reattached to the existing browser session")
+        return reattached
+    
+    def recover_driver_session(self):
+        """Reattach to the persistent driver, or replace it with a fresh, logged-in one"""
+        self.log("Recovering browser session...")
+        reattached = self.reconnect_driver()
+        if reattached is not None:
+            return reattached
+        if self.persistent_driver is not None:
+            try:
+                self.persistent_driver.quit()
+            except Exception:
+                pass
+            self.persistent_driver = None
+        return self.get_persistent_driver()
+    
+    def reset_driver_state(self, driver):
+        """
+        Clear per-page browser state between iterations without restarting Chrome
+        
+        Cookies are kept so the SSO session survives; only local/session storage
+        is cleared so every iteration starts from the same client-side state.
+        The HTTP cache and open connections are deliberately left alone, so later
+        iterations do not pay for new TLS handshakes to the Superset host.
+        """
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception as e:
+            self.log(f"Could not reset browser storage: {str(e)}")
+    
     def open_new_tab(self, driver):
         """Open a new tab in the browser and return its handle"""
         # Execute JavaScript to open a new tab
@@ -326,8 +686,8 @@ class SupersetPerformanceTester:
             int: Number of charts in the dashboard
         """
         try:
-            # Wait for charts to be visible
-            time.sleep(2)
+            # Give the charts up to 2 s to finish rendering
+            self.wait_for_network_idle(driver, timeout=2)
             
             # Different CSS selectors to try for finding chart elements
             chart_selectors = [
@@ -336,25 +696,14 @@ class SupersetPerformanceTester:
                 ".slice_container",
                 ".slice-container",
                 ".slice-cell",
-                ".grid-container .chart"
+                ".grid-container .chart",
+                # Fall back to any visualization element
+                "[data-test='dashboard-component-chart']"
             ]
             
-            chart_count = 0
-            
-            # Try each selector
-            for selector in chart_selectors:
-                charts = driver.find_elements(By.CSS_SELECTOR, selector)
-                if charts:
-                    chart_count = len(charts)
-                    self.log(f"Found {chart_count} charts using selector: {selector}")
-                    break
-            
-            # If no charts found, try an alternate approach
-            if chart_count == 0:
-                # Look for any visualization elements
-                viz_elements = driver.find_elements(By.CSS_SELECTOR, "[data-test='dashboard-component-chart']")
-                chart_count = len(viz_elements)
-                self.log(f"Found {chart_count} charts using data-test attribute")
+            selector, charts = self.find_first_matching(driver, chart_selectors)
+            chart_count = len(charts)
+            self.log(f"Found {chart_count} charts using selector: {selector}")
             
             return chart_count
             
@@ -362,6 +711,29 @@ class SupersetPerformanceTester:
             self.log(f"ERROR counting charts: {str(e)}")
             return 0
     
+    def find_first_matching(self, driver, selectors):
+        """
+        Return the elements of the first selector that matches, in one browser round trip
+        
+        Args:
+            driver: WebDriver instance
+            selectors: CSS selectors in order of preference
+            
+        Returns:
+            tuple: (selector, elements), or (None, []) if nothing matched
+        """
+        selector, elements = driver.execute_script("""
+            var selectors = arguments[0];
+            for (var i = 0; i < selectors.length; i++) {
+                var elements = document.querySelectorAll(selectors[i]);
+                if (elements.length) {
+                    return [selectors[i], Array.prototype.slice.call(elements)];
+                }
+            }
+            return [null, []];
+        """, list(selectors))
+        return selector, elements
+    
     def find_chart_elements(self, driver):
         """
         Find all chart elements in the current dashboard
@@ -382,22 +754,13 @@ class SupersetPerformanceTester:
                 ".slice_container",
                 ".slice-container",
                 ".slice-cell",
-                ".grid-container .chart"
+                ".grid-container .chart",
+                # Data attribute used when none of the conventional selectors match
+                "[data-test='dashboard-component-chart']"
             ]
             
-            # Try each selector
-            for selector in chart_selectors:
-                chart_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if chart_elements:
-                    self.log(f"Found {len(chart_elements)} charts using selector: {selector}")
-                    charts = chart_elements
-                    break
-            
-            # If no charts found by conventional selectors, try using data attributes
-            if not charts:
-                chart_elements = driver.find_elements(By.CSS_SELECTOR, "[data-test='dashboard-component-chart']")
-                self.log(f"Found {len(chart_elements)} charts using data-test attribute")
-                charts = chart_elements
+            selector, charts = self.find_first_matching(driver, chart_selectors)
+            self.log(f"Found {len(charts)} charts using selector: {selector}")
             
             # If we still don't have any charts, look for any visualization elements
             if not charts:
@@ -417,6 +780,134 @@ class SupersetPerformanceTester:
             self.log(f"ERROR finding chart elements: {str(e)}")
             return []
     
+    def enable_browser_metrics(self, driver):
+        """Turn on Chrome's DevTools performance metrics once per driver session"""
+        session_id = getattr(driver, 'session_id', None)
+        if session_id in self._cdp_metric_sessions:
+            return
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            self._cdp_metric_sessions.add(session_id)
+        except Exception as e:
+            self.log(f"DevTools performance metrics not available: {str(e)}")
+    
+    def collect_browser_metrics(self, driver):
+        """
+        Read the browser's own page timings in a single DevTools round trip
+        
+        Args:
+            driver: WebDriver instance that has just loaded a page
+            
+        Returns:
+            dict: Extra result columns, empty if the metrics could not be read
+        """
+        if getattr(driver, 'session_id', None) not in self._cdp_metric_sessions:
+            return {}
+        
+        try:
+            response = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except Exception as e:
+            self.log(f"Could not read DevTools performance metrics: {str(e)}")
+            return {}
+        
+        metrics = {m['name']: m['value'] for m in response.get('metrics', [])}
+        navigation_start = metrics.get('NavigationStart', 0)
+        browser_metrics = {}
+        
+        # Timestamps are monotonic seconds; only report the ones this navigation produced
+        for name, column in (('DomContentLoaded', 'DOM Content Loaded (seconds)'),
+                             ('FirstMeaningfulPaint', 'First Meaningful Paint (seconds)')):
+            value = metrics.get(name, 0)
+            if navigation_start and value > navigation_start:
+                browser_metrics[column] = round(value - navigation_start, 3)
+        
+        if 'JSHeapUsedSize' in metrics:
+            browser_metrics['JS Heap Used (MB)'] = round(metrics['JSHeapUsedSize'] / (1024 * 1024), 1)
+        
+        return browser_metrics
+    
+    def watch_dashboard_ready(self, driver):
+        """
+        Make every page later loaded in the current tab record when its dashboard is ready
+        
+        The page itself sets window.__dashboardReadyMs (milliseconds since navigation
+        start) once the dashboard grid is present and no loading indicator is visible,
+        so several tabs can load at once and be read afterwards in any order.
+        
+        Args:
+            driver: WebDriver instance switched to the tab to watch
+            
+        Returns:
+            bool: True if the marker is installed for this tab
+        """
+        tab_key = (getattr(driver, 'session_id', None), driver.current_window_handle)
+        if tab_key in self._ready_watch_tabs:
+            return True
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": """
+                (function () {
+                    if (window.__dashboardReadyWatch) { return; }
+                    window.__dashboardReadyWatch = true;
+                    function isReady() {
+                        if (!document.querySelector('.dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart')) {
+                            return false;
+                        }
+                        var spinners = document.querySelectorAll('.loading, .loading-spinner, .spinner');
+                        for (var i = 0; i < spinners.length; i++) {
+                            if (spinners[i].offsetParent !== null) { return false; }
+                        }
+                        return true;
+                    }
+                    
+                    // Checked synchronously: observer callbacks are microtasks and keep
+                    // running in background tabs, unlike animation frames
+                    function check() {
+                        if (window.__dashboardReadyMs === undefined && isReady()) {
+                            window.__dashboardReadyMs = performance.now();
+                            observer.disconnect();
+                        }
+                    }
+                    
+                    var observer = new MutationObserver(check);
+                    observer.observe(document, {childList: true, subtree: true, attributes: true});
+                    document.addEventListener('DOMContentLoaded', check);
+                })();
+            """})
+            self._ready_watch_tabs.add(tab_key)
+            return True
+        except Exception as e:
+            self.log(f"Could not install dashboard ready marker: {str(e)}")
+            return False
+    
+    def dashboard_ready_seconds(self, driver, dashboard_url=None, started_after=None):
+        """
+        Return how long the page in the current tab took to become ready
+        
+        A navigation started with location.href only commits later, so until then the
+        tab still holds the previous document and its marker. Passing dashboard_url and
+        started_after rejects markers that do not belong to the navigation being timed.
+        
+        Args:
+            driver: WebDriver instance switched to a tab set up by watch_dashboard_ready
+            dashboard_url: Only accept a marker from a document loaded from this URL
+            started_after: Only accept a marker from a navigation started after this
+                wall-clock time (seconds since the epoch)
+            
+        Returns:
+            float: Seconds from navigation start to dashboard ready, or None if not ready yet
+        """
+        ready_ms = driver.execute_script("""
+            var url = arguments[0], startedAfterMs = arguments[1];
+            // The navigation entry keeps the loaded URL even if the app rewrites the address later
+            var nav = performance.getEntriesByType('navigation')[0];
+            if (url && (!nav || nav.name.indexOf(url) !== 0)) { return null; }
+            if (startedAfterMs !== null && performance.timeOrigin < startedAfterMs) { return null; }
+            return window.__dashboardReadyMs === undefined ? null : window.__dashboardReadyMs;
+        """, dashboard_url, None if started_after is None else started_after * 1000)
+        if ready_ms is None:
+            return None
+        return ready_ms / 1000
+    
     def measure_dashboard_load_time(self, driver, dashboard_id):
         """
         Measure the loading time for a specific dashboard
@@ -429,11 +920,13 @@ class SupersetPerformanceTester:
             dict: Data about the load time measurement or None if failed
         """
         try:
-            dashboard_url = f"{self.base_url}/superset/dashboard/{dashboard_id}/"
+            dashboard_url = self.dashboard_url(dashboard_id)
             self.log(f"Navigating to dashboard: {dashboard_url}")
+            self.enable_browser_metrics(driver)
             
             # Record start time
             start_time = datetime.datetime.now()
+            start_ns = time.perf_counter_ns()
             start_time_str = start_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             
             # Load the dashboard
@@ -444,7 +937,7 @@ class SupersetPerformanceTester:
             
             # Wait for dashboard grid or visualization elements to appear
             try:
-                WebDriverWait(driver, 90).until(
+                WebDriverWait(driver, 90, poll_frequency=WAIT_POLL_SECONDS).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
                 )
                 self.log("Dashboard elements found")
@@ -460,7 +953,7 @@ class SupersetPerformanceTester:
                 loading_spinners = driver.find_elements(By.CSS_SELECTOR, ".loading, .loading-spinner, .spinner")
                 if loading_spinners:
                     self.log(f"Found {len(loading_spinners)} loading indicators, waiting for them to disappear...")
-                    WebDriverWait(driver, 60).until(
+                    WebDriverWait(driver, 60, poll_frequency=WAIT_POLL_SECONDS).until(
                         lambda driver: not any(spinner.is_displayed() for spinner in driver.find_elements(By.CSS_SELECTOR, ".loading, .loading-spinner, .spinner"))
                     )
                     self.log("All loading indicators have disappeared")
@@ -471,7 +964,7 @@ class SupersetPerformanceTester:
                 self.log(f"Error while waiting for loading indicators: {str(e)}")
                 # Use JavaScript to check if page is fully loaded
                 try:
-                    WebDriverWait(driver, 30).until(
+                    WebDriverWait(driver, 30, poll_frequency=WAIT_POLL_SECONDS).until(
                         lambda driver: driver.execute_script("return document.readyState") == "complete"
                     )
                     loading_complete = True
@@ -483,9 +976,9 @@ class SupersetPerformanceTester:
             self.log("Checking if charts are fully rendered...")
             charts_loaded = False
             max_chart_wait = 30  # Maximum 30 seconds to wait for charts
-            chart_wait_start = time.time()
+            chart_wait_start = time.perf_counter()
             
-            while (time.time() - chart_wait_start) < max_chart_wait and not charts_loaded:
+            while (time.perf_counter() - chart_wait_start) < max_chart_wait and not charts_loaded:
                 try:
                     # Use JavaScript to check if charts appear to be loaded
                     charts_status = driver.execute_script("""
@@ -511,7 +1004,7 @@ class SupersetPerformanceTester:
                     """)
                     
                     # Consider charts loaded if 80% or more are loaded, or if we have waited long enough
-                    if charts_status['percentage'] >= 80 or (time.time() - chart_wait_start) > 15:
+                    if charts_status['percentage'] >= 80 or (time.perf_counter() - chart_wait_start) > 15:
                         charts_loaded = True
                         self.log(f"Charts loading: {charts_status['loaded']}/{charts_status['total']} ({charts_status['percentage']:.1f}%)")
                     else:
@@ -526,13 +1019,14 @@ class SupersetPerformanceTester:
             end_time_str = end_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             
             # Calculate load time in seconds (this is now the ACTUAL load time)
-            load_time_seconds = (end_time - start_time).total_seconds()
+            load_time_seconds = (time.perf_counter_ns() - start_ns) / 1e9
             
             self.log(f"Dashboard {dashboard_id} ACTUALLY loaded in {load_time_seconds:.2f} seconds")
+            browser_metrics = self.collect_browser_metrics(driver)
             
-            # NOW do any additional waits for stability (these won't affect the measurement)
-            self.log("Additional wait for stability (not included in measurement)...")
-            time.sleep(5)  # Reduced from 15 to 5 seconds
+            # NOW wait for the page to settle (this won't affect the measurement)
+            self.log("Waiting for the page to settle (not included in measurement)...")
+            self.wait_for_network_idle(driver)
             
             # Count the number of charts in this dashboard
             chart_count = self.count_dashboard_charts(driver)
@@ -540,7 +1034,7 @@ class SupersetPerformanceTester:
             self.log(f"Final result: Dashboard {dashboard_id} loaded in {load_time_seconds:.2f} seconds (Charts: {chart_count})")
             
             # Return data about the measurement
-            return {
+            measurement = {
                 'Dashboard ID': dashboard_id,
                 'Start Time': start_time_str,
                 'End Time': end_time_str,
@@ -549,12 +1043,93 @@ class SupersetPerformanceTester:
                 'Timestamp': start_time.strftime("%H:%M:%S"),
                 'Chart Count': chart_count
             }
+            measurement.update(browser_metrics)
+            return measurement
             
         except Exception as e:
             self.log(f"ERROR measuring dashboard {dashboard_id}: {str(e)}")
             traceback.print_exc()
             return None
 
+    def warm_up_dashboard(self, driver, dashboard_id, passes=1):
+        """
+        Load a dashboard without measuring it so Superset's query cache is warm
+        
+        Args:
+            driver: WebDriver instance
+            dashboard_id: ID of the dashboard to load
+            passes: Number of unmeasured loads to perform
+        """
+        dashboard_url = self.dashboard_url(dashboard_id)
+        for i in range(passes):
+            self.log(f"Warmup load {i+1}/{passes} for dashboard {dashboard_id} (not measured)")
+            try:
+                driver.get(dashboard_url)
+                WebDriverWait(driver, 90, poll_frequency=WAIT_POLL_SECONDS).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
+                )
+                self.wait_for_loading_indicators_to_disappear(driver, 60)
+            except Exception as e:
+                self.log(f"Warmup load for dashboard {dashboard_id} did not complete: {str(e)}")
+    
+    def wait_for_network_idle(self, driver, idle_ms=500, timeout=30):
+        """
+        Wait until the page has no requests in flight and has stopped redrawing
+        
+        Resolves as soon as no fetch/XHR request is pending (as counted by
+        track_pending_requests) and no resource has completed and the DOM has not
+        changed for idle_ms, instead of sleeping for a fixed time. Pages loaded
+        before the counter was installed are judged on resources and DOM alone.
+        
+        Args:
+            driver: WebDriver instance
+            idle_ms: Quiet period in milliseconds that counts as idle
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            bool: True if the page went idle, False on timeout or error
+        """
+        previous_timeout = None
+        try:
+            previous_timeout = driver.timeouts.script
+            driver.set_script_timeout(timeout + 5)
+            return bool(driver.execute_async_script("""
+                var idleMs = arguments[0];
+                var timeoutMs = arguments[1];
+                var done = arguments[arguments.length - 1];
+                var started = performance.now();
+                var lastActivity = started;
+                
+                function touch() { lastActivity = performance.now(); }
+                
+                var resources = new PerformanceObserver(touch);
+                resources.observe({type: 'resource'});
+                var mutations = new MutationObserver(touch);
+                mutations.observe(document.body || document.documentElement,
+                                  {childList: true, subtree: true, characterData: true});
+                
+                var timer = setInterval(function () {
+                    var now = performance.now();
+                    if (window.__pendingRequests > 0) { lastActivity = now; }
+                    var idle = now - lastActivity >= idleMs;
+                    if (idle || now - started >= timeoutMs) {
+                        clearInterval(timer);
+                        resources.disconnect();
+                        mutations.disconnect();
+                        done(idle);
+                    }
+                }, 50);
+            """, idle_ms, timeout * 1000))
+        except Exception as e:
+            self.log(f"Error waiting for the page to go idle: {str(e)}")
+            return False
+        finally:
+            if previous_timeout is not None:
+                try:
+                    driver.set_script_timeout(previous_timeout)
+                except Exception:
+                    pass
+    
     # Method 1: Use a custom wait condition instead of invisibility_of_elements_located
     def wait_for_loading_indicators_to_disappear(self, driver, timeout=60):
         """
@@ -566,9 +1141,9 @@ class SupersetPerformanceTester:
             timeout: Maximum time to wait in seconds
         """
         self.log("Checking for loading indicators...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        while time.time() - start_time < timeout:
+        while time.perf_counter() - start_time < timeout:
             try:
                 # Use JavaScript to check for visible loading indicators
                 # This avoids stale element issues by checking in a single operation
@@ -592,7 +1167,7 @@ class SupersetPerformanceTester:
                 """)
                 
                 # Log the count on first pass and periodically
-                if time.time() - start_time < 1 or int(time.time()) % 5 == 0:
+                if time.perf_counter() - start_time < 1 or int(time.time()) % 5 == 0:
                     self.log(f"Found {visible_count['total']} loading indicators, {visible_count['visible']} visible")
                 
                 # If no loading indicators or none are visible, we're done
@@ -629,7 +1204,7 @@ class SupersetPerformanceTester:
             timeout: Maximum time to wait in seconds
         """
         try:
-            WebDriverWait(driver, timeout).until_not(
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_SECONDS).until_not(
                 EC.presence_of_element_located((By.CSS_SELECTOR, 
                     ".loading:not([style*='display: none']), .loading-spinner:not([style*='display: none']), .spinner:not([style*='display: none'])"))
             )
@@ -656,17 +1231,16 @@ class SupersetPerformanceTester:
         
         try:
             # First navigate to the dashboard
-            dashboard_url = f"{self.base_url}/superset/dashboard/{dashboard_id}/"
+            dashboard_url = self.dashboard_url(dashboard_id)
             self.log(f"Initially navigating to dashboard: {dashboard_url}")
             driver.get(dashboard_url)
             
             # Wait for initial dashboard load (not measured)
             self.log(f"Waiting for dashboard {dashboard_id} to initially load...")
-            time.sleep(10)  # Increased initial wait
             
             # Wait for dashboard elements to appear
             try:
-                WebDriverWait(driver, 90).until(  # Increased timeout from 60 to 90 seconds
+                WebDriverWait(driver, 90, poll_frequency=WAIT_POLL_SECONDS).until(  # Increased timeout from 60 to 90 seconds
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
                 )
                 self.log("Dashboard elements found")
@@ -675,7 +1249,7 @@ class SupersetPerformanceTester:
                 
             # Wait for loading indicators to disappear (initial load)
             self.wait_for_loading_indicators_to_disappear(driver, 60)
-            time.sleep(5)  # Stability wait for initial load
+            self.wait_for_network_idle(driver)  # Stability wait for initial load
             
             # Count charts only once
             chart_count = self.count_dashboard_charts(driver)
@@ -686,6 +1260,7 @@ class SupersetPerformanceTester:
                 
                 # Record start time JUST BEFORE clicking refresh
                 start_time = datetime.datetime.now()
+                start_ns = time.perf_counter_ns()
                 start_time_str = start_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
                 
                 # Try the standalone REFRESH button first
@@ -795,9 +1370,6 @@ class SupersetPerformanceTester:
                     webdriver.ActionChains(driver).send_keys(Keys.F5).perform()
                     refresh_clicked = True
                 
-                # Wait for refresh to start
-                time.sleep(2)
-                
                 # Wait for charts to reload and loading indicators to disappear
                 try:
                     # Wait for loading indicators to appear (confirms refresh started)
@@ -816,14 +1388,14 @@ class SupersetPerformanceTester:
                         self.wait_for_loading_indicators_to_disappear(driver, 60)
                     else:
                         # If no loading indicators appeared, wait for charts to be ready
-                        WebDriverWait(driver, 60).until(
+                        WebDriverWait(driver, 60, poll_frequency=WAIT_POLL_SECONDS).until(
                             EC.presence_of_element_located((By.CSS_SELECTOR, ".chart-container, .dashboard-component-chart"))
                         )
                     
                     # Additional check for chart content readiness
                     charts_ready = False
-                    chart_check_start = time.time()
-                    while (time.time() - chart_check_start) < 30 and not charts_ready:  # Max 30 seconds
+                    chart_check_start = time.perf_counter()
+                    while (time.perf_counter() - chart_check_start) < 30 and not charts_ready:  # Max 30 seconds
                         charts_status = driver.execute_script("""
                             var charts = document.querySelectorAll('.chart-container, .dashboard-component-chart');
                             var readyCharts = 0;
@@ -858,12 +1430,12 @@ class SupersetPerformanceTester:
                 end_time_str = end_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
                 
                 # Calculate refresh time
-                refresh_time_seconds = (end_time - start_time).total_seconds()
+                refresh_time_seconds = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 self.log(f"Dashboard {dashboard_id} ACTUALLY refreshed in {refresh_time_seconds:.2f} seconds")
                 
                 # Additional stability wait (not included in measurement)
-                time.sleep(3)
+                self.wait_for_network_idle(driver)
                 
                 # Record this refresh
                 results.append({
@@ -915,6 +1487,7 @@ class SupersetPerformanceTester:
             
             # Record start time
             start_time = datetime.datetime.now()
+            start_ns = time.perf_counter_ns()
             start_time_str = start_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             
             # Look for refresh option in the menu
@@ -923,15 +1496,15 @@ class SupersetPerformanceTester:
             refresh_option.click()
             self.log(f"Clicked refresh option for chart #{index}")
             
-            # Wait for the chart to refresh
-            time.sleep(5)
+            # Wait for the chart's queries to finish and the chart to redraw
+            self.wait_for_network_idle(driver)
             
             # Record end time
             end_time = datetime.datetime.now()
             end_time_str = end_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             
             # Calculate refresh time
-            refresh_time_seconds = (end_time - start_time).total_seconds()
+            refresh_time_seconds = (time.perf_counter_ns() - start_ns) / 1e9
             
             self.log(f"Chart #{index} refreshed in {refresh_time_seconds:.2f} seconds")
             
@@ -955,6 +1528,7 @@ class SupersetPerformanceTester:
                 
                 # Record start time
                 start_time = datetime.datetime.now()
+                start_ns = time.perf_counter_ns()
                 start_time_str = start_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
                 
                 # Use F5 key to refresh
@@ -962,14 +1536,14 @@ class SupersetPerformanceTester:
                 self.log(f"Used F5 key to refresh chart #{index}")
                 
                 # Wait for refresh
-                time.sleep(5)
+                self.wait_for_network_idle(driver)
                 
                 # Record end time
                 end_time = datetime.datetime.now()
                 end_time_str = end_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
                 
                 # Calculate refresh time
-                refresh_time_seconds = (end_time - start_time).total_seconds()
+                refresh_time_seconds = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 self.log(f"Chart #{index} refreshed in {refresh_time_seconds:.2f} seconds using F5 key")
                 
@@ -1004,17 +1578,16 @@ class SupersetPerformanceTester:
         
         try:
             # First navigate to the dashboard
-            dashboard_url = f"{self.base_url}/superset/dashboard/{dashboard_id}/"
+            dashboard_url = self.dashboard_url(dashboard_id)
             self.log(f"Navigating to dashboard for chart refresh test: {dashboard_url}")
             driver.get(dashboard_url)
             
             # Wait for dashboard to fully load
             self.log(f"Waiting for dashboard {dashboard_id} to load...")
-            time.sleep(5)
             
             # Wait for dashboard elements
             try:
-                WebDriverWait(driver, 60).until(
+                WebDriverWait(driver, 60, poll_frequency=WAIT_POLL_SECONDS).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
                 )
                 self.log("Dashboard element found")
@@ -1022,7 +1595,7 @@ class SupersetPerformanceTester:
                 self.log("WARNING: Could not detect dashboard elements, continuing anyway")
             
             # Additional wait for charts to render
-            time.sleep(5)
+            self.wait_for_network_idle(driver)
             
             # Find all chart elements
             charts = self.find_chart_elements(driver)
@@ -1067,6 +1640,21 @@ class SupersetPerformanceTester:
         self.log(f"Completed chart refresh test for dashboard {dashboard_id}: {len(all_results)} measurements collected")
         return all_results
     
+    def _append_sheet(self, workbook, sheet_name, df):
+        """
+        Stream a DataFrame into a new sheet of a write-only workbook
+        
+        Args:
+            workbook: openpyxl Workbook created with write_only=True
+            sheet_name: Name of the sheet to create
+            df: DataFrame to write, header row first
+        """
+        ws = workbook.create_sheet(title=sheet_name)
+        ws.append(list(df.columns))
+        # Empty cells instead of NaN, matching DataFrame.to_excel output
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+    
     def save_results_to_excel(self, all_scenario_results):
         """
         Save all test results to an Excel file with multiple sheets
@@ -1103,114 +1691,118 @@ class SupersetPerformanceTester:
             return
             
         try:
-            # Create a writer for Excel file
-            with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-                # Create a summary sheet
-                summary_data = []
-                
-                # Process each scenario's results
-                for scenario, results in all_scenario_results.items():
-                    if not results:
-                        self.log(f"DEBUG: Skipping scenario '{scenario}' - no results")
-                        continue
-                        
-                    self.log(f"DEBUG: Processing scenario '{scenario}' with {len(results)} results")
+            # Imported here so that loading the tester (e.g. at UI startup) doesn't pull in pandas/numpy
+            import pandas as pd
+            
+            # Write-only workbook streams rows to disk instead of keeping every cell in memory
+            workbook = Workbook(write_only=True)
+            # Create a summary sheet
+            summary_data = []
+            
+            # Process each scenario's results
+            for scenario, results in all_scenario_results.items():
+                if not results:
+                    self.log(f"DEBUG: Skipping scenario '{scenario}' - no results")
+                    continue
                     
-                    # Convert results to DataFrame
-                    df = pd.DataFrame(results)
-                    self.log(f"DEBUG: Created DataFrame with shape {df.shape}")
-                    self.log(f"DEBUG: DataFrame columns: {list(df.columns)}")
+                self.log(f"DEBUG: Processing scenario '{scenario}' with {len(results)} results")
+                
+                # Convert results to DataFrame
+                df = pd.DataFrame(results)
+                self.log(f"DEBUG: Created DataFrame with shape {df.shape}")
+                self.log(f"DEBUG: DataFrame columns: {list(df.columns)}")
+                
+                # Write detailed results to a sheet
+                sheet_name = f"{scenario} Details"
+                self.log(f"DEBUG: Writing to sheet '{sheet_name}'")
+                self._append_sheet(workbook, sheet_name, df)
+                
+                # For Scenario 5 (Individual Chart Refresh), create chart-specific summary
+                if scenario == 'Scenario 5' and 'Chart Index' in df.columns:
+                    self.log("DEBUG: Creating chart-specific summary for Scenario 5")
+                    # Calculate summary statistics per chart
+                    chart_summaries = []
+                    for chart_idx, chart_data in df.groupby('Chart Index'):
+                        summary = {
+                            'Dashboard ID': chart_data['Dashboard ID'].iloc[0],
+                            'Chart Index': chart_idx,
+                            'Number of Refreshes': len(chart_data),
+                            'Average Refresh Time (s)': chart_data['Refresh Time (seconds)'].mean(),
+                            'Min Refresh Time (s)': chart_data['Refresh Time (seconds)'].min(),
+                            'Max Refresh Time (s)': chart_data['Refresh Time (seconds)'].max(),
+                            'Std Dev Refresh Time (s)': chart_data['Refresh Time (seconds)'].std()
+                        }
+                        chart_summaries.append(summary)
                     
-                    # Write detailed results to a sheet
-                    sheet_name = f"{scenario} Details"
-                    self.log(f"DEBUG: Writing to sheet '{sheet_name}'")
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    # Create a chart summary sheet for this scenario
+                    if chart_summaries:
+                        chart_summary_df = pd.DataFrame(chart_summaries)
+                        chart_sheet_name = f"{scenario} Chart Summary"
+                        self.log(f"DEBUG: Writing chart summary to sheet '{chart_sheet_name}'")
+                        self._append_sheet(workbook, chart_sheet_name, chart_summary_df)
+                
+                # Calculate summary statistics per dashboard
+                dashboard_summaries = []
+                group_by_col = 'Dashboard ID'
+                if group_by_col in df.columns:
+                    self.log(f"DEBUG: Grouping by '{group_by_col}' for dashboard summaries")
+                    dashboard_groups = df.groupby(group_by_col)
+                    self.log(f"DEBUG: Found {len(dashboard_groups)} unique dashboards")
                     
-                    # For Scenario 5 (Individual Chart Refresh), create chart-specific summary
-                    if scenario == 'Scenario 5' and 'Chart Index' in df.columns:
-                        self.log("DEBUG: Creating chart-specific summary for Scenario 5")
-                        # Calculate summary statistics per chart
-                        chart_summaries = []
-                        for chart_idx, chart_data in df.groupby('Chart Index'):
-                            summary = {
-                                'Dashboard ID': chart_data['Dashboard ID'].iloc[0],
-                                'Chart Index': chart_idx,
-                                'Number of Refreshes': len(chart_data),
-                                'Average Refresh Time (s)': chart_data['Refresh Time (seconds)'].mean(),
-                                'Min Refresh Time (s)': chart_data['Refresh Time (seconds)'].min(),
-                                'Max Refresh Time (s)': chart_data['Refresh Time (seconds)'].max(),
-                                'Std Dev Refresh Time (s)': chart_data['Refresh Time (seconds)'].std()
-                            }
-                            chart_summaries.append(summary)
+                    for dashboard_id, dashboard_data in dashboard_groups:
+                        self.log(f"DEBUG: Processing dashboard '{dashboard_id}' with {len(dashboard_data)} measurements")
                         
-                        # Create a chart summary sheet for this scenario
-                        if chart_summaries:
-                            chart_summary_df = pd.DataFrame(chart_summaries)
-                            chart_sheet_name = f"{scenario} Chart Summary"
-                            self.log(f"DEBUG: Writing chart summary to sheet '{chart_sheet_name}'")
-                            chart_summary_df.to_excel(writer, sheet_name=chart_sheet_name, index=False)
-                    
-                    # Calculate summary statistics per dashboard
-                    dashboard_summaries = []
-                    group_by_col = 'Dashboard ID'
-                    if group_by_col in df.columns:
-                        self.log(f"DEBUG: Grouping by '{group_by_col}' for dashboard summaries")
-                        dashboard_groups = df.groupby(group_by_col)
-                        self.log(f"DEBUG: Found {len(dashboard_groups)} unique dashboards")
+                        # Determine which time column to use based on scenario
+                        if 'Refresh Time (seconds)' in df.columns:
+                            time_column = 'Refresh Time (seconds)'
+                        else:
+                            time_column = 'Load Time (seconds)'
                         
-                        for dashboard_id, dashboard_data in dashboard_groups:
-                            self.log(f"DEBUG: Processing dashboard '{dashboard_id}' with {len(dashboard_data)} measurements")
-                            
-                            # Determine which time column to use based on scenario
-                            if 'Refresh Time (seconds)' in df.columns:
-                                time_column = 'Refresh Time (seconds)'
-                            else:
-                                time_column = 'Load Time (seconds)'
-                            
-                            self.log(f"DEBUG: Using time column '{time_column}' for dashboard '{dashboard_id}'")
-                            
-                            summary = {
-                                'Scenario': scenario,
-                                'Dashboard ID': dashboard_id,
-                                'Number of Measurements': len(dashboard_data),
-                                f'Average {time_column}': dashboard_data[time_column].mean(),
-                                f'Min {time_column}': dashboard_data[time_column].min(),
-                                f'Max {time_column}': dashboard_data[time_column].max(),
-                                f'Std Dev {time_column}': dashboard_data[time_column].std()
-                            }
-                            
-                            # Add chart count if available
-                            if 'Chart Count' in dashboard_data.columns:
-                                # Use most frequent chart count in case there are variations
-                                chart_count = dashboard_data['Chart Count'].mode()[0]
-                                summary['Chart Count'] = chart_count
-                            elif 'Total Charts' in dashboard_data.columns:
-                                # For Scenario 5, use the Total Charts column
-                                chart_count = dashboard_data['Total Charts'].iloc[0]
-                                summary['Chart Count'] = chart_count
-                            
-                            dashboard_summaries.append(summary)
-                            summary_data.append(summary)
-                            
-                            self.log(f"DEBUG: Added summary for dashboard '{dashboard_id}': {len(dashboard_data)} measurements, avg time: {summary[f'Average {time_column}']:.2f}s")
+                        self.log(f"DEBUG: Using time column '{time_column}' for dashboard '{dashboard_id}'")
                         
-                        # Create a summary sheet for this scenario
-                        if dashboard_summaries:
-                            summary_df = pd.DataFrame(dashboard_summaries)
-                            summary_sheet_name = f"{scenario} Summary"
-                            self.log(f"DEBUG: Writing scenario summary to sheet '{summary_sheet_name}' with {len(dashboard_summaries)} rows")
-                            summary_df.to_excel(writer, sheet_name=summary_sheet_name, index=False)
-                    else:
-                        self.log(f"DEBUG: No '{group_by_col}' column found in DataFrame for scenario '{scenario}'")
-                
-                # Create an overall summary sheet
-                if summary_data:
-                    overall_summary_df = pd.DataFrame(summary_data)
-                    self.log(f"DEBUG: Writing overall summary with {len(summary_data)} rows")
-                    overall_summary_df.to_excel(writer, sheet_name="Overall Summary", index=False)
+                        summary = {
+                            'Scenario': scenario,
+                            'Dashboard ID': dashboard_id,
+                            'Number of Measurements': len(dashboard_data),
+                            f'Average {time_column}': dashboard_data[time_column].mean(),
+                            f'Min {time_column}': dashboard_data[time_column].min(),
+                            f'Max {time_column}': dashboard_data[time_column].max(),
+                            f'Std Dev {time_column}': dashboard_data[time_column].std()
+                        }
+                        
+                        # Add chart count if available
+                        if 'Chart Count' in dashboard_data.columns:
+                            # Use most frequent chart count in case there are variations
+                            chart_count = dashboard_data['Chart Count'].mode()[0]
+                            summary['Chart Count'] = chart_count
+                        elif 'Total Charts' in dashboard_data.columns:
+                            # For Scenario 5, use the Total Charts column
+                            chart_count = dashboard_data['Total Charts'].iloc[0]
+                            summary['Chart Count'] = chart_count
+                        
+                        dashboard_summaries.append(summary)
+                        summary_data.append(summary)
+                        
+                        self.log(f"DEBUG: Added summary for dashboard '{dashboard_id}': {len(dashboard_data)} measurements, avg time: {summary[f'Average {time_column}']:.2f}s")
+                    
+                    # Create a summary sheet for this scenario
+                    if dashboard_summaries:
+                        summary_df = pd.DataFrame(dashboard_summaries)
+                        summary_sheet_name = f"{scenario} Summary"
+                        self.log(f"DEBUG: Writing scenario summary to sheet '{summary_sheet_name}' with {len(dashboard_summaries)} rows")
+                        self._append_sheet(workbook, summary_sheet_name, summary_df)
                 else:
-                    self.log("DEBUG: No summary data to write to overall summary sheet")
+                    self.log(f"DEBUG: No '{group_by_col}' column found in DataFrame for scenario '{scenario}'")
+            
+            # Create an overall summary sheet
+            if summary_data:
+                overall_summary_df = pd.DataFrame(summary_data)
+                self.log(f"DEBUG: Writing overall summary with {len(summary_data)} rows")
+                self._append_sheet(workbook, "Overall Summary", overall_summary_df)
+            else:
+                self.log("DEBUG: No summary data to write to overall summary sheet")
             
+            workbook.save(self.output_file)
             self.log(f"Results successfully saved to {self.output_file}")
             
         except Exception as e:
@@ -1224,13 +1816,13 @@ class SupersetPerformanceTester:
             """Simplified loading detection specifically for health checks"""
             try:
                 # Simple wait for dashboard elements
-                WebDriverWait(driver, timeout).until(
+                WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_SECONDS).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, 
                         ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
                 )
                 
-                # Simple time-based wait for stability
-                time.sleep(5)
+                # Wait for the charts' requests to finish instead of a fixed pause
+                self.wait_for_network_idle(driver, timeout=timeout)
                 
                 # Basic check if page is loaded
                 ready_state = driver.execute_script("return document.readyState")
@@ -1248,8 +1840,8 @@ class SupersetPerformanceTester:
     def count_dashboard_charts_simple(self, driver):
         """Simplified chart counting specifically for health checks"""
         try:
-            # Wait a moment for charts to appear
-            time.sleep(2)
+            # Give the charts up to 2 s to appear
+            self.wait_for_network_idle(driver, timeout=2)
             
             # Try the most common selectors first
             chart_count = 0
@@ -1297,10 +1889,10 @@ class SupersetPerformanceTester:
         """Simplified dashboard load measurement for health checks only"""
         try:
             # CRITICAL: Use correct URL pattern for your instance
-            dashboard_url = f"{self.base_url}/superset/dashboard/{dashboard_id}/"
+            dashboard_url = self.dashboard_url(dashboard_id)
             self.log(f"Health check - navigating to: {dashboard_url}")
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             driver.get(dashboard_url)
             
             # Use simplified loading detection
@@ -1316,7 +1908,7 @@ class SupersetPerformanceTester:
                     'Issues': 'Dashboard failed to load within timeout'
                 }
             
-            load_time = time.time() - start_time
+            load_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Count charts with fallback
             chart_count = self.count_dashboard_charts_simple(driver)
@@ -7,7 +7,7 @@ import time
 from PyQt5.QtCore import QObject, pyqtSignal
 
 # Import your existing testing code
-from config import SUPERSET_CONFIG, DASHBOARD_CONFIG
+from config import SUPERSET_CONFIG, DASHBOARD_CONFIG, WAIT_POLL_SECONDS
 from superset_performance_tester import SupersetPerformanceTester
 from scenarios import Scenarios
 
@@ -32,7 +32,8 @@ class UIConnector(QObject):
             )
             
             if manual_login:
-                driver = self.tester.create_driver()
+                # The user has to see the browser to log in by hand
+                driver = self.tester.create_driver(headless=False)
                 self.tester.persistent_driver = driver
                 driver.get(base_url)
                 self.tester.log("Opened browser for manual login")
@@ -62,6 +63,7 @@ class UIConnector(QObject):
             
             if "/login/" not in current_url:
                 self.tester.log("Manual login appears successful")
+                self.tester.cache_session(self.tester.persistent_driver)
                 return True
             else:
                 self.tester.log("Still on login page after manual login attempt")
@@ -73,14 +75,11 @@ class UIConnector(QObject):
     def refresh_driver(self):
         """Refreshes the WebDriver if it's disconnected"""
         try:
-            if self.tester and self.tester.persistent_driver:
-                try:
-                    self.tester.persistent_driver.quit()
-                except:
-                    pass
-                self.tester.persistent_driver = None
+            # Keep a live browser (and its login) instead of relaunching Chrome
+            if self.tester.is_driver_alive(self.tester.persistent_driver):
+                return self.tester.persistent_driver
             
-            return self.tester.get_persistent_driver()
+            return self.tester.recover_driver_session()
         except Exception as e:
             self.test_error.emit(f"Failed to refresh WebDriver: {str(e)}")
             return None
@@ -136,7 +135,8 @@ class UIConnector(QObject):
                         
                         # Use ONLY FIRST selected dashboard for Scenario 1
                         results = scenarios_runner.scenario_1_single_dashboard(
-                            dashboard_ids[0], iterations
+                            dashboard_ids[0], iterations,
+                            warmup=DASHBOARD_CONFIG['scenario_1'].get('warmup', 0)
                         )
                         all_results['Scenario 1'] = results
                         
@@ -146,7 +146,8 @@ class UIConnector(QObject):
                         
                         # Use ALL selected dashboards for sequential testing
                         results = scenarios_runner.scenario_2_sequential_dashboards(
-                            dashboard_ids, iterations  # Use selected dashboards only
+                            dashboard_ids, iterations,  # Use selected dashboards only
+                            warmup=DASHBOARD_CONFIG['scenario_2'].get('warmup', 0)
                         )
                         all_results['Scenario 2'] = results
                         
@@ -157,7 +158,9 @@ class UIConnector(QObject):
                         # Use ALL selected dashboards for parallel testing
                         max_workers = min(len(dashboard_ids), 5)  # Don't exceed 5 parallel tabs
                         results = scenarios_runner.scenario_3_parallel_dashboards(
-                            dashboard_ids, iterations, max_workers  # Use selected dashboards only
+                            dashboard_ids, iterations, max_workers,  # Use selected dashboards only
+                            warmup=DASHBOARD_CONFIG['scenario_3'].get('warmup', 0),
+                            separate_browsers=DASHBOARD_CONFIG['scenario_3'].get('separate_browsers', False)
                         )
                         all_results['Scenario 3'] = results
                         
@@ -224,6 +227,12 @@ class UIConnector(QObject):
             
             self.progress_updated.emit(10, "Starting health checks...")
             
+            # Existence and chart counts come from the API, all dashboards at once
+            driver = self.tester.get_persistent_driver()
+            if driver and not self.tester.session_cookies:
+                self.tester.cache_session(driver)
+            probes = self.tester.probe_dashboards(dashboard_ids)
+            
             all_results = []
             total_dashboards = len(dashboard_ids)
             
@@ -231,6 +240,19 @@ class UIConnector(QObject):
                 progress = int(10 + ((i / total_dashboards) * 80))
                 self.progress_updated.emit(progress, f"Checking dashboard {dashboard_id} ({i+1}/{total_dashboards})...")
                 
+                probe = probes.get(dashboard_id, {})
+                if probe.get('status_code') == 404:
+                    self.tester.log(f"❌ Dashboard {dashboard_id} does not exist")
+                    all_results.append({
+                        'Dashboard ID': dashboard_id,
+                        'Status': 'Critical',
+                        'Charts Loaded': 0,
+                        'Total Charts': 0,
+                        'Load Time (s)': 0,
+                        'Issues': 'Dashboard not found'
+                    })
+                    continue
+                
                 try:
                     # Get driver and ensure it's working
                     driver = self.tester.get_persistent_driver()
@@ -284,10 +306,10 @@ class UIConnector(QObject):
     def _check_dashboard_health(self, driver, dashboard_id):
         """Check the health of a specific dashboard"""
         try:
-            dashboard_url = f"{self.tester.base_url}/superset/dashboard/{dashboard_id}/"
+            dashboard_url = self.tester.dashboard_url(dashboard_id)
             self.tester.log(f"🔍 Checking health of dashboard: {dashboard_url}")
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             driver.get(dashboard_url)
             
             # Wait for dashboard to load (with timeout)
@@ -296,11 +318,11 @@ class UIConnector(QObject):
                 from selenium.webdriver.support import expected_conditions as EC
                 from selenium.webdriver.common.by import By
                 
-                WebDriverWait(driver, 30).until(
+                WebDriverWait(driver, 30, poll_frequency=WAIT_POLL_SECONDS).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".dashboard-grid, .dashboard, .chart-container, .dashboard-component-chart"))
                 )
             except Exception as load_error:
-                load_time = time.time() - start_time
+                load_time = (time.perf_counter_ns() - start_ns) / 1e9
                 return {
                     'Dashboard ID': dashboard_id,
                     'Status': 'Critical',
@@ -313,7 +335,7 @@ class UIConnector(QObject):
             # Wait for loading indicators to disappear
             self.tester.wait_for_loading_indicators_to_disappear(driver, 30)
             
-            load_time = time.time() - start_time
+            load_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Count charts and check their status
             total_charts = self.tester.count_dashboard_charts(driver)